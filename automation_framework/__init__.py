@@ -3,15 +3,39 @@ Automation Framework - Framework padrão para automações em Python
 Versão: 1.0.0
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "1.0.0"
 __author__ = "Automation Team"
 
-from automation_framework.core.logger import Logger
-from automation_framework.web.driver_manager import DriverManager
-from automation_framework.core.config import ConfigManager
+# API pública carregada sob demanda: jobs de console/dados não importam o Selenium
+_LAZY_ATTRIBUTES = {
+    'Logger': 'automation_framework.core.logger',
+    'DriverManager': 'automation_framework.web.driver_manager',
+    'ConfigManager': 'automation_framework.core.config',
+}
+
+if TYPE_CHECKING:
+    from automation_framework.core.logger import Logger
+    from automation_framework.web.driver_manager import DriverManager
+    from automation_framework.core.config import ConfigManager
 
 __all__ = [
     'Logger',
     'DriverManager',
     'ConfigManager',
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,256 @@
+"""
+Execução assíncrona de comandos console (asyncio)
+Permite disparar muitos comandos curtos em paralelo em um único event loop,
+sem uma thread bloqueada por comando
+"""
+
+import asyncio
+import codecs
+import os
+import signal
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Deque, Dict, Iterable, Optional, Tuple
+
+from automation_framework.console.console_manager import Command, child_env, format_command
+from automation_framework.core.config import ConfigManager
+from automation_framework.core.exceptions import ConsoleAutomationException
+from automation_framework.core.logger import Logger
+
+
+@dataclass
+class CommandResult:
+    """Resultado de um comando executado por `run_many`"""
+    index: int
+    command: Command
+    stdout: str
+    stderr: str
+    return_code: Optional[int]
+    duration: float
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Se o comando terminou com código 0"""
+        return self.error is None and self.return_code == 0
+
+
+class AsyncConsoleProcess:
+    """
+    Contraparte assíncrona do ConsoleProcess
+
+    Cada comando roda em um grupo de processos próprio (fora do Windows): no
+    timeout o grupo inteiro é encerrado, incluindo filhos do shell.
+    """
+
+    def __init__(self, working_dir: Optional[str] = None):
+        self.working_dir = working_dir or os.getcwd()
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        self.config = ConfigManager().get_console_config()
+        # Buffers circulares compartilhados pelos comandos desta instância
+        self.output: Deque[str] = deque(maxlen=self.config.max_output_lines)
+        self.error_output: Deque[str] = deque(maxlen=self.config.max_output_lines)
+        self.last_return_code: Optional[int] = None
+        # Saída completa do último execute_command
+        self.last_stdout = ""
+        self.last_stderr = ""
+
+    async def _spawn(self, command: Command, env: Optional[Dict[str, str]] = None) -> asyncio.subprocess.Process:
+        """Inicia o comando: strings via shell, sequências argv sem shell"""
+        options = dict(
+            cwd=self.working_dir,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=child_env(env),
+            limit=self.config.max_line_length,
+            start_new_session=os.name != 'nt',
+        )
+        try:
+            if isinstance(command, str):
+                return await asyncio.create_subprocess_shell(command, **options)
+            return await asyncio.create_subprocess_exec(*command, **options)
+        except Exception as e:
+            self.logger.error(f"Erro ao executar comando: {str(e)}")
+            raise ConsoleAutomationException(f"Erro ao executar comando: {str(e)}")
+
+    @staticmethod
+    def _kill(process: asyncio.subprocess.Process) -> None:
+        """Encerra o processo e seus filhos"""
+        if process.returncode is not None:
+            return
+        try:
+            if os.name == 'nt':
+                process.kill()
+            else:
+                os.killpg(process.pid, signal.SIGKILL)
+        except OSError:
+            pass
+
+    def _notify(self, callback: Optional[Callable[[str], None]], line: str, stream: str) -> None:
+        """Chama o callback de linha; erros são registrados sem interromper o streaming"""
+        if callback is None:
+            return
+        try:
+            callback(line)
+        except Exception as e:
+            self.logger.warning(f"Erro no callback de {stream}: {str(e)}")
+
+    def _decode(self, data: bytes) -> str:
+        return data.decode(self.config.encoding, errors=self.config.encoding_errors)
+
+    async def execute_command(self, command: Command, timeout: Optional[float] = None,
+                              capture_output: bool = True,
+                              env: Optional[Dict[str, str]] = None) -> Tuple[str, str, int]:
+        """
+        Executa comando no console
+
+        Args:
+            command: Comando a executar (string via shell ou lista argv, sem shell)
+            timeout: Timeout em segundos (encerra o grupo de processos)
+            capture_output: Se deve guardar a saída em `output`/`error_output`
+            env: Variáveis de ambiente adicionais, só para o processo filho
+
+        Returns:
+            Tupla (stdout, stderr, return_code)
+        """
+        timeout = timeout or self.config.timeout
+        self.logger.debug(f"Executando comando: {format_command(command)}")
+        process = await self._spawn(command, env)
+        try:
+            stdout_data, stderr_data = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError:
+            self._kill(process)
+            await process.wait()
+            self.logger.error(f"Timeout ao executar comando: {format_command(command)}")
+            raise ConsoleAutomationException(f"Timeout ao executar comando: {format_command(command)}")
+        except asyncio.CancelledError:
+            self._kill(process)
+            raise
+
+        stdout = self._decode(stdout_data).strip()
+        stderr = self._decode(stderr_data).strip()
+        if capture_output:
+            self.output.extend(stdout.splitlines())
+            self.error_output.extend(stderr.splitlines())
+        self.last_stdout, self.last_stderr = stdout, stderr
+        self.last_return_code = process.returncode
+        if process.returncode != 0 and stderr:
+            self.logger.warning(f"Erro na execução: {stderr}")
+        return stdout, stderr, process.returncode
+
+    async def _read_lines(self, reader: asyncio.StreamReader) -> AsyncIterator[str]:
+        """Linhas do pipe, em pedaços de até `max_line_length` bytes"""
+        decoder = codecs.getincrementaldecoder(self.config.encoding)(
+            errors=self.config.encoding_errors
+        )
+        while True:
+            try:
+                data = await reader.readuntil(b'\n')
+            except asyncio.IncompleteReadError as e:
+                data = e.partial
+                if not data:
+                    return
+            except asyncio.LimitOverrunError as e:
+                # Linha maior que o limite: entrega um pedaço e continua a mesma linha
+                data = await reader.readexactly(min(e.consumed, self.config.max_line_length))
+            yield decoder.decode(data).rstrip('\r\n')
+
+    async def stream_command(self, command: Command, timeout: Optional[float] = None,
+                             on_line: Optional[Callable[[str], None]] = None,
+                             on_error_line: Optional[Callable[[str], None]] = None,
+                             env: Optional[Dict[str, str]] = None) -> AsyncIterator[str]:
+        """
+        Executa comando entregando as linhas de stdout à medida que são produzidas
+
+        stderr é lido em paralelo (buffer `error_output` e `on_error_line`). Exceções dos
+        callbacks são registradas no log sem interromper o comando. O código
+        de saída fica em `last_return_code` ao final da iteração.
+
+        Exemplo:
+            async for line in console.stream_command("tail -n 1000 app.log"):
+                ...
+        """
+        timeout = timeout or self.config.timeout
+        self.last_return_code = None
+        process = await self._spawn(command, env)
+        expired = []
+
+        def expire() -> None:
+            expired.append(True)
+            self._kill(process)
+
+        watchdog = asyncio.get_running_loop().call_later(timeout, expire)
+
+        async def read_errors() -> None:
+            async for line in self._read_lines(process.stderr):
+                self.error_output.append(line)
+                self._notify(on_error_line, line, 'stderr')
+
+        error_reader = asyncio.ensure_future(read_errors())
+        try:
+            async for line in self._read_lines(process.stdout):
+                self.output.append(line)
+                self._notify(on_line, line, 'stdout')
+                yield line
+            await error_reader
+            self.last_return_code = await process.wait()
+        finally:
+            watchdog.cancel()
+            self._kill(process)
+            if not error_reader.done():
+                error_reader.cancel()
+
+        if expired:
+            self.logger.error(f"Timeout ao executar comando: {format_command(command)}")
+            raise ConsoleAutomationException(f"Timeout ao executar comando: {format_command(command)}")
+
+
+def run_many(commands: Iterable[Command], concurrency: int = 8, timeout: Optional[float] = None,
+             working_dir: Optional[str] = None) -> AsyncIterator[CommandResult]:
+    """
+    Executa vários comandos com no máximo `concurrency` simultâneos
+
+    Comandos em lista argv rodam sem shell (um processo a menos por comando).
+
+    Falhas (timeout, erro ao iniciar) ficam em `CommandResult.error` sem interromper
+    os demais. Interromper a iteração cancela os comandos pendentes.
+
+    Yields:
+        CommandResult na ordem de conclusão (`index` indica a posição em `commands`)
+
+    Raises:
+        ValueError: Se concurrency for menor que 1
+
+    Exemplo:
+        async for result in run_many(checks, concurrency=16, timeout=30):
+            if not result.ok:
+                print(result.command, result.stderr)
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency deve ser >= 1 (recebido: {concurrency})")
+    return _run_many(commands, concurrency, timeout, working_dir)
+
+
+async def _run_many(commands: Iterable[Command], concurrency: int, timeout: Optional[float],
+                    working_dir: Optional[str]) -> AsyncIterator[CommandResult]:
+    console = AsyncConsoleProcess(working_dir)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(index: int, command: Command) -> CommandResult:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                stdout, stderr, code = await console.execute_command(command, timeout, capture_output=False)
+                return CommandResult(index, command, stdout, stderr, code, time.perf_counter() - started)
+            except ConsoleAutomationException as e:
+                return CommandResult(index, command, '', '', None, time.perf_counter() - started, str(e))
+
+    tasks = [asyncio.ensure_future(run(index, command)) for index, command in enumerate(commands)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
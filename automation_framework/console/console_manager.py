@@ -3,9 +3,11 @@ Gerenciador de processos console e aplicações CLI
 Suporta execução de comandos, captura de saída e interação
 """
 
+import shlex
 import subprocess
 import threading
-from typing import Optional, List, Tuple
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Deque, Dict, IO, Iterator, Optional, List, Sequence, Tuple, Union
 from pathlib import Path
 import os
 import signal
@@ -14,6 +16,68 @@ from automation_framework.core.logger import Logger
 from automation_framework.core.config import ConfigManager
 from automation_framework.core.exceptions import ConsoleAutomationException
 
+if TYPE_CHECKING:
+    from automation_framework.console.expect import InteractiveProcess
+
+
+# Comando: string (executada pelo shell) ou sequência argv (executada sem shell)
+Command = Union[str, Sequence[str]]
+
+
+def format_command(command: Command) -> str:
+    """Representação do comando para logs e mensagens (argv com as aspas da plataforma)"""
+    if isinstance(command, str):
+        return command
+    return subprocess.list2cmdline(command) if os.name == 'nt' else shlex.join(command)
+
+
+def split_command(command: str, posix: bool = os.name != 'nt') -> List[str]:
+    """
+    Divide uma linha de comando em argv
+
+    No POSIX segue as regras do shell (shlex). No Windows segue as regras do CRT:
+    só aspas duplas agrupam e elas não fazem parte do argumento, então
+    `"C:\\Program Files\\app.exe" -q` vira `['C:\\Program Files\\app.exe', '-q']`
+    (barras invertidas são literais; aspas escapadas não são tratadas).
+    """
+    if posix:
+        return shlex.split(command)
+    argv: List[str] = []
+    current: List[str] = []
+    quoted = False
+    started = False
+    for char in command:
+        if char == '"':
+            quoted = not quoted
+            started = True
+        elif char in ' \t' and not quoted:
+            if started:
+                argv.append(''.join(current))
+                current, started = [], False
+        else:
+            current.append(char)
+            started = True
+    if started:
+        argv.append(''.join(current))
+    return argv
+
+
+def child_env(env: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+    """Ambiente do processo filho: o do processo atual com `env` sobreposto (sem alterar os.environ)"""
+    if not env:
+        return None
+    return {**os.environ, **env}
+
+
+def spawn_args(command: Command, env: Optional[Dict[str, str]] = None) -> dict:
+    """Argumentos de subprocess para o comando: shell só para strings, argv direto para sequências"""
+    shell = isinstance(command, str)
+    return {
+        'args': command if shell else list(command),
+        'shell': shell,
+        'env': child_env(env),
+    }
+
 
 class ConsoleProcess:
     """
@@ -22,21 +86,28 @@ class ConsoleProcess:
 
     def __init__(self, working_dir: Optional[str] = None):
         self.process: Optional[subprocess.Popen] = None
-        self.output: List[str] = []
-        self.error_output: List[str] = []
         self.working_dir = working_dir or os.getcwd()
         self.logger = Logger.get_logger(self.__class__.__name__)
         self.config = ConfigManager().get_console_config()
+        # Buffers circulares: guardam só as linhas mais recentes (memória constante)
+        self.output: Deque[str] = deque(maxlen=self.config.max_output_lines)
+        self.error_output: Deque[str] = deque(maxlen=self.config.max_output_lines)
         self.is_running = False
+        self.last_return_code: Optional[int] = None
+        # Saída completa do último execute_command (no streaming: as linhas do comando ainda no buffer)
+        self.last_stdout = ""
+        self.last_stderr = ""
 
-    def execute_command(self, command: str, timeout: Optional[int] = None, capture_output: bool = True) -> Tuple[str, str, int]:
+    def execute_command(self, command: Command, timeout: Optional[int] = None, capture_output: bool = True,
+                        env: Optional[Dict[str, str]] = None) -> Tuple[str, str, int]:
         """
         Executa comando no console
 
         Args:
-            command: Comando a executar
+            command: Comando a executar (string via shell ou lista argv, sem shell)
             timeout: Timeout em segundos
             capture_output: Se deve capturar saída
+            env: Variáveis de ambiente adicionais, só para o processo filho
 
         Returns:
             Tupla (stdout, stderr, return_code)
@@ -44,17 +115,16 @@ class ConsoleProcess:
         timeout = timeout or self.config.timeout
 
         try:
-            self.logger.info(f"Executando comando: {command}")
+            self.logger.info(f"Executando comando: {format_command(command)}")
 
             result = subprocess.run(
-                command,
+                **spawn_args(command, env),
                 cwd=self.working_dir,
-                shell=True,
                 capture_output=capture_output,
                 timeout=timeout,
                 text=True,
                 encoding=self.config.encoding,
-                errors=getattr(self.config, 'encoding_errors', 'replace')
+                errors=self.config.encoding_errors
             )
 
             # result.stdout / result.stderr podem ser None em alguns ambientes;
@@ -63,9 +133,9 @@ class ConsoleProcess:
             stderr = (result.stderr or "").strip()
 
             if capture_output:
-                self.output.append(stdout)
-                if stderr:
-                    self.error_output.append(stderr)
+                self.output.extend(stdout.splitlines())
+                self.error_output.extend(stderr.splitlines())
+            self.last_stdout, self.last_stderr = stdout, stderr
 
             self.logger.debug(f"Comando executado com código de saída: {result.returncode}")
 
@@ -75,32 +145,188 @@ class ConsoleProcess:
             return stdout, stderr, result.returncode
 
         except subprocess.TimeoutExpired:
-            self.logger.error(f"Timeout ao executar comando: {command}")
-            raise ConsoleAutomationException(f"Timeout ao executar comando: {command}")
+            self.logger.error(f"Timeout ao executar comando: {format_command(command)}")
+            raise ConsoleAutomationException(f"Timeout ao executar comando: {format_command(command)}")
         except Exception as e:
             self.logger.error(f"Erro ao executar comando: {str(e)}")
             raise ConsoleAutomationException(f"Erro ao executar comando: {str(e)}")
 
-    def start_process(self, command: str) -> None:
+    def stream_command(self, command: Command, timeout: Optional[int] = None,
+                       on_line: Optional[Callable[[str], None]] = None,
+                       on_error_line: Optional[Callable[[str], None]] = None,
+                       tee_path: Optional[str] = None,
+                       env: Optional[Dict[str, str]] = None) -> Iterator[str]:
+        """
+        Executa comando entregando a saída à medida que é produzida
+
+        A memória usada não depende do volume de saída: linhas ficam apenas nos
+        buffers circulares (`output`/`error_output`) e linhas maiores que
+        `max_line_length` são entregues em pedaços. O código de saída fica em
+        `last_return_code` ao final da iteração.
+
+        Args:
+            command: Comando a executar (string via shell ou lista argv, sem shell)
+            timeout: Tempo máximo de execução em segundos (o processo é encerrado)
+            on_line: Chamado para cada linha de stdout
+            on_error_line: Chamado para cada linha de stderr (lida em thread própria)
+                (exceções dos callbacks são registradas no log sem interromper o comando)
+            tee_path: Arquivo que recebe uma cópia de stdout e stderr
+            env: Variáveis de ambiente adicionais, só para o processo filho
+
+        Yields:
+            Linhas de stdout (sem a quebra de linha)
+
+        Exemplo:
+            for line in process.stream_command("mvn test", on_error_line=alertar, tee_path="build.log"):
+                if "BUILD FAILURE" in line:
+                    break
+        """
+        timeout = timeout or self.config.timeout
+        self.logger.info(f"Executando comando (streaming): {format_command(command)}")
+        tee = None
+        try:
+            # Aberto antes do processo: uma falha aqui não deixa o filho órfão
+            if tee_path:
+                tee = open(tee_path, 'a', encoding=self.config.encoding)
+            process = subprocess.Popen(
+                **spawn_args(command, env),
+                cwd=self.working_dir,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding=self.config.encoding,
+                errors=self.config.encoding_errors,
+                bufsize=1,
+                start_new_session=os.name != 'nt'
+            )
+        except Exception as e:
+            if tee is not None:
+                tee.close()
+            self.logger.error(f"Erro ao executar comando: {str(e)}")
+            raise ConsoleAutomationException(f"Erro ao executar comando: {str(e)}")
+
+        self.process = process
+        self.is_running = True
+        self.last_return_code = None
+        counts = {'out': 0, 'err': 0}
+        tee_lock = threading.Lock()
+        timed_out = threading.Event()
+
+        def write_tee(line: str) -> None:
+            if tee is not None:
+                with tee_lock:
+                    tee.write(line + '\n')
+
+        def read_errors() -> None:
+            for line in self._read_lines(process.stderr):
+                self.error_output.append(line)
+                counts['err'] += 1
+                write_tee(line)
+                self._notify(on_error_line, line, 'stderr')
+
+        def expire() -> None:
+            timed_out.set()
+            self._kill(process)
+
+        error_reader = threading.Thread(target=read_errors, daemon=True)
+        error_reader.start()
+        watchdog = threading.Timer(timeout, expire)
+        watchdog.daemon = True
+        watchdog.start()
+        try:
+            for line in self._read_lines(process.stdout):
+                self.output.append(line)
+                counts['out'] += 1
+                write_tee(line)
+                self._notify(on_line, line, 'stdout')
+                yield line
+            self.last_return_code = process.wait()
+        finally:
+            watchdog.cancel()
+            if process.poll() is None:
+                # Iteração interrompida pelo consumidor ou erro no callback
+                self._kill(process)
+            error_reader.join(timeout=5)
+            process.stdout.close()
+            process.stderr.close()
+            if tee is not None:
+                tee.close()
+            self.is_running = False
+            self.last_stdout = self._tail(self.output, counts['out'])
+            self.last_stderr = self._tail(self.error_output, counts['err'])
+
+        if timed_out.is_set():
+            self.logger.error(f"Timeout ao executar comando: {format_command(command)}")
+            raise ConsoleAutomationException(f"Timeout ao executar comando: {format_command(command)}")
+        self.logger.debug(f"Comando executado com código de saída: {self.last_return_code}")
+
+    def execute_streaming(self, command: Command, timeout: Optional[int] = None,
+                          on_line: Optional[Callable[[str], None]] = None,
+                          on_error_line: Optional[Callable[[str], None]] = None,
+                          tee_path: Optional[str] = None,
+                          env: Optional[Dict[str, str]] = None) -> int:
+        """
+        Executa comando em modo streaming até o fim (saída entregue aos callbacks/tee)
+
+        Returns:
+            Código de saída
+        """
+        for _ in self.stream_command(command, timeout, on_line, on_error_line, tee_path, env):
+            pass
+        return self.last_return_code
+
+    def _read_lines(self, stream: IO[str]) -> Iterator[str]:
+        """Linhas do pipe, em pedaços de até `max_line_length` caracteres"""
+        max_length = self.config.max_line_length
+        for chunk in iter(lambda: stream.readline(max_length), ''):
+            yield chunk[:-1] if chunk.endswith('\n') else chunk
+
+    def _notify(self, callback: Optional[Callable[[str], None]], line: str, stream: str) -> None:
+        """Chama o callback de linha; erros são registrados sem interromper o streaming"""
+        if callback is None:
+            return
+        try:
+            callback(line)
+        except Exception as e:
+            self.logger.warning(f"Erro no callback de {stream}: {str(e)}")
+
+    @staticmethod
+    def _tail(buffer: Deque[str], count: int) -> str:
+        """Últimas `count` linhas do buffer (limitadas ao que ainda está nele)"""
+        count = min(count, len(buffer))
+        return '\n'.join(list(buffer)[len(buffer) - count:]) if count else ""
+
+    @staticmethod
+    def _kill(process: subprocess.Popen) -> None:
+        """Encerra o processo e seus filhos (grupo próprio fora do Windows), liberando os pipes"""
+        try:
+            if os.name == 'nt':
+                process.kill()
+            else:
+                os.killpg(process.pid, signal.SIGKILL)
+        except OSError:
+            pass
+
+    def start_process(self, command: Command, env: Optional[Dict[str, str]] = None) -> None:
         """
         Inicia processo interativo
 
         Args:
-            command: Comando a executar
+            command: Comando a executar (string via shell ou lista argv, sem shell)
+            env: Variáveis de ambiente adicionais, só para o processo filho
         """
         try:
-            self.logger.info(f"Iniciando processo: {command}")
+            self.logger.info(f"Iniciando processo: {format_command(command)}")
 
             self.process = subprocess.Popen(
-                command,
+                **spawn_args(command, env),
                 cwd=self.working_dir,
-                shell=True,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
                 encoding=self.config.encoding,
-                errors=getattr(self.config, 'encoding_errors', 'replace'),
+                errors=self.config.encoding_errors,
                 bufsize=1
             )
 
@@ -111,6 +337,17 @@ class ConsoleProcess:
             self.logger.error(f"Erro ao iniciar processo: {str(e)}")
             raise ConsoleAutomationException(f"Erro ao iniciar processo: {str(e)}")
 
+    def start_interactive(self, command: Command, env: Optional[Dict[str, str]] = None,
+                          timeout: Optional[float] = None) -> 'InteractiveProcess':
+        """
+        Inicia processo para interação contínua (`expect`/`send_line`)
+
+        Diferente de `start_process` + `read_output`, o stdin não é fechado entre as
+        trocas: o mesmo processo atende quantas interações forem necessárias.
+        """
+        from automation_framework.console.expect import InteractiveProcess
+        return InteractiveProcess(command, self.working_dir, env, timeout)
+
     def write_input(self, input_text: str) -> None:
         """
         Escreve entrada para processo
@@ -169,17 +406,18 @@ class ConsoleProcess:
                 self.logger.warning(f"Erro ao terminar processo: {str(e)}")
 
     def get_last_output(self) -> str:
-        """Obtém última linha de saída"""
-        return self.output[-1] if self.output else ""
+        """Obtém a saída (stdout) do último comando executado"""
+        return self.last_stdout
 
     def get_all_output(self) -> str:
-        """Obtém toda saída capturada"""
+        """Obtém a saída capturada (as `max_output_lines` linhas mais recentes)"""
         return '\n'.join(self.output)
 
     def clear_output(self) -> None:
         """Limpa histórico de saída"""
         self.output.clear()
         self.error_output.clear()
+        self.last_stdout = self.last_stderr = ""
 
 
 class JavaApplicationManager:
@@ -207,8 +445,7 @@ class JavaApplicationManager:
         if not Path(jar_path).exists():
             raise FileNotFoundError(f"Arquivo JAR não encontrado: {jar_path}")
 
-        args_str = ' '.join(args) if args else ''
-        command = f"{self.java_home} -jar {jar_path} {args_str}".strip()
+        command = [self.java_home, '-jar', str(jar_path), *(args or [])]
 
         process = ConsoleProcess()
         return process.execute_command(command, timeout)
@@ -225,8 +462,7 @@ class JavaApplicationManager:
         Returns:
             Tupla (stdout, stderr, return_code)
         """
-        args_str = ' '.join(args) if args else ''
-        command = f"{self.java_home} -cp {classpath} {class_name} {args_str}".strip()
+        command = [self.java_home, '-cp', classpath, class_name, *(args or [])]
 
         process = ConsoleProcess()
         return process.execute_command(command)
@@ -241,19 +477,22 @@ class JavaApplicationManager:
 class CommandBuilder:
     """
     Builder para construir comandos complexos
+
+    `execute` roda o argv (`build_argv`) sem shell e passa `env_vars` apenas ao
+    processo filho. Para comandos que dependem do shell (pipes, redirecionamentos,
+    comandos internos como `dir`), use `build()` com `ConsoleProcess.execute_command`.
     """
 
     def __init__(self, base_command: str):
         self.command = base_command
         self.args: List[str] = []
-        self.env_vars: dict = {}
+        self.env_vars: Dict[str, str] = {}
 
     def add_argument(self, key: str, value: Optional[str] = None) -> 'CommandBuilder':
-        """Adiciona argumento ao comando"""
+        """Adiciona argumento ao comando (chave e valor são argumentos separados no argv)"""
+        self.args.append(key)
         if value:
-            self.args.append(f'{key} {value}')
-        else:
-            self.args.append(key)
+            self.args.append(value)
         return self
 
     def add_flag(self, flag: str) -> 'CommandBuilder':
@@ -267,23 +506,20 @@ class CommandBuilder:
         return self
 
     def build(self) -> str:
-        """Constrói comando final"""
+        """Constrói comando final (string para o shell, argumentos com aspas quando necessário)"""
         full_command = self.command
         if self.args:
-            full_command += ' ' + ' '.join(self.args)
+            full_command += ' ' + format_command(self.args)
         return full_command
 
+    def build_argv(self) -> List[str]:
+        """Constrói o argv do comando (comando base dividido como no shell, argumentos literais)"""
+        return split_command(self.command) + self.args
+
     def execute(self, timeout: Optional[int] = None) -> Tuple[str, str, int]:
-        """Executa comando construído"""
+        """Executa comando construído sem shell, com `env_vars` só no processo filho"""
         process = ConsoleProcess()
-        command = self.build()
-
-        # Adicionar variáveis de ambiente
-        if self.env_vars:
-            for key, value in self.env_vars.items():
-                os.environ[key] = value
-
-        return process.execute_command(command, timeout)
+        return process.execute_command(self.build_argv(), timeout, env=self.env_vars)
 
     def __str__(self) -> str:
         return self.build()
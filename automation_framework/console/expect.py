@@ -0,0 +1,313 @@
+"""
+Interação contínua com processos console (estilo expect)
+Envia entradas e aguarda padrões na saída sem fechar o stdin nem esperar o
+processo terminar: um mesmo processo (CLI interativa, REPL) atende milhares de
+trocas sem ser recriado.
+"""
+
+import codecs
+import os
+import queue
+import re
+import selectors
+import signal
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Pattern, Sequence, Tuple, Union
+
+from automation_framework.console.console_manager import Command, format_command, spawn_args
+from automation_framework.core.config import ConfigManager
+from automation_framework.core.exceptions import ConsoleAutomationException, TimeoutException
+from automation_framework.core.logger import Logger
+
+
+class _Sentinel:
+    """Padrão especial aceito por `expect`"""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+# Fim da saída do processo: incluído nos padrões, `expect` o devolve em vez de lançar exceção
+EOF = _Sentinel('EOF')
+
+# Tempo esgotado: incluído nos padrões, `expect` o devolve em vez de lançar TimeoutException
+TIMEOUT = _Sentinel('TIMEOUT')
+
+ExpectPattern = Union[str, Pattern[str], _Sentinel]
+
+
+@dataclass
+class ExpectMatch:
+    """Resultado de `expect`"""
+    index: int  # posição do padrão na lista informada
+    pattern: ExpectPattern
+    before: str  # texto recebido antes da correspondência
+    after: str  # texto correspondido (vazio para EOF/TIMEOUT)
+    match: Optional[re.Match] = None
+
+    def group(self, *groups: Union[int, str]) -> Any:
+        """Grupos da expressão regular correspondida"""
+        if self.match is None:
+            raise ConsoleAutomationException(f"Sem correspondência para {self.pattern!r}")
+        return self.match.group(*groups)
+
+
+class InteractiveProcess:
+    """
+    Processo console controlado por padrões na saída
+
+    stderr é combinado com stdout. A leitura é não bloqueante (selectors no POSIX,
+    thread leitora no Windows) e a decodificação é incremental, então caracteres
+    multibyte divididos entre leituras são preservados.
+
+    Exemplo:
+        with InteractiveProcess(["python", "-i", "-u"]) as repl:
+            repl.expect(">>> ")
+            repl.send_line("1 + 1")
+            repl.expect(r"(\\d+)\\s+>>> ").group(1)   # '2'
+    """
+
+    # Tamanho máximo de cada leitura do pipe
+    read_size = 65536
+
+    def __init__(self, command: Command, working_dir: Optional[str] = None,
+                 env: Optional[Dict[str, str]] = None, timeout: Optional[float] = None,
+                 search_window: Optional[int] = None, linesep: str = '\n'):
+        """
+        Args:
+            command: Comando (string via shell ou lista argv, sem shell)
+            working_dir: Diretório de trabalho
+            env: Variáveis de ambiente adicionais, só para o processo filho
+            timeout: Timeout padrão de `expect` em segundos (padrão: console.timeout)
+            search_window: Se informado, só os últimos N caracteres do buffer são
+                pesquisados (saídas longas sem correspondência não ficam quadráticas)
+            linesep: Terminador usado por `send_line`
+        """
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        self.config = ConfigManager().get_console_config()
+        self.command = command
+        self.timeout = timeout or self.config.timeout
+        self.search_window = search_window
+        self.linesep = linesep
+        self.last_match: Optional[ExpectMatch] = None
+        self._buffer = ''
+        self._eof = False
+        self._decoder = codecs.getincrementaldecoder(self.config.encoding)(errors=self.config.encoding_errors)
+
+        self.logger.info(f"Iniciando processo interativo: {format_command(command)}")
+        try:
+            self.process = subprocess.Popen(
+                **spawn_args(command, env),
+                cwd=working_dir or os.getcwd(),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=0,
+                start_new_session=os.name != 'nt'
+            )
+        except Exception as e:
+            self.logger.error(f"Erro ao iniciar processo: {str(e)}")
+            raise ConsoleAutomationException(f"Erro ao iniciar processo: {str(e)}")
+
+        if os.name == 'nt':
+            self._chunks: 'queue.Queue[bytes]' = queue.Queue()
+            self._reader = threading.Thread(target=self._pump, daemon=True)
+            self._reader.start()
+        else:
+            self._fd = self.process.stdout.fileno()
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self._fd, selectors.EVENT_READ)
+
+    def __enter__(self) -> 'InteractiveProcess':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    # Leitura
+
+    def _pump(self) -> None:
+        """Thread leitora (Windows): repassa os pedaços lidos para a fila"""
+        for chunk in iter(lambda: self.process.stdout.read(self.read_size), b''):
+            self._chunks.put(chunk)
+        self._chunks.put(b'')
+
+    def _read_chunk(self, timeout: float) -> Optional[bytes]:
+        """Próximo pedaço da saída; b'' no fim da saída, None se nada chegou no tempo"""
+        if os.name == 'nt':
+            try:
+                return self._chunks.get(timeout=timeout)
+            except queue.Empty:
+                return None
+        if not self._selector.select(timeout):
+            return None
+        return os.read(self._fd, self.read_size)
+
+    def _fill(self, timeout: float) -> bool:
+        """Acrescenta o próximo pedaço ao buffer; False se nada chegou no tempo"""
+        chunk = self._read_chunk(timeout)
+        if chunk is None:
+            return False
+        if chunk:
+            self._buffer += self._decoder.decode(chunk)
+        else:
+            self._eof = True
+            self._buffer += self._decoder.decode(b'', final=True)
+        return True
+
+    # Correspondência
+
+    @staticmethod
+    def _compile(patterns: Union[ExpectPattern, Sequence[ExpectPattern]]) -> List[Tuple[ExpectPattern, Any]]:
+        if isinstance(patterns, (str, _Sentinel, re.Pattern)):
+            patterns = [patterns]
+        compiled = []
+        for pattern in patterns:
+            if isinstance(pattern, str):
+                compiled.append((pattern, re.compile(pattern)))
+            else:
+                compiled.append((pattern, pattern))
+        return compiled
+
+    def _search(self, compiled: List[Tuple[ExpectPattern, Any]]) -> Optional[ExpectMatch]:
+        """Correspondência mais próxima do início do buffer (empate: ordem dos padrões)"""
+        start = 0
+        if self.search_window is not None:
+            start = max(0, len(self._buffer) - self.search_window)
+        best: Optional[Tuple[int, re.Match]] = None
+        for index, (_, regex) in enumerate(compiled):
+            if isinstance(regex, _Sentinel):
+                continue
+            match = regex.search(self._buffer, start)
+            if match and (best is None or match.start() < best[1].start()):
+                best = (index, match)
+        if best is None:
+            return None
+        index, match = best
+        result = ExpectMatch(index, compiled[index][0], self._buffer[:match.start()], match.group(0), match)
+        self._buffer = self._buffer[match.end():]
+        return result
+
+    def _special(self, compiled: List[Tuple[ExpectPattern, Any]], sentinel: _Sentinel) -> ExpectMatch:
+        """EOF/TIMEOUT: devolve a correspondência se o sentinela foi pedido, senão lança exceção"""
+        for index, (pattern, _) in enumerate(compiled):
+            if pattern is sentinel:
+                result = ExpectMatch(index, sentinel, self._buffer, '')
+                self._buffer = ''
+                return result
+        expected = [pattern for pattern, _ in compiled]
+        recent = self._buffer[-200:]
+        if sentinel is TIMEOUT:
+            self.logger.error(f"Timeout aguardando {expected!r}; saída recente: {recent!r}")
+            raise TimeoutException(f"Timeout aguardando {expected!r}; saída recente: {recent!r}")
+        self.logger.error(f"Processo encerrado aguardando {expected!r}; saída recente: {recent!r}")
+        raise ConsoleAutomationException(f"Processo encerrado aguardando {expected!r}; saída recente: {recent!r}")
+
+    def expect(self, patterns: Union[ExpectPattern, Sequence[ExpectPattern]],
+               timeout: Optional[float] = None) -> ExpectMatch:
+        """
+        Aguarda um dos padrões na saída do processo
+
+        Strings são expressões regulares. O texto até o fim da correspondência é
+        consumido; o restante fica para a próxima chamada.
+
+        Args:
+            patterns: Padrão ou lista de padrões (regex, regex compilada, EOF, TIMEOUT)
+            timeout: Timeout em segundos (padrão: timeout do processo); 0 verifica
+                apenas a saída já disponível, sem bloquear
+
+        Returns:
+            ExpectMatch com `index` do padrão correspondido, `before` e `after`
+
+        Raises:
+            TimeoutException: Se nenhum padrão apareceu no tempo (e TIMEOUT não foi pedido)
+            ConsoleAutomationException: Se a saída terminou antes (e EOF não foi pedido)
+        """
+        compiled = self._compile(patterns)
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        while True:
+            result = self._search(compiled)
+            if result is None and self._eof:
+                result = self._special(compiled, EOF)
+            if result is not None:
+                self.last_match = result
+                return result
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                # Prazo esgotado (ou timeout=0): consome sem bloquear o que já chegou
+                if self._fill(0):
+                    continue
+                self.last_match = self._special(compiled, TIMEOUT)
+                return self.last_match
+            self._fill(remaining)
+
+    def read_until(self, delimiter: str, timeout: Optional[float] = None) -> str:
+        """Lê até o texto literal `delimiter` (inclusive)"""
+        result = self.expect(re.compile(re.escape(delimiter)), timeout)
+        return result.before + result.after
+
+    # Escrita
+
+    def send(self, text: str) -> None:
+        """Envia texto ao stdin do processo"""
+        try:
+            self.process.stdin.write(text.encode(self.config.encoding, self.config.encoding_errors))
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError, ValueError) as e:
+            self.logger.error(f"Erro ao enviar entrada: {str(e)}")
+            raise ConsoleAutomationException(f"Erro ao enviar entrada: {str(e)}")
+
+    def send_line(self, text: str = '') -> None:
+        """Envia uma linha ao stdin do processo"""
+        self.send(text + self.linesep)
+
+    def send_eof(self) -> None:
+        """Fecha o stdin (sinaliza fim da entrada)"""
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+
+    # Ciclo de vida
+
+    @property
+    def is_alive(self) -> bool:
+        """Se o processo ainda está em execução"""
+        return self.process.poll() is None
+
+    @property
+    def exit_code(self) -> Optional[int]:
+        """Código de saída (None enquanto em execução)"""
+        return self.process.poll()
+
+    def close(self, timeout: float = 5) -> Optional[int]:
+        """
+        Encerra o processo: fecha o stdin, aguarda até `timeout` segundos e então
+        finaliza o grupo de processos
+
+        Returns:
+            Código de saída
+        """
+        self.send_eof()
+        try:
+            self.process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            try:
+                if os.name == 'nt':
+                    self.process.kill()
+                else:
+                    os.killpg(self.process.pid, signal.SIGKILL)
+            except OSError:
+                pass
+            self.process.wait()
+        if os.name != 'nt':
+            self._selector.close()
+        self.process.stdout.close()
+        self.logger.info(f"Processo interativo encerrado com código: {self.process.returncode}")
+        return self.process.returncode
@@ -7,7 +7,7 @@ import json
 import os
 from pathlib import Path
 from typing import Any, Dict, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 import locale
 import os
 
@@ -19,9 +19,47 @@ class BrowserConfig:
     headless: bool = False
     implicit_wait: int = 10
     page_load_timeout: int = 30
+    page_load_strategy: str = "normal"  # normal, eager (DOMContentLoaded) ou none
+    ready_signal: Optional[str] = None  # dom_content_loaded, load, network_idle (None: só o page_load_strategy)
+    network_quiet_ms: int = 500  # janela sem fetch/XHR para o sinal network_idle
     window_size: str = "1920,1080"
     proxy: Optional[str] = None
     user_data_dir: Optional[str] = None
+    profile_template: Optional[str] = None  # template preparado com ProfileTemplate.prepare (clonado por sessão)
+    profile_clone_method: str = "auto"  # auto, reflink ou copy
+    drivers_dir: Optional[str] = None  # padrão: pasta drivers/ do projeto
+    drivers_offline: bool = False  # usa apenas drivers já registrados localmente
+    wait_strategy: str = "polling"  # polling (WebDriverWait) ou event (MutationObserver)
+    transport: str = "selenium"  # selenium ou w3c (cliente HTTP keep-alive nos comandos frequentes)
+    # Bloqueio de recursos: block_types (image, font, media, stylesheet, script), block_patterns,
+    # collect_stats, collect_every (navegações entre coletas do log de performance)
+    resource_policy: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class PoolConfig:
+    """Configuração do pool de sessões WebDriver"""
+    min_sessions: int = 0
+    max_sessions: int = 4
+    lease_timeout: int = 60
+    max_uses: int = 50  # 0 = sem limite de reutilizações por sessão
+    health_check: bool = True
+    reset_state: bool = True
+
+
+@dataclass
+class SessionStateConfig:
+    """Configuração do cache de estado de sessão (cookies e storage após login)"""
+    cache_dir: str = ".session_state"
+    ttl: int = 3600  # segundos; 0 = sem expiração
+    restore_path: str = "/favicon.ico"  # recurso leve da origem usado para restaurar fora do Chromium
+
+
+@dataclass
+class SelfHealingConfig:
+    """Configuração da cura automática de localizadores dos page objects"""
+    enabled: bool = False
+    store_path: str = ".self_healing.json"  # estratégias que funcionaram, por página e localizador
 
 
 @dataclass
@@ -46,7 +84,10 @@ class ConsoleConfig:
     """Configuração para automação de console"""
     timeout: int = 30
     encoding: str = "utf-8"
+    encoding_errors: str = "replace"  # tratamento de bytes inválidos na decodificação (strict, replace, ignore)
     capture_output: bool = True
+    max_output_lines: int = 10000  # linhas mantidas em output/error_output (as mais recentes)
+    max_line_length: int = 65536  # linhas maiores são entregues em pedaços no modo streaming
 
 
 class ConfigManager:
@@ -74,6 +115,9 @@ class ConfigManager:
         """Carrega configurações padrão"""
         self._config = {
             'browser': asdict(BrowserConfig()),
+            'pool': asdict(PoolConfig()),
+            'session_state': asdict(SessionStateConfig()),
+            'self_healing': asdict(SelfHealingConfig()),
             'logging': asdict(LogConfig()),
             'desktop': asdict(DesktopConfig()),
             'console': asdict(ConsoleConfig()),
@@ -163,6 +207,18 @@ class ConfigManager:
         """Retorna objeto de configuração do navegador"""
         return BrowserConfig(**self._config.get('browser', {}))
 
+    def get_pool_config(self) -> PoolConfig:
+        """Retorna objeto de configuração do pool de sessões"""
+        return PoolConfig(**self._config.get('pool', {}))
+
+    def get_session_state_config(self) -> SessionStateConfig:
+        """Retorna objeto de configuração do cache de estado de sessão"""
+        return SessionStateConfig(**self._config.get('session_state', {}))
+
+    def get_self_healing_config(self) -> SelfHealingConfig:
+        """Retorna objeto de configuração da cura de localizadores"""
+        return SelfHealingConfig(**self._config.get('self_healing', {}))
+
     def get_log_config(self) -> LogConfig:
         """Retorna objeto de configuração de logging"""
         return LogConfig(**self._config.get('logging', {}))
@@ -41,3 +41,11 @@ class ConsoleAutomationException(AutomationFrameworkException):
 class ConfigurationException(AutomationFrameworkException):
     """Exceção de configuração"""
     pass
+
+
+class WebDriverProtocolException(BrowserException):
+    """Erro retornado pelo driver no protocolo W3C WebDriver"""
+
+    def __init__(self, error: str, message: str = ""):
+        super().__init__(f"{error}: {message}" if message else error)
+        self.error = error
@@ -6,6 +6,7 @@ Implementa logging estruturado com níveis configuráveis
 import logging
 import sys
 import io
+import threading
 from pathlib import Path
 from datetime import datetime
 from logging.handlers import RotatingFileHandler
@@ -20,6 +21,7 @@ class Logger:
 
     _instance: Optional['Logger'] = None
     _loggers: dict = {}
+    _lock = threading.RLock()
 
     def __new__(cls):
         if cls._instance is None:
@@ -49,6 +51,15 @@ class Logger:
         if name in Logger._loggers:
             return Logger._loggers[name]
 
+        # Threads paralelas criando o mesmo logger não devem duplicar handlers
+        with Logger._lock:
+            if name in Logger._loggers:
+                return Logger._loggers[name]
+            return Logger._create_logger(name, level)
+
+    @staticmethod
+    def _create_logger(name: str, level: str) -> logging.Logger:
+        """Cria logger com handlers de console e arquivo"""
         logger = logging.getLogger(name)
         logger.setLevel(getattr(logging, level.upper()))
 
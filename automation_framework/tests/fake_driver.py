@@ -0,0 +1,28 @@
+"""
+Driver falso compartilhado pelos testes do BaseWebDriver
+Não abre navegador: o WebDriver do Selenium (ou um objeto simulado) é informado
+diretamente e os testes sobrescrevem apenas os métodos que precisam observar
+"""
+
+from typing import Any, Optional
+
+from automation_framework.web.driver_manager import BaseWebDriver
+
+
+class FakeDriver(BaseWebDriver):
+    """
+    BaseWebDriver sem navegador
+
+    `session` vira `self.driver` (padrão: nenhum); `_create_driver` não faz nada,
+    então `initialize()` executa só as etapas do próprio framework.
+    """
+
+    def __init__(self, config: Optional[dict] = None, session: Any = None):
+        super().__init__(config or {})
+        self.driver = session
+
+    def _create_options(self):
+        return None
+
+    def _create_driver(self):
+        pass
@@ -0,0 +1,111 @@
+"""
+Testes da execução assíncrona de comandos console
+"""
+
+import asyncio
+import pytest
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from automation_framework.console.async_console import AsyncConsoleProcess, run_many
+from automation_framework.core.config import ConfigManager, ConsoleConfig
+from automation_framework.core.exceptions import ConsoleAutomationException
+
+
+def python_command(code: str) -> str:
+    return f'"{sys.executable}" -c "{code}"'
+
+
+@pytest.fixture(autouse=True)
+def console_config(monkeypatch):
+    """Permite ajustar a configuração de console do teste"""
+    config = ConsoleConfig()
+    monkeypatch.setattr(ConfigManager, 'get_console_config', lambda self: config)
+    return config
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+class TestAsyncConsoleProcess:
+    def test_execute_command(self):
+        """Deve devolver (stdout, stderr, código) como o ConsoleProcess"""
+        console = AsyncConsoleProcess()
+        result = asyncio.run(console.execute_command(
+            python_command("import sys; print('ok'); print('aviso', file=sys.stderr); sys.exit(2)")
+        ))
+        assert result == ('ok', 'aviso', 2)
+        assert list(console.output) == ['ok']
+        assert console.last_return_code == 2
+
+    def test_timeout_kills_process_group(self):
+        """Timeout deve encerrar o shell e seus filhos"""
+        console = AsyncConsoleProcess()
+        started = time.monotonic()
+        with pytest.raises(ConsoleAutomationException):
+            asyncio.run(console.execute_command(python_command("import time; time.sleep(30)") + ' ; echo fim',
+                                                timeout=1))
+        assert time.monotonic() - started < 10
+
+    def test_stream_command(self, console_config):
+        """Linhas de stdout devem ser entregues em ordem; stderr vai para error_output"""
+        console_config.max_line_length = 10
+        console = AsyncConsoleProcess()
+        errors = []
+        lines = asyncio.run(collect(console.stream_command(
+            python_command("import sys; print('um'); print('falha', file=sys.stderr); print('x' * 15)"),
+            on_error_line=errors.append,
+        )))
+        assert lines == ['um', 'x' * 10, 'x' * 5]
+        assert errors == ['falha']
+        assert console.last_return_code == 0
+
+    def test_stream_timeout(self):
+        """Timeout no streaming deve encerrar o processo e lançar exceção"""
+        console = AsyncConsoleProcess()
+
+        async def consume():
+            lines = []
+            with pytest.raises(ConsoleAutomationException):
+                async for line in console.stream_command(
+                        python_command("import time; print('a', flush=True); time.sleep(30)"), timeout=1):
+                    lines.append(line)
+            return lines
+
+        assert asyncio.run(consume()) == ['a']
+
+
+class TestRunMany:
+    def test_results_in_completion_order(self):
+        """Comandos mais rápidos devem ser entregues primeiro"""
+        commands = [python_command(f"import time; time.sleep({delay}); print({delay})") for delay in (0.6, 0.0, 0.3)]
+        results = asyncio.run(collect(run_many(commands, concurrency=3)))
+        assert [result.index for result in results] == [1, 2, 0]
+        assert [result.stdout for result in results] == ['0.0', '0.3', '0.6']
+        assert all(result.ok for result in results)
+
+    def test_concurrency_and_failures(self):
+        """Devem rodar em paralelo até o limite e falhas não devem interromper os demais"""
+        commands = [python_command("import time; time.sleep(0.5)")] * 8 + [python_command("import time; time.sleep(30)")]
+        started = time.monotonic()
+        results = asyncio.run(collect(run_many(commands, concurrency=4, timeout=2)))
+        elapsed = time.monotonic() - started
+
+        assert len(results) == 9
+        assert sum(result.ok for result in results) == 8
+        assert 'Timeout' in results[-1].error and results[-1].index == 8
+        # 8 comandos de 0.5 s em 2 ondas, mais o timeout em paralelo: bem abaixo da soma serial
+        assert elapsed < 8
+
+    def test_invalid_concurrency(self):
+        """concurrency menor que 1 deve ser rejeitado em vez de travar a iteração"""
+        with pytest.raises(ValueError):
+            run_many([python_command("print(1)")], concurrency=0)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,147 @@
+"""
+Testes da API web assíncrona contra um servidor W3C simulado
+"""
+
+import asyncio
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from automation_framework.core.exceptions import ElementNotFound, WebDriverProtocolException
+from automation_framework.web.async_driver import AsyncBaseWebDriver, AsyncBasePage, gather_bounded
+from automation_framework.web.locators import Locator
+from automation_framework.web.w3c import ELEMENT_KEY, to_w3c_locator
+from fake_driver import FakeDriver
+from w3c_stub import StubW3CServer, W3CError
+
+
+class StubSyncDriver(FakeDriver):
+    """Driver síncrono falso apontando para o servidor simulado"""
+
+    def __init__(self, server, **config):
+        super().__init__({'implicit_wait': 1, **config}, server.selenium_driver())
+        self.quits = 0
+
+    def quit(self):
+        self.quits += 1
+
+
+@pytest.fixture
+def server():
+    with StubW3CServer() as stub:
+        yield stub
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestAsyncDriver:
+    def test_commands_reuse_one_connection(self, server):
+        """Comandos devem usar HTTP keep-alive em uma única conexão"""
+        server.routes[('POST', '/url')] = None
+        server.routes[('GET', '/url')] = 'https://exemplo.com/painel'
+        server.routes[('POST', '/elements')] = [{ELEMENT_KEY: 'e1'}]
+        server.routes[('POST', '/element/e1/click')] = None
+        server.routes[('GET', '/element/e1/text')] = 'Entrar'
+
+        async def scenario():
+            async with AsyncBaseWebDriver(StubSyncDriver(server)) as driver:
+                await driver.get('https://exemplo.com')
+                elements = await driver.find_elements('id', 'entrar', timeout=0)
+                await elements[0].click()
+                return await elements[0].text(), await driver.get_current_url(), driver
+
+        text, url, driver = run(scenario())
+        assert text == 'Entrar'
+        assert url == 'https://exemplo.com/painel'
+        assert server.connections == 1
+        assert driver.sync_driver.quits == 1
+        assert server.commands[1] == ('POST', '/elements', {'using': 'css selector', 'value': '[id="entrar"]'})
+
+    def test_page_uses_locators_and_scripts(self, server):
+        """AsyncBasePage deve aceitar Locator e decodificar elementos de scripts"""
+        server.routes[('POST', '/execute/sync')] = {ELEMENT_KEY: 'e2'}
+        server.routes[('GET', '/element/e2/text')] = 'Olá'
+
+        async def scenario():
+            page = AsyncBasePage(AsyncBaseWebDriver(StubSyncDriver(server)))
+            return await page.get_text(Locator.css_selector('h1'))
+
+        assert run(scenario()) == 'Olá'
+        assert server.commands[0][2]['args'][:2] == ['css selector', 'h1']
+
+    def test_event_wait_and_errors(self, server):
+        """Espera por evento deve usar /execute/async e erros W3C devem virar exceções"""
+        server.routes[('POST', '/timeouts')] = None
+        server.routes[('POST', '/execute/async')] = {'timeout': True}
+        server.routes[('POST', '/element/e3/click')] = W3CError('element not interactable', status=400)
+
+        async def scenario():
+            driver = AsyncBaseWebDriver(StubSyncDriver(server, wait_strategy='event'))
+            with pytest.raises(ElementNotFound):
+                await driver.find_element('id', 'ausente')
+            with pytest.raises(WebDriverProtocolException) as error:
+                await driver._decode({ELEMENT_KEY: 'e3'}).click()
+            return error.value.error
+
+        assert run(scenario()) == 'element not interactable'
+        assert server.commands[0][0:2] == ('POST', '/timeouts')
+
+    def test_wait_for_element_matches_sync_condition(self, server):
+        """wait_for_element deve aguardar 'present', como o BaseWebDriver"""
+        server.routes[('POST', '/execute/sync')] = {ELEMENT_KEY: 'e4'}
+
+        async def scenario():
+            return await AsyncBaseWebDriver(StubSyncDriver(server)).wait_for_element('id', 'menu')
+
+        assert run(scenario()).id == 'e4'
+        assert server.commands[0][2]['args'][2] == 'present'
+
+    def test_long_waits_do_not_hold_semaphore(self, server):
+        """Espera longa no navegador não deve bloquear comandos de outras sessões"""
+        finished = []
+
+        class SlowHTTP:
+            async def request(self, method, path, payload=None):
+                if path.endswith('/execute/async'):
+                    await asyncio.sleep(0.5)
+                finished.append(path.rsplit('/', 1)[-1])
+                return 200, b'{"value": "ok"}'
+
+        async def scenario():
+            semaphore = asyncio.Semaphore(1)
+            waiting = AsyncBaseWebDriver(StubSyncDriver(server), semaphore)
+            other = AsyncBaseWebDriver(StubSyncDriver(server), semaphore)
+            waiting._http = other._http = SlowHTTP()
+            await asyncio.gather(waiting.execute_async_script('espera'), other.get_title())
+
+        run(scenario())
+        assert finished == ['title', 'async']
+
+    def test_gather_bounded_limits_concurrency(self):
+        """gather_bounded não deve exceder a concorrência e deve manter a ordem"""
+        active = {'now': 0, 'max': 0}
+
+        async def job(value):
+            active['now'] += 1
+            active['max'] = max(active['max'], active['now'])
+            await asyncio.sleep(0.01)
+            active['now'] -= 1
+            return value
+
+        results = run(gather_bounded([job(i) for i in range(10)], concurrency=3))
+        assert results == list(range(10))
+        assert active['max'] == 3
+
+
+def test_w3c_locator_conversion():
+    """Estratégias fora do W3C devem virar seletores CSS"""
+    assert to_w3c_locator('name', 'q') == ('css selector', '[name="q"]')
+    assert to_w3c_locator('xpath', '//a') == ('xpath', '//a')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,100 @@
+"""
+Testes da execução sem shell (argv) e do ambiente por comando
+"""
+
+import asyncio
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from automation_framework.console.async_console import AsyncConsoleProcess
+from automation_framework.console.console_manager import (CommandBuilder, ConsoleProcess, format_command, spawn_args,
+                                                            split_command)
+
+PRINT_ARGS = "import os, sys; print(sys.argv[1:]); print(os.environ.get('AF_TESTE'))"
+
+# Comandos por rodada do benchmark de criação de processos
+SPAWN_ROUNDS = 40
+
+
+class TestCommandBuilder:
+    def test_build_argv(self):
+        """Chave e valor devem virar argumentos separados, sem interpretação do shell"""
+        builder = CommandBuilder('mvn -q').add_argument('-Dnome', 'com espaço').add_flag('U').add_argument('$HOME;')
+        assert builder.build_argv() == ['mvn', '-q', '-Dnome', 'com espaço', '-U', '$HOME;']
+        if os.name != 'nt':
+            assert builder.build() == "mvn -q -Dnome 'com espaço' -U '$HOME;'"
+
+    def test_split_command_windows_quotes(self):
+        """No Windows as aspas agrupam o argumento mas não fazem parte dele"""
+        assert split_command(r'"C:\Program Files\app.exe" -q --nome="a b"', posix=False) == \
+            [r'C:\Program Files\app.exe', '-q', '--nome=a b']
+        assert split_command('app ""  x', posix=False) == ['app', '', 'x']
+        assert split_command("'/opt/meu app/bin' -q", posix=True) == ['/opt/meu app/bin', '-q']
+
+    def test_execute_without_shell_and_child_env(self, monkeypatch):
+        """env_vars devem chegar só ao processo filho e argumentos devem chegar literais"""
+        monkeypatch.delenv('AF_TESTE', raising=False)
+        builder = CommandBuilder(sys.executable)
+        builder.add_argument('-c', PRINT_ARGS).add_argument('a b', '"$(echo x)"').add_env_var('AF_TESTE', 'filho')
+
+        stdout, _, code = builder.execute()
+
+        assert code == 0
+        assert stdout.splitlines() == ["['a b', '\"$(echo x)\"']", 'filho']
+        assert 'AF_TESTE' not in os.environ
+
+
+class TestArgvExecution:
+    def test_console_process_accepts_argv(self):
+        """ConsoleProcess deve aceitar sequências argv em todos os modos"""
+        process = ConsoleProcess()
+        argv = (sys.executable, '-c', PRINT_ARGS, '*', '|')
+
+        stdout, _, _ = process.execute_command(argv, env={'AF_TESTE': 'sync'})
+        assert stdout.splitlines() == ["['*', '|']", 'sync']
+        assert list(process.stream_command(list(argv))) == ["['*', '|']", 'None']
+
+    def test_async_console_accepts_argv(self):
+        """AsyncConsoleProcess deve executar argv sem shell"""
+        console = AsyncConsoleProcess()
+        stdout, _, code = asyncio.run(
+            console.execute_command([sys.executable, '-c', PRINT_ARGS, '>', 'x'], env={'AF_TESTE': 'async'})
+        )
+        assert (stdout.splitlines(), code) == (["['>', 'x']", 'async'], 0)
+
+    def test_format_command(self):
+        """argv deve ser exibido com as aspas da plataforma"""
+        if os.name == 'nt':
+            assert format_command(['dir', 'a b']) == 'dir "a b"'
+        else:
+            assert format_command(['ls', 'a b']) == "ls 'a b'"
+        assert format_command('echo oi') == 'echo oi'
+
+
+@pytest.mark.skipif(shutil.which('true') is None, reason="requer o executável 'true'")
+class TestSpawnBenchmark:
+    def test_argv_spawns_faster_than_shell(self):
+        """Sem o /bin/sh intermediário, a taxa de criação de processos deve ser maior"""
+        executable = shutil.which('true')
+        # Rodadas intercaladas, melhor tempo de cada modo (o log do ConsoleProcess é deixado de fora)
+        best = {'shell': float('inf'), 'argv': float('inf')}
+        for _ in range(5):
+            for mode, command in (('shell', executable), ('argv', [executable])):
+                started = time.perf_counter()
+                for _ in range(SPAWN_ROUNDS):
+                    subprocess.run(**spawn_args(command), capture_output=True)
+                best[mode] = min(best[mode], time.perf_counter() - started)
+        shell_rate, argv_rate = SPAWN_ROUNDS / best['shell'], SPAWN_ROUNDS / best['argv']
+        assert argv_rate > shell_rate, f"shell: {shell_rate:.0f} cmd/s, argv: {argv_rate:.0f} cmd/s"
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
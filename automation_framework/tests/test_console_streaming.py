@@ -0,0 +1,129 @@
+"""
+Testes do modo streaming do ConsoleProcess
+"""
+
+import pytest
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from automation_framework.console.console_manager import ConsoleProcess
+from automation_framework.core.config import ConfigManager, ConsoleConfig
+from automation_framework.core.exceptions import ConsoleAutomationException
+
+
+def python_command(code: str) -> str:
+    return f'"{sys.executable}" -c "{code}"'
+
+
+@pytest.fixture
+def console_config(monkeypatch):
+    """Permite ajustar a configuração de console do teste"""
+    config = ConsoleConfig()
+    monkeypatch.setattr(ConfigManager, 'get_console_config', lambda self: config)
+    return config
+
+
+class TestStreaming:
+    def test_lines_callbacks_and_tee(self, tmp_path, console_config):
+        """Linhas devem chegar ao iterador, aos callbacks e ao arquivo tee"""
+        process = ConsoleProcess()
+        errors = []
+        tee = tmp_path / 'saida.log'
+        command = python_command(
+            "import sys; print('um'); print('falha', file=sys.stderr); print('dois'); sys.exit(3)"
+        )
+
+        lines = list(process.stream_command(command, on_error_line=errors.append, tee_path=str(tee)))
+
+        assert lines == ['um', 'dois']
+        assert errors == ['falha']
+        assert process.last_return_code == 3
+        assert sorted(tee.read_text().splitlines()) == ['dois', 'falha', 'um']
+        assert not process.is_running
+
+    def test_tee_failure_does_not_spawn_process(self, tmp_path, console_config):
+        """Falha ao abrir o tee deve lançar exceção sem iniciar o processo"""
+        process = ConsoleProcess()
+        marker = tmp_path / 'iniciado'
+        command = [sys.executable, '-c', f"open({str(marker)!r}, 'w').close()"]
+        with pytest.raises(ConsoleAutomationException):
+            list(process.stream_command(command, tee_path=str(tmp_path / 'inexistente' / 'saida.log')))
+        time.sleep(0.5)
+        assert process.process is None
+        assert not marker.exists()
+
+    def test_output_is_bounded_ring_buffer(self, console_config):
+        """output deve manter só as linhas mais recentes"""
+        console_config.max_output_lines = 100
+        process = ConsoleProcess()
+        seen = []
+
+        code = process.execute_streaming(
+            python_command("[print(i) for i in range(20000)]"), on_line=seen.append
+        )
+
+        assert code == 0
+        assert len(seen) == 20000
+        assert list(process.output) == [str(i) for i in range(19900, 20000)]
+        assert process.get_last_output() == '\n'.join(str(i) for i in range(19900, 20000))
+
+    def test_last_output_is_whole_command_output(self, console_config):
+        """get_last_output deve devolver a saída completa do último comando, não só a última linha"""
+        process = ConsoleProcess()
+        process.execute_command(python_command("print('a'); print('b')"))
+        process.execute_command(python_command("print('c'); print('d')"))
+        assert process.get_last_output() == 'c\nd'
+        assert list(process.output) == ['a', 'b', 'c', 'd']
+
+    def test_long_lines_are_chunked(self, console_config):
+        """Linhas maiores que max_line_length devem ser entregues em pedaços"""
+        console_config.max_line_length = 10
+        process = ConsoleProcess()
+        assert list(process.stream_command(python_command("print('x' * 25)"))) == ['x' * 10, 'x' * 10, 'x' * 5]
+
+    def test_timeout_kills_process(self, console_config):
+        """Timeout deve encerrar o processo sem esperar o fim da saída"""
+        process = ConsoleProcess()
+        started = time.monotonic()
+        with pytest.raises(ConsoleAutomationException):
+            list(process.stream_command(python_command("import time; print('a', flush=True); time.sleep(30)"),
+                                        timeout=1))
+        assert time.monotonic() - started < 10
+        assert process.process.poll() is not None
+
+    def test_callback_errors_do_not_abort_stream(self, console_config):
+        """Erros em on_line e on_error_line devem ser tratados igualmente, sem interromper o comando"""
+        def failing(line):
+            raise ValueError(line)
+
+        process = ConsoleProcess()
+        command = python_command("import sys; print('um'); print('e', file=sys.stderr); print('dois')")
+        assert list(process.stream_command(command, on_line=failing, on_error_line=failing)) == ['um', 'dois']
+        assert process.last_return_code == 0
+
+    def test_consumer_can_stop_early(self, console_config):
+        """Interromper a iteração deve encerrar o processo"""
+        process = ConsoleProcess()
+        stream = process.stream_command(python_command("import itertools; [print(i) for i in itertools.count()]"))
+        for line in stream:
+            if line == '1000':
+                break
+        stream.close()
+        assert process.process.poll() is not None
+
+
+class TestEncodingErrors:
+    def test_encoding_errors_from_config(self, console_config):
+        """Bytes inválidos devem seguir console.encoding_errors"""
+        command = python_command("import sys; sys.stdout.buffer.write(bytes([0x61, 0xff, 0x62]))")
+        console_config.encoding_errors = 'ignore'
+        assert ConsoleProcess().execute_command(command)[0] == 'ab'
+        console_config.encoding_errors = 'replace'
+        assert ConsoleProcess().execute_command(command)[0] == 'a\ufffdb'
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
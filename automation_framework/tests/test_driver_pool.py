@@ -0,0 +1,169 @@
+"""
+Testes do pool de sessões WebDriver
+Usam drivers falsos para não depender de navegador instalado
+"""
+
+import pytest
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from automation_framework.core.exceptions import BrowserException, TimeoutException
+from automation_framework.web.driver_manager import DriverManager
+from automation_framework.web.driver_pool import DriverPool
+from automation_framework.web.page_object import BasePage
+from fake_driver import FakeDriver
+
+
+class FakeWebDriver(FakeDriver):
+    """Driver falso que apenas registra chamadas"""
+
+    def __init__(self, config: dict = None):
+        super().__init__(config)
+        self.alive = True
+        self.resets = 0
+        self.quit_called = False
+
+    def initialize(self) -> None:
+        pass
+
+    def is_alive(self) -> bool:
+        return self.alive
+
+    def reset_state(self, blank_url: str = "about:blank") -> None:
+        self.resets += 1
+
+    def quit(self) -> None:
+        self.quit_called = True
+
+
+def make_pool(**kwargs) -> DriverPool:
+    kwargs.setdefault('max_sessions', 2)
+    return DriverPool(driver_factory=FakeWebDriver, **kwargs)
+
+
+class TestDriverPool:
+    def test_reuses_released_session(self):
+        """Sessão devolvida deve ser reutilizada e limpa"""
+        pool = make_pool()
+        first = pool.lease()
+        pool.release(first)
+        second = pool.lease()
+
+        assert second is first
+        assert first.resets == 1
+        assert pool.stats()['created'] == 1
+        assert pool.stats()['reused'] == 1
+
+    def test_lease_timeout_when_exhausted(self):
+        """Pool cheio deve lançar TimeoutException"""
+        pool = make_pool(max_sessions=1)
+        pool.lease()
+        with pytest.raises(TimeoutException):
+            pool.lease(timeout=0.1)
+
+    def test_unhealthy_session_is_replaced(self):
+        """Sessão que falha no health check deve ser descartada"""
+        pool = make_pool()
+        driver = pool.lease()
+        pool.release(driver)
+        driver.alive = False
+
+        replacement = pool.lease()
+        assert replacement is not driver
+        assert driver.quit_called
+
+    def test_context_manager_and_warm_up(self):
+        """Context manager deve aquecer e encerrar sessões"""
+        with make_pool(min_sessions=2) as pool:
+            assert pool.stats()['idle'] == 2
+            with pool.session() as driver:
+                assert pool.stats()['leased'] == 1
+            assert pool.stats()['leased'] == 0
+
+        assert driver.quit_called
+        with pytest.raises(BrowserException):
+            pool.lease()
+
+    def test_first_lease_warms_up_and_discards_are_replaced(self):
+        """Pool sem `with` deve aquecer no primeiro empréstimo e repor sessões descartadas"""
+        pool = make_pool(min_sessions=2, max_sessions=3)
+
+        def wait_for_size(size):
+            deadline = time.monotonic() + 5
+            while pool.size != size or pool.stats()['idle'] + pool.stats()['leased'] != size:
+                assert time.monotonic() < deadline, pool.stats()
+                time.sleep(0.01)
+
+        driver = pool.lease()
+        wait_for_size(2)
+        assert pool.stats()['idle'] == 1
+
+        pool.release(driver, discard=True)
+        wait_for_size(2)
+        assert pool.stats()['idle'] == 2
+        assert pool.stats()['created'] == 3
+        pool.close()
+
+    def test_release_unknown_driver(self):
+        """Devolver sessão desconhecida deve falhar"""
+        pool = make_pool()
+        with pytest.raises(BrowserException):
+            pool.release(FakeWebDriver())
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """DriverManager que cria drivers falsos"""
+    monkeypatch.setattr(DriverManager, '_get_driver_class', staticmethod(lambda browser_type: FakeWebDriver))
+    manager = DriverManager()
+    yield manager
+    manager.quit_all()
+
+
+class TestDriverManagerSessions:
+    def test_threads_get_independent_sessions(self, manager):
+        """Cada thread deve receber seu próprio navegador"""
+        barrier = threading.Barrier(3)
+
+        def worker(_):
+            driver = manager.get_driver()
+            barrier.wait(timeout=5)
+            return driver
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            drivers = list(executor.map(worker, range(3)))
+
+        assert len({id(d) for d in drivers}) == 3
+        assert not any(d.quit_called for d in drivers)
+
+    def test_named_session_and_page_binding(self, manager):
+        """Page object deve seguir a sessão nomeada"""
+        page = BasePage(session='relatorios')
+        first = page.driver
+        assert first.session_name == 'relatorios'
+        assert manager.get_driver('relatorios') is first
+
+        second = manager.initialize_browser(session='relatorios')
+        assert first.quit_called
+        assert page.driver is second
+
+    def test_use_session_binds_thread(self, manager):
+        """use_session deve definir a sessão padrão da thread"""
+        with manager.use_session('checkout'):
+            driver = manager.get_driver()
+            assert manager.session_key() == 'checkout'
+        assert manager.has_session('checkout')
+        assert manager.get_driver('checkout') is driver
+
+        manager.quit_browser('checkout')
+        assert driver.quit_called
+        assert not manager.has_session('checkout')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
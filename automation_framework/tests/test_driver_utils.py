@@ -0,0 +1,102 @@
+"""
+Testes da resolução de drivers com manifesto local
+O webdriver-manager é substituído por um manager falso (sem rede)
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from automation_framework.core.exceptions import BrowserException
+from automation_framework.web import driver_utils
+from automation_framework.web.driver_utils import (
+    ensure_all_drivers,
+    ensure_driver_installed,
+    invalidate_driver,
+    read_manifest,
+)
+
+
+class FakeDriverInfo:
+    def get_browser_version_from_os(self):
+        return "120.0.1"
+
+
+class FakeManager:
+    """Simula webdriver-manager com executável em um cache temporário"""
+
+    installs = 0
+
+    def __init__(self, cache_dir: Path, browser: str):
+        self.executable = cache_dir / driver_utils.DRIVER_BINARIES[browser]
+        self.driver = FakeDriverInfo()
+
+    def install(self) -> str:
+        FakeManager.installs += 1
+        self.executable.parent.mkdir(parents=True, exist_ok=True)
+        self.executable.write_bytes(b"fake-driver")
+        return str(self.executable)
+
+
+@pytest.fixture
+def fake_manager(tmp_path, monkeypatch):
+    FakeManager.installs = 0
+    monkeypatch.setattr(driver_utils, '_create_manager', lambda browser: FakeManager(tmp_path / "cache", browser))
+    monkeypatch.setattr(driver_utils, '_driver_version', lambda executable: "120.0.0")
+    monkeypatch.setattr(driver_utils, '_resolved', {})
+    return FakeManager
+
+
+class TestDriverManifest:
+    def test_manifest_hit_skips_manager(self, tmp_path, fake_manager):
+        """Segunda resolução deve vir do manifesto, sem chamar install()"""
+        target = tmp_path / "drivers"
+        first = ensure_driver_installed('chrome', target_dir=str(target))
+
+        entry = read_manifest(target)['chrome']
+        assert entry['path'] == first
+        assert entry['browser_version'] == "120.0.1"
+        assert entry['driver_version'] == "120.0.0"
+
+        driver_utils._resolved.clear()
+        assert ensure_driver_installed('chrome', target_dir=str(target)) == first
+        assert fake_manager.installs == 1
+
+    def test_checksum_mismatch_resolves_again(self, tmp_path, fake_manager):
+        """Executável alterado deve invalidar a entrada do manifesto"""
+        target = tmp_path / "drivers"
+        path = ensure_driver_installed('chrome', target_dir=str(target))
+        Path(path).write_bytes(b"corrompido")
+        driver_utils._resolved.clear()
+
+        ensure_driver_installed('chrome', target_dir=str(target))
+        assert fake_manager.installs == 2
+        assert Path(path).read_bytes() == b"fake-driver"
+
+    def test_offline_mode(self, tmp_path, fake_manager):
+        """Modo offline nunca deve chamar o webdriver-manager"""
+        target = tmp_path / "drivers"
+        with pytest.raises(BrowserException):
+            ensure_driver_installed('firefox', target_dir=str(target), offline=True)
+
+        target.mkdir()
+        (target / "geckodriver").write_bytes(b"local")
+        path = ensure_driver_installed('firefox', target_dir=str(target), offline=True)
+        assert Path(path).name == "geckodriver"
+        assert fake_manager.installs == 0
+
+    def test_invalidate_and_ensure_all(self, tmp_path, fake_manager):
+        """ensure_all_drivers deve resolver todos os navegadores"""
+        target = tmp_path / "drivers"
+        paths = ensure_all_drivers(target_dir=str(target))
+        assert set(paths) == {'chrome', 'firefox', 'edge'}
+        assert set(read_manifest(target)) == {'chrome', 'firefox', 'edge'}
+
+        invalidate_driver('edge', target_dir=str(target))
+        assert 'edge' not in read_manifest(target)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
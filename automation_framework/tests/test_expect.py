@@ -0,0 +1,110 @@
+"""
+Testes da interação contínua (expect) com processos console
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from automation_framework.console.console_manager import ConsoleProcess
+from automation_framework.console.expect import EOF, TIMEOUT, InteractiveProcess
+from automation_framework.core.exceptions import ConsoleAutomationException, TimeoutException
+
+# CLI interativa: exibe um prompt e responde cada linha em maiúsculas
+ECHO_CLI = (
+    "import sys\n"
+    "sys.stdout.write('pronto> '); sys.stdout.flush()\n"
+    "for line in sys.stdin:\n"
+    "    if line.strip() == 'sair': break\n"
+    "    sys.stdout.write(line.strip().upper() + '\\npronto> '); sys.stdout.flush()\n"
+    "print('tchau')\n"
+)
+
+
+@pytest.fixture
+def cli():
+    process = InteractiveProcess([sys.executable, '-u', '-c', ECHO_CLI], timeout=10)
+    yield process
+    process.close()
+
+
+class TestExpect:
+    def test_conversation_with_before_and_after(self, cli):
+        """Trocas sucessivas no mesmo processo devem expor o texto antes e o correspondido"""
+        cli.expect('pronto> ')
+        cli.send_line('olá mundo')
+        match = cli.expect(r'(\w+) (\w+)\n')
+        assert match.after == 'OLÁ MUNDO\n'
+        assert match.group(2) == 'MUNDO'
+
+        cli.send_line('segunda')
+        assert cli.read_until('pronto> ') == 'pronto> '
+        assert cli.read_until('pronto> ') == 'SEGUNDA\npronto> '
+        assert cli.is_alive
+
+    def test_pattern_list_and_eof(self, cli):
+        """Deve devolver o índice do padrão correspondido e tratar EOF como padrão"""
+        cli.expect('pronto> ')
+        cli.send_line('sair')
+        match = cli.expect(['erro', 'tchau'])
+        assert (match.index, match.before) == (1, '')
+        eof = cli.expect([EOF])
+        assert eof.pattern is EOF and eof.before == '\n'
+        assert cli.close() == 0
+
+    def test_timeout(self, cli):
+        """Sem TIMEOUT na lista deve lançar TimeoutException; com ele, devolver o que chegou"""
+        cli.expect('pronto> ')
+        started = time.monotonic()
+        with pytest.raises(TimeoutException):
+            cli.expect('nunca', timeout=0.3)
+        assert time.monotonic() - started < 2
+
+        cli.send('parcial')
+        match = cli.expect(['nunca', TIMEOUT], timeout=0.3)
+        assert match.pattern is TIMEOUT and match.index == 1
+
+    def test_zero_timeout_reads_available_output(self, cli):
+        """timeout=0 deve verificar a saída já disponível sem bloquear"""
+        cli.expect('pronto> ')
+        cli.send_line('rápido')
+        time.sleep(0.3)
+        assert cli.expect('pronto> ', timeout=0).before == 'RÁPIDO\n'
+        assert cli.expect(['nunca', TIMEOUT], timeout=0).pattern is TIMEOUT
+
+    def test_unexpected_eof_raises(self, cli):
+        """Saída encerrada sem o padrão deve lançar exceção"""
+        cli.send_line('sair')
+        with pytest.raises(ConsoleAutomationException):
+            cli.expect('nunca')
+
+    def test_split_multibyte_characters(self):
+        """Caracteres multibyte divididos entre leituras devem ser decodificados"""
+        code = "import os, sys, time\nfor b in 'ação\\n'.encode():\n    os.write(1, bytes([b])); time.sleep(0.01)\n"
+        with InteractiveProcess([sys.executable, '-c', code]) as process:
+            assert process.read_until('\n') == 'ação\n'
+
+    def test_many_exchanges_without_respawn(self, cli):
+        """Milhares de trocas devem usar o mesmo processo"""
+        pid = cli.process.pid
+        cli.expect('pronto> ')
+        started = time.monotonic()
+        for i in range(2000):
+            cli.send_line(f'item {i}')
+            assert cli.expect('pronto> ').before == f'ITEM {i}\n'
+        assert time.monotonic() - started < 20
+        assert cli.process.pid == pid
+
+    def test_console_process_start_interactive(self):
+        """ConsoleProcess deve iniciar a sessão interativa no seu diretório de trabalho"""
+        with ConsoleProcess(str(Path(__file__).parent)).start_interactive(
+                [sys.executable, '-c', "import os; print(os.path.basename(os.getcwd()))"]) as process:
+            assert process.expect([EOF]).before.strip() == 'tests'
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
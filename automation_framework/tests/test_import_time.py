@@ -0,0 +1,69 @@
+"""
+Testes de custo de importação do pacote
+Jobs de console e dados não devem carregar o Selenium nem outras dependências pesadas
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+BROWSER_PACKAGES = ('selenium', 'webdriver_manager')
+
+# Dependências pesadas carregadas só pelos recursos que as usam (navegador, snapshot, desktop, asyncio)
+HEAVY_PACKAGES = BROWSER_PACKAGES + ('urllib3', 'lxml', 'cssselect', 'pyautogui', 'pywinauto', 'asyncio')
+
+
+def run_python(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=str(PROJECT_ROOT), capture_output=True, text=True, check=True,
+    )
+
+
+class TestImportTime:
+    @pytest.mark.parametrize('module', [
+        'automation_framework',
+        'automation_framework.console.console_manager',
+        'automation_framework.core.config',
+    ])
+    def test_console_jobs_do_not_import_browser_packages(self, module):
+        """Importar o framework sem usar navegador não deve carregar o Selenium"""
+        result = run_python(
+            f"import sys, {module}\n"
+            f"from automation_framework import Logger, ConfigManager\n"
+            f"print(sorted({{m.split('.')[0] for m in sys.modules}} & set({BROWSER_PACKAGES!r})))"
+        )
+        assert result.stdout.strip() == '[]'
+
+    def test_public_api_is_resolved_on_access(self):
+        """DriverManager deve ser carregado no primeiro acesso e listado em dir()"""
+        result = run_python(
+            "import sys, automation_framework as af\n"
+            "assert 'DriverManager' in dir(af)\n"
+            "assert 'selenium' not in sys.modules\n"
+            "print(af.DriverManager.__module__, 'selenium' in sys.modules)"
+        )
+        assert result.stdout.split() == ['automation_framework.web.driver_manager', 'True']
+
+    @pytest.mark.parametrize('module', [
+        'automation_framework',
+        'automation_framework.console.console_manager',
+    ])
+    def test_heavy_modules_are_not_loaded(self, module):
+        """Importar o framework e o console não deve carregar dependências pesadas"""
+        result = run_python(
+            f"import sys, {module}\n"
+            f"from automation_framework import Logger, ConfigManager\n"
+            f"print(sorted({{m.split('.')[0] for m in sys.modules}} & set({HEAVY_PACKAGES!r})))"
+        )
+        assert result.stdout.strip() == '[]'
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,90 @@
+"""
+Testes do Locator (internação, imutabilidade e cadeias de alternativas)
+"""
+
+import pickle
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from automation_framework.web.locators import ANY, Locator
+from automation_framework.web.page_object import BasePage
+from automation_framework.web.scripts import PROBE_JS, RESOLVE_JS
+from fake_driver import FakeDriver
+
+
+class ScriptBrowser:
+    """WebDriver do Selenium simulado que responde aos scripts de localização"""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.scripts = []
+
+    def execute_script(self, script, *args):
+        self.scripts.append((script, args))
+        return self.responses[script]
+
+
+class ScriptDriver(FakeDriver):
+    def __init__(self, responses):
+        super().__init__({'implicit_wait': 1}, ScriptBrowser(responses))
+
+    @property
+    def scripts(self):
+        return self.driver.scripts
+
+
+class TestLocator:
+    def test_interned_and_hashable(self):
+        """Localizadores iguais devem ser a mesma instância e servir como chave"""
+        first = Locator.css_selector('#enviar')
+        assert first is Locator('css selector', '#enviar')
+        assert {first: 1}[Locator.css_selector('#enviar')] == 1
+        assert pickle.loads(pickle.dumps(first)) is first
+
+    def test_immutable_with_slots(self):
+        """Locator não deve aceitar atributos nem alterações"""
+        locator = Locator.id('nome')
+        with pytest.raises(AttributeError):
+            locator.value = 'outro'
+        with pytest.raises(AttributeError):
+            locator.extra = 1
+        assert not hasattr(locator, '__dict__')
+
+    def test_fallback_chain(self):
+        """Alternativas devem ser achatadas em ordem, sem repetição"""
+        chain = Locator.id('enviar').or_css('button[type=submit]').or_text('Enviar')
+        assert chain.is_composite
+        assert chain.by == ANY
+        assert chain.value == (('id', 'enviar'), ('css selector', 'button[type=submit]'), ('text', 'Enviar'))
+        assert chain.alternatives[2] is Locator.text('Enviar')
+        assert Locator.any(chain, Locator.id('enviar')) is chain
+        assert Locator.any(Locator.id('x')) is Locator.id('x')
+        assert repr(chain).startswith("Locator.any(Locator(ID, 'enviar'), ")
+
+
+class TestCompositeResolution:
+    CHAIN = Locator.id('enviar').or_text('Enviar')
+
+    def test_resolve_reports_matching_alternative(self):
+        """resolve() deve informar a alternativa que encontrou o elemento em uma chamada"""
+        driver = ScriptDriver({RESOLVE_JS: {'element': 'botao', 'index': 1}})
+        element, matched = BasePage(driver).resolve(self.CHAIN)
+
+        assert element == 'botao'
+        assert matched is Locator.text('Enviar')
+        assert driver.scripts == [(RESOLVE_JS, ('any', self.CHAIN.value, 'present'))]
+
+    def test_wait_uses_script_for_framework_strategies(self):
+        """Estratégias sem equivalente no WebDriver devem ser aguardadas por script"""
+        driver = ScriptDriver({PROBE_JS: 'botao'})
+        driver.wait_strategy = 'polling'
+
+        assert BasePage(driver).find_element(self.CHAIN) == 'botao'
+        assert driver.scripts[0][1][:2] == ('any', self.CHAIN.value)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,94 @@
+"""
+Testes dos recursos de Page Object que não dependem de navegador
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from selenium.common.exceptions import StaleElementReferenceException
+
+from automation_framework.web.locators import Locator
+from automation_framework.web.page_object import BasePage
+from fake_driver import FakeDriver
+
+
+class FakeElement:
+    def __init__(self, text):
+        self._text = text
+        self.stale = False
+        self.clicks = 0
+
+    @property
+    def text(self):
+        if self.stale:
+            raise StaleElementReferenceException("obsoleto")
+        return self._text
+
+    def click(self):
+        if self.stale:
+            raise StaleElementReferenceException("obsoleto")
+        self.clicks += 1
+
+
+class FakePageDriver(FakeDriver):
+    """Driver falso que conta localizações"""
+
+    def __init__(self):
+        super().__init__()
+        self.finds = 0
+        self.elements = []
+
+    def find_element(self, by, value):
+        self.finds += 1
+        element = FakeElement(f"{value}#{self.finds}")
+        self.elements.append(element)
+        return element
+
+    def get(self, url, ready=None):
+        self.navigation_count += 1
+
+
+class TestElementCache:
+    TITLE = Locator.id('titulo')
+
+    def test_cache_hits_and_navigation_invalidation(self):
+        """Elemento deve ser reutilizado até a próxima navegação"""
+        driver = FakePageDriver()
+        page = BasePage(driver, cache_elements=True)
+
+        assert page.get_text(self.TITLE) == 'titulo#1'
+        page.click(self.TITLE)
+        assert driver.finds == 1
+        assert page.element_cache.stats()['hits'] == 1
+
+        page.navigate_to('https://exemplo.com/outra')
+        assert page.get_text(self.TITLE) == 'titulo#2'
+        assert page.element_cache.stats()['misses'] == 2
+
+    def test_stale_element_is_resolved_again(self):
+        """Elemento obsoleto deve ser relocalizado de forma transparente"""
+        driver = FakePageDriver()
+        page = BasePage(driver, cache_elements=True)
+
+        page.get_text(self.TITLE)
+        driver.elements[0].stale = True
+        assert page.get_text(self.TITLE) == 'titulo#2'
+        assert page.element_cache.stats()['stale'] == 1
+
+    def test_cache_is_opt_in(self):
+        """Sem cache, cada ação deve localizar o elemento novamente"""
+        driver = FakePageDriver()
+        page = BasePage(driver)
+        assert page.element_cache is None
+
+        driver.get_text = lambda by, value: driver.find_element(by, value).text
+        page.get_text(self.TITLE)
+        page.get_text(self.TITLE)
+        assert driver.finds == 2
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
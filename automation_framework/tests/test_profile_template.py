@@ -0,0 +1,103 @@
+"""
+Testes dos templates de perfil clonados por sessão
+"""
+
+import json
+import os
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from automation_framework.core.exceptions import ConfigurationException
+from automation_framework.web.profile_template import METADATA_FILE, ProfileTemplate
+from fake_driver import FakeDriver
+
+
+@pytest.fixture
+def template_dir(tmp_path):
+    path = tmp_path / 'perfil'
+    (path / 'Default' / 'Cache').mkdir(parents=True)
+    (path / 'Default' / 'Preferences').write_text('{"x": 1}')
+    (path / 'Default' / 'Cache' / 'entrada_0').write_bytes(b'cache')
+    (path / 'SingletonLock').symlink_to('host-123')
+    (path / 'lockfile').write_text('')
+    (path / METADATA_FILE).write_text(json.dumps({'cold_start_seconds': 30.0}))
+    return path
+
+
+class FakeProfileDriver(FakeDriver):
+    """Registra o user_data_dir usado na criação da sessão"""
+
+    def __init__(self, config):
+        super().__init__({'headless': True, **config})
+        self.created_with = None
+
+    def _create_driver(self):
+        self.created_with = self.config.get('user_data_dir')
+        self.driver = StubSession()
+
+
+class StubSession:
+    def set_page_load_timeout(self, timeout):
+        pass
+
+    def quit(self):
+        pass
+
+
+class TestProfileTemplate:
+    def test_copy_clone_skips_locks(self, template_dir):
+        """Clone deve conter o perfil sem arquivos de trava nem metadados"""
+        template = ProfileTemplate(str(template_dir), clone_method='copy')
+        clone = template.clone()
+        try:
+            assert (clone / 'Default' / 'Preferences').read_text() == '{"x": 1}'
+            assert not (clone / 'SingletonLock').is_symlink()
+            assert not (clone / 'lockfile').exists()
+            assert not (clone / METADATA_FILE).exists()
+            assert clone.parent == template.clones_dir
+        finally:
+            ProfileTemplate.remove_clone(clone)
+        assert not clone.exists()
+
+    def test_caches_are_not_shared(self, template_dir):
+        """Caches são alterados no lugar: escrita no clone não deve afetar o template"""
+        clone = ProfileTemplate(str(template_dir), clone_method='copy').clone()
+        cache_file = clone / 'Default' / 'Cache' / 'entrada_0'
+        assert os.stat(cache_file).st_ino != os.stat(template_dir / 'Default' / 'Cache' / 'entrada_0').st_ino
+        with open(cache_file, 'r+b') as f:
+            f.write(b'alterado')
+        assert b'alterado' not in (template_dir / 'Default' / 'Cache' / 'entrada_0').read_bytes()
+        ProfileTemplate.remove_clone(clone)
+
+    def test_invalid_configuration(self, tmp_path, template_dir):
+        """Template inexistente ou método inválido devem falhar na configuração"""
+        with pytest.raises(ConfigurationException):
+            ProfileTemplate(str(tmp_path / 'nao-existe'))
+        with pytest.raises(ConfigurationException):
+            ProfileTemplate(str(template_dir), clone_method='overlay')
+        with pytest.raises(ConfigurationException):
+            ProfileTemplate(str(template_dir), clone_method='hardlink')
+
+    def test_driver_uses_clone_and_cleans_up(self, template_dir):
+        """Cada sessão deve usar um clone próprio, removido no quit()"""
+        config = {'profile_template': str(template_dir), 'profile_clone_method': 'copy'}
+        first, second = FakeProfileDriver(config), FakeProfileDriver(config)
+        first.initialize()
+        second.initialize()
+
+        assert first.created_with != second.created_with
+        assert Path(first.created_with).is_dir()
+        assert first.profile_stats['cold_start_seconds'] == 30.0
+        assert first.profile_stats['time_saved_seconds'] > 0
+
+        first.quit()
+        assert not Path(first.created_with).exists()
+        assert Path(second.created_with).exists()
+        second.quit()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,95 @@
+"""
+Testes do motor de prontidão de página
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from selenium.common.exceptions import WebDriverException
+
+from automation_framework.web import scripts
+from automation_framework.web.driver_manager import ChromeWebDriver
+from automation_framework.web.locators import Locator
+from automation_framework.web.readiness import DomContentLoaded, LocatorPresent, resolve_signal
+
+
+class FakeNavigationDriver:
+    """Simula o WebDriver do Selenium registrando navegação e scripts"""
+
+    def __init__(self, async_results=()):
+        self.calls = []
+        self.async_results = list(async_results)
+
+    def get(self, url):
+        self.calls.append(('get', url))
+
+    def set_script_timeout(self, timeout):
+        pass
+
+    def execute_script(self, script, *args):
+        self.calls.append(('script', script, args))
+        return True
+
+    def execute_async_script(self, script, *args):
+        self.calls.append(('async', script, args))
+        result = self.async_results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def make_driver(async_results=(), **config):
+    driver = ChromeWebDriver({'page_load_strategy': 'eager', **config})
+    driver.driver = FakeNavigationDriver(async_results)
+    return driver
+
+
+class TestReadiness:
+    def test_resolve_signal(self):
+        """Nomes, sinais e Locators devem virar ReadinessSignal"""
+        assert isinstance(resolve_signal('dom_content_loaded'), DomContentLoaded)
+        assert resolve_signal('network_idle', quiet_ms=250).options() == {'quietMs': 250}
+        signal = resolve_signal(Locator.id('painel'))
+        assert isinstance(signal, LocatorPresent)
+        assert signal.options() == {'by': 'id', 'value': 'painel', 'condition': 'present'}
+        with pytest.raises(ValueError):
+            resolve_signal('idle')
+
+    def test_strategy_applied_to_options(self):
+        """page_load_strategy deve ir para as opções do navegador"""
+        options = ChromeWebDriver({'page_load_strategy': 'none'})._create_options()
+        assert options.page_load_strategy == 'none'
+
+    def test_get_waits_for_configured_signal(self):
+        """get() deve marcar o documento anterior e aguardar o sinal configurado"""
+        driver = make_driver([True], ready_signal='network_idle', network_quiet_ms=300)
+        driver.get('https://exemplo.com/painel')
+
+        kinds = [call[0] for call in driver.driver.calls]
+        assert kinds == ['script', 'get', 'async']
+        signal_name, options, _ = driver.driver.calls[2][2]
+        assert signal_name == 'network_idle'
+        assert options == {'quietMs': 300, 'url': 'https://exemplo.com/painel'}
+        assert driver.navigation_count == 1
+
+    def test_locator_signal_and_polling_fallback(self):
+        """Scripts interrompidos devem cair para a verificação por polling"""
+        driver = make_driver([WebDriverException('document unloaded')] * 3)
+        assert driver.wait_until_ready(Locator.css_selector('#app'), timeout=2) is True
+
+        last = driver.driver.calls[-1]
+        assert last[1] == scripts.READY_CHECK_JS
+        assert last[2][0] == 'locator'
+
+    def test_no_signal_keeps_plain_get(self):
+        """Sem sinal configurado, get() não deve executar scripts extras"""
+        driver = make_driver()
+        driver.get('https://exemplo.com')
+        assert driver.driver.calls == [('get', 'https://exemplo.com')]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,113 @@
+"""
+Testes da política de bloqueio de recursos
+"""
+
+import json
+import pytest
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from automation_framework.core.exceptions import ConfigurationException
+from automation_framework.web.driver_manager import ChromeWebDriver
+from automation_framework.web.resource_policy import ResourcePolicy, wildcard_to_regex
+
+
+class FakeChromium:
+    """Registra comandos CDP e devolve um log de performance pré-definido"""
+
+    def __init__(self, log):
+        self.cdp = []
+        self.log = log
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp.append((command, params))
+
+    def get_log(self, name):
+        entries, self.log = self.log, []
+        return entries
+
+
+def failed(resource_type, reason='inspector'):
+    params = {'requestId': '1', 'type': resource_type, 'errorText': 'net::ERR_BLOCKED_BY_CLIENT'}
+    if reason:
+        params['blockedReason'] = reason
+    return {'message': json.dumps({'message': {'method': 'Network.loadingFailed', 'params': params}})}
+
+
+class TestResourcePolicy:
+    def test_empty_config_disables_policy(self):
+        """Sem tipos nem padrões não deve haver política"""
+        assert ResourcePolicy.from_config({}) is None
+        assert ResourcePolicy.from_config({'block_types': [], 'block_patterns': []}) is None
+        with pytest.raises(ConfigurationException):
+            ResourcePolicy(block_types=['videos'])
+
+    def test_chrome_options_and_devtools(self):
+        """Chrome deve receber preferência de imagens, log de performance e URLs bloqueadas"""
+        driver = ChromeWebDriver({'resource_policy': {
+            'block_types': ['image', 'font'],
+            'block_patterns': ['*://*.doubleclick.net/*'],
+        }})
+        options = driver._create_options()
+        assert options.experimental_options['prefs']['profile.managed_default_content_settings.images'] == 2
+        assert options.to_capabilities()['goog:loggingPrefs'] == {'performance': 'ALL'}
+        assert options.experimental_options['perfLoggingPrefs'] == {'enableNetwork': True, 'enablePage': False}
+
+        selenium_driver = FakeChromium([failed('Image'), failed('Image'), failed('Font'), failed('XHR', None)])
+        driver.resource_policy.install(selenium_driver, 'chrome')
+        command, params = selenium_driver.cdp[1]
+        assert command == 'Network.setBlockedURLs'
+        assert '*://*.doubleclick.net/*' in params['urls']
+        assert '*.woff2?*' in params['urls']
+
+        driver.driver = selenium_driver
+        stats = driver.resource_stats()
+        assert stats['blocked_requests'] == 3
+        assert stats['blocked_by_type'] == {'Image': 2, 'Font': 1}
+        assert stats['estimated_bytes_saved'] > 0
+
+    def test_log_is_drained_on_navigation(self):
+        """O log de performance deve ser esvaziado periodicamente durante a sessão"""
+        driver = ChromeWebDriver({'resource_policy': {'block_types': ['image'], 'collect_every': 2}})
+        selenium_driver = FakeChromium([failed('Image')])
+        selenium_driver.get = lambda url: None
+        driver.resource_policy.install(selenium_driver, 'chrome')
+        driver.driver = selenium_driver
+
+        driver.get('https://exemplo.com/a')
+        assert selenium_driver.log != []
+        driver.get('https://exemplo.com/b')
+        assert selenium_driver.log == []
+        assert driver.resource_policy.blocked_requests == 1
+
+    def test_firefox_extension(self):
+        """Firefox deve usar extensão temporária com as regras da política"""
+        policy = ResourcePolicy(block_types=['media'], block_patterns=['*analytics*'])
+        directory = policy.build_firefox_extension()
+        try:
+            manifest = json.loads((directory / 'manifest.json').read_text(encoding='utf-8'))
+            background = (directory / 'background.js').read_text(encoding='utf-8')
+            assert 'webRequestBlocking' in manifest['permissions']
+            assert '"media"' in background
+            if shutil.which('node'):
+                result = subprocess.run(['node', '--check', str(directory / 'background.js')],
+                                        capture_output=True, text=True)
+                assert result.returncode == 0, result.stderr
+        finally:
+            policy.close()
+        assert not directory.exists()
+
+    def test_wildcard_patterns(self):
+        """Padrões com '*' devem casar a URL inteira"""
+        regex = re.compile(wildcard_to_regex('*://*.doubleclick.net/*'))
+        assert regex.match('https://ad.doubleclick.net/pixel?x=1')
+        assert not regex.match('https://exemplo.com/doubleclick')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,180 @@
+"""
+Testes da cura automática de localizadores
+"""
+
+import json
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from automation_framework.core.exceptions import ElementNotFound
+from automation_framework.web.locators import Locator
+from automation_framework.web.page_object import BasePage
+from automation_framework.web.self_healing import HealingStore, LocatorHealer, healing_candidates, similarity
+from fake_driver import FakeDriver
+
+
+BUTTON = {
+    'tag': 'button', 'id': 'enviar', 'classes': ['btn', 'btn-primary'],
+    'attributes': {'data-testid': 'login-submit', 'type': 'submit'},
+    'text': 'Entrar', 'index': 1, 'parent': {'tag': 'form', 'id': 'login', 'classes': []},
+}
+
+
+class FakeElement:
+    def __init__(self, fingerprint):
+        self.fingerprint = fingerprint
+        self.clicks = 0
+
+    def click(self):
+        self.clicks += 1
+
+
+class FakeDomDriver(FakeDriver):
+    """Driver falso: `dom` mapeia (by, value) para o elemento encontrado"""
+
+    def __init__(self, dom):
+        super().__init__({'implicit_wait': 0.3})
+        self.dom = dom
+        self.calls = 0
+
+    def execute_script(self, script, *args):
+        by, value, condition = args
+        self.calls += 1
+        alternatives = value if by == 'any' else [(by, value)]
+        return [{'element': self.dom[tuple(alternative)], 'index': index,
+                 'fingerprint': self.dom[tuple(alternative)].fingerprint}
+                for index, alternative in enumerate(alternatives) if tuple(alternative) in self.dom]
+
+
+class LoginPage(BasePage):
+    SUBMIT = Locator.id('enviar')
+
+
+KEY = f"{__name__}.LoginPage.SUBMIT"
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    return str(tmp_path / 'healing.json')
+
+
+def new_page(driver, store_path):
+    """Página com memória lida do disco (como em uma nova execução)"""
+    page = LoginPage(driver, self_healing=True)
+    page.healer = LocatorHealer(HealingStore(store_path))
+    return page
+
+
+class TestCandidates:
+    def test_ranked_candidates(self):
+        """Atributos de teste vêm primeiro e a estrutura por último"""
+        candidates = healing_candidates(BUTTON)
+        assert candidates[0] is Locator.css_selector('[data-testid="login-submit"]')
+        assert candidates[1] is Locator.id('enviar')
+        assert Locator.text('Entrar') in candidates
+        assert candidates[-2] is Locator.css_selector('[id="login"] > button:nth-of-type(1)')
+        assert candidates[-1] is Locator.css_selector('button.btn.btn-primary')
+
+    def test_similarity(self):
+        """Elementos de outra tag ou muito diferentes não devem ser aceitos"""
+        renamed = {**BUTTON, 'id': 'login-btn'}
+        assert similarity(BUTTON, renamed) > 0.7
+        assert similarity(BUTTON, {**BUTTON, 'tag': 'a'}) == 0
+        other = {'tag': 'button', 'id': 'cancelar', 'classes': ['link'], 'attributes': {},
+                 'text': 'Cancelar', 'index': 2, 'parent': {'tag': 'div'}}
+        assert similarity(BUTTON, other) < 0.5
+
+
+class TestLocatorHealer:
+    def test_heals_and_remembers_working_strategy(self, store_path):
+        """Localizador quebrado deve ser curado e a estratégia reutilizada nas próximas execuções"""
+        original = FakeElement(BUTTON)
+        first = FakeDomDriver({('id', 'enviar'): original})
+        new_page(first, store_path).click(LoginPage.SUBMIT)
+        assert original.clicks == 1
+        stored = json.loads(Path(store_path).read_text())[KEY]
+        assert stored['healed'] is None
+        assert stored['fingerprint']['id'] == 'enviar'
+
+        # Nova versão da interface: id trocado, data-testid mantido
+        renamed = FakeElement({**BUTTON, 'id': 'login-btn'})
+        second = FakeDomDriver({('css selector', '[data-testid="login-submit"]'): renamed})
+        new_page(second, store_path).click(LoginPage.SUBMIT)
+        assert renamed.clicks == 1
+        assert second.calls == 1
+        stored = json.loads(Path(store_path).read_text())[KEY]
+        assert stored['healed'] == ['css selector', '[data-testid="login-submit"]']
+
+        third = FakeDomDriver({('css selector', '[data-testid="login-submit"]'): renamed})
+        assert new_page(third, store_path).find_element(LoginPage.SUBMIT) is renamed
+        assert third.calls == 1
+
+    def test_dissimilar_match_is_rejected(self, store_path):
+        """Alternativa que encontra um elemento diferente não deve ser aceita"""
+        new_page(FakeDomDriver({('id', 'enviar'): FakeElement(BUTTON)}), store_path).find_element(LoginPage.SUBMIT)
+        stranger = FakeElement({'tag': 'button', 'id': 'ajuda', 'classes': ['btn', 'btn-primary'],
+                                'attributes': {}, 'text': 'Ajuda', 'index': 3, 'parent': {'tag': 'nav'}})
+        driver = FakeDomDriver({('css selector', 'button.btn.btn-primary'): stranger})
+
+        with pytest.raises(ElementNotFound):
+            new_page(driver, store_path).find_element(LoginPage.SUBMIT)
+        assert json.loads(Path(store_path).read_text())[KEY]['healed'] is None
+
+    def test_rejected_candidate_does_not_hide_later_match(self, store_path):
+        """Alternativa gerada rejeitada não deve impedir a aceitação de uma alternativa seguinte"""
+        new_page(FakeDomDriver({('id', 'enviar'): FakeElement(BUTTON)}), store_path).find_element(LoginPage.SUBMIT)
+        stranger = FakeElement({'tag': 'button', 'id': 'ajuda', 'classes': [], 'attributes': {},
+                                'text': 'Ajuda', 'index': 3, 'parent': {'tag': 'nav'}})
+        renamed = FakeElement({**BUTTON, 'id': 'login-btn', 'attributes': {'type': 'submit'}})
+        driver = FakeDomDriver({('css selector', '[data-testid="login-submit"]'): stranger,
+                                ('css selector', 'button.btn.btn-primary'): renamed})
+
+        assert new_page(driver, store_path).find_element(LoginPage.SUBMIT) is renamed
+        assert driver.calls == 1
+        assert json.loads(Path(store_path).read_text())[KEY]['healed'] == ['css selector', 'button.btn.btn-primary']
+
+    def test_pages_with_same_name_in_other_modules_are_separate(self, store_path):
+        """Páginas homônimas de módulos diferentes não devem compartilhar a memória"""
+        other = type('LoginPage', (BasePage,), {'SUBMIT': Locator.id('enviar'), '__module__': 'outro.modulo'})
+        driver = FakeDomDriver({('id', 'enviar'): FakeElement(BUTTON)})
+        new_page(driver, store_path).find_element(LoginPage.SUBMIT)
+        page = other(driver, self_healing=True)
+        page.healer = LocatorHealer(HealingStore(store_path))
+        page.find_element(other.SUBMIT)
+
+        assert set(json.loads(Path(store_path).read_text())) == {KEY, 'outro.modulo.LoginPage.SUBMIT'}
+
+    def test_changed_locator_discards_memory(self, store_path):
+        """Entrada de um localizador alterado no código deve ser ignorada"""
+        store = HealingStore(store_path)
+        store.put(KEY, Locator.id('antigo'), BUTTON, Locator.id('curado'))
+        assert store.get(KEY, Locator.id('enviar')) is None
+        assert store.get(KEY, Locator.id('antigo'))['healed'] == ['id', 'curado']
+
+    def test_dynamic_text_does_not_rewrite_store(self, store_path, monkeypatch):
+        """Mudança só no texto do elemento não deve gravar o arquivo"""
+        new_page(FakeDomDriver({('id', 'enviar'): FakeElement(BUTTON)}), store_path).find_element(LoginPage.SUBMIT)
+        writes = []
+        monkeypatch.setattr(HealingStore, 'put', lambda self, *args: writes.append(args))
+
+        counter = FakeElement({**BUTTON, 'text': 'Entrar (3)'})
+        new_page(FakeDomDriver({('id', 'enviar'): counter}), store_path).find_element(LoginPage.SUBMIT)
+        assert writes == []
+
+    def test_parallel_stores_merge_entries(self, store_path):
+        """Gravações de instâncias diferentes (outros processos) não devem se sobrescrever"""
+        first, second = HealingStore(store_path), HealingStore(store_path)
+        first.get(KEY, Locator.id('enviar'))
+        second.get(KEY, Locator.id('enviar'))
+
+        first.put(KEY, Locator.id('enviar'), BUTTON, None)
+        second.put('MenuPage.SAIR', Locator.id('sair'), {**BUTTON, 'id': 'sair'}, None)
+
+        assert set(json.loads(Path(store_path).read_text())) == {KEY, 'MenuPage.SAIR'}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,196 @@
+"""
+Testes do cache de estado de sessão (cookies e storage)
+"""
+
+import os
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from automation_framework.utils.credentials import CredentialManager
+from automation_framework.web.driver_manager import DriverManager
+from automation_framework.web.session_state import SessionStateCache
+from fake_driver import FakeDriver
+
+
+COOKIE = {'name': 'sid', 'value': 'abc', 'domain': 'app.exemplo.com', 'path': '/',
+          'secure': True, 'httpOnly': True, 'sameSite': 'Lax', 'expiry': 1999999999}
+
+
+class FakeBrowser:
+    """WebDriver do Selenium simulado, sem DevTools (ex: Firefox)"""
+
+    def __init__(self):
+        self.cdp_calls = []
+        self.cookies = []
+
+    def get_cookies(self):
+        return [COOKIE]
+
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie)
+
+
+class FakeChromium(FakeBrowser):
+    def execute_cdp_cmd(self, command, params):
+        self.cdp_calls.append((command, params))
+        return {'identifier': '7'}
+
+
+class FakeStateDriver(FakeDriver):
+    def __init__(self, cdp=True):
+        super().__init__({}, FakeChromium() if cdp else FakeBrowser())
+        self.visited = []
+        self.scripts = []
+        self.resets = 0
+
+    def get(self, url, ready=None):
+        self.visited.append(url)
+
+    def execute_script(self, script, *args):
+        self.scripts.append(args)
+        return {'origin': 'https://app.exemplo.com', 'local': {'token': 'xyz'}, 'session': {}}
+
+    def reset_state(self, blank_url="about:blank"):
+        self.resets += 1
+
+
+@pytest.fixture
+def cache(tmp_path):
+    credentials = CredentialManager()
+    credentials.set_credential('app_user', 'maria:senha')
+    return SessionStateCache(cache_dir=str(tmp_path / 'estado'), ttl=3600, credentials=credentials)
+
+
+class TestSessionStateCache:
+    def test_capture_is_private_and_keyed_by_credential(self, cache):
+        """Estado deve ser gravado com 0600 e depender do valor da credencial"""
+        cache.capture(FakeStateDriver(), 'app_user')
+        path = cache._path('app_user')
+        assert oct(os.stat(path).st_mode & 0o777) == '0o600'
+        assert 'app_user' not in path.name
+
+        state = cache.load('app_user')
+        assert state.local_storage == {'token': 'xyz'}
+        assert state.cookies == [COOKIE]
+
+        cache.credentials.set_credential('app_user', 'maria:nova-senha')
+        assert cache.load('app_user') is None
+
+    def test_ttl_expiration(self, cache):
+        """Estados expirados devem ser descartados"""
+        cache.capture(FakeStateDriver(), 'app_user')
+        cache.ttl = 0.000001
+        assert cache.load('app_user') is None
+        assert not cache._path('app_user').exists()
+
+    def test_restore_with_devtools_skips_navigation(self, cache):
+        """No Chromium a restauração não deve navegar"""
+        cache.capture(FakeStateDriver(), 'app_user')
+        driver = FakeStateDriver()
+
+        assert cache.restore(driver, 'app_user') is True
+        assert driver.visited == []
+        command, params = driver.driver.cdp_calls[0]
+        assert command == 'Network.setCookies'
+        assert params['cookies'][0]['expires'] == 1999999999
+        assert driver.driver.cdp_calls[1][0] == 'Page.addScriptToEvaluateOnNewDocument'
+
+    def test_restore_without_devtools_opens_origin(self, cache):
+        """Fora do Chromium a origem deve ser aberta antes de aplicar o estado"""
+        cache.capture(FakeStateDriver(), 'app_user')
+        driver = FakeStateDriver(cdp=False)
+
+        assert cache.restore(driver, 'app_user') is True
+        assert driver.visited == ['https://app.exemplo.com/favicon.ico']
+        assert driver.driver.cookies == [COOKIE]
+        assert driver.scripts[-1][1] == {'token': 'xyz'}
+
+    def test_logged_out_session_is_invalidated(self, cache):
+        """Sessão restaurada sem login deve ser invalidada e o login refeito"""
+        cache.capture(FakeStateDriver(), 'app_user')
+        driver = FakeStateDriver()
+        logins = []
+
+        restored = cache.restore_or_login(driver, 'app_user', 'https://app.exemplo.com/painel',
+                                          login=lambda: logins.append(1), is_logged_in=lambda: False)
+        assert restored is False
+        assert logins == [1]
+        assert driver.resets == 1
+        assert ('Page.removeScriptToEvaluateOnNewDocument', {'identifier': '7'}) in driver.driver.cdp_calls
+        assert cache.load('app_user') is not None
+
+        restored = cache.restore_or_login(FakeStateDriver(), 'app_user', 'https://app.exemplo.com/painel',
+                                          login=lambda: logins.append(2), is_logged_in=lambda: True)
+        assert restored is True
+        assert logins == [1]
+
+
+class InitializedStateDriver(FakeStateDriver):
+    """Driver criado pelo DriverManager nos testes"""
+
+    def __init__(self, config):
+        super().__init__()
+        self.quits = 0
+
+    def initialize(self):
+        pass
+
+    def quit(self):
+        self.quits += 1
+
+
+class TestManagerRestore:
+    @pytest.fixture
+    def manager(self, cache, monkeypatch):
+        manager = DriverManager()
+        monkeypatch.setattr(DriverManager, '_session_state', cache)
+        monkeypatch.setattr(DriverManager, '_get_driver_class', lambda self, browser_type: InitializedStateDriver)
+        yield manager
+        with DriverManager._sessions_lock:
+            DriverManager._sessions.pop('estado', None)
+
+    def test_restore_removes_script_and_checks_login(self, manager, cache):
+        """Restauração pelo gerenciador deve usar o cache compartilhado e remover o script após navegar"""
+        cache.capture(FakeStateDriver(), 'app_user')
+        driver = manager.initialize_browser(session='estado', credential_id='app_user', is_logged_in=lambda: True)
+
+        assert manager.session_state_cache() is cache
+        assert driver.visited == ['https://app.exemplo.com']
+        assert ('Page.removeScriptToEvaluateOnNewDocument', {'identifier': '7'}) in driver.driver.cdp_calls
+        assert cache._pending_scripts == {}
+
+    def test_logged_out_state_is_invalidated_and_login_runs(self, manager, cache):
+        """Estado de sessão caída deve ser invalidado e o login executado e capturado"""
+        cache.capture(FakeStateDriver(), 'app_user')
+        logins = []
+        driver = manager.initialize_browser(session='estado', credential_id='app_user',
+                                            is_logged_in=lambda: False, login=logins.append)
+        assert logins == [driver]
+        assert driver.resets == 1
+        assert cache.load('app_user') is not None  # recapturado após o login
+
+    def test_failed_login_quits_new_driver(self, manager, cache):
+        """Falha no login deve encerrar o navegador recém-criado em vez de deixá-lo órfão"""
+        created = []
+
+        def failing_login(driver):
+            created.append(driver)
+            raise RuntimeError('login recusado')
+
+        with pytest.raises(RuntimeError):
+            manager.initialize_browser(session='estado', credential_id='app_user',
+                                       is_logged_in=lambda: False, login=failing_login)
+        assert created[0].quits == 1
+        assert not manager.has_session('estado')
+
+    def test_credential_requires_login_check(self, manager):
+        """credential_id sem verificação de login deve ser recusado"""
+        with pytest.raises(ValueError):
+            manager.initialize_browser(session='estado', credential_id='app_user')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
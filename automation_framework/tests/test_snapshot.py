@@ -0,0 +1,100 @@
+"""
+Testes do snapshot do DOM para consultas offline
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+pytest.importorskip('lxml')
+pytest.importorskip('cssselect')
+
+from automation_framework.core.exceptions import ElementNotFound
+from automation_framework.web.locators import Locator
+from automation_framework.web.page_object import BasePage
+from automation_framework.web.snapshot import DomSnapshot
+
+
+HTML = """
+<html><head><title>Produtos</title><style>.x { color: red }</style></head>
+<body>
+  <h1 id="titulo">Lista de   produtos</h1>
+  <a href="/ajuda" class="link ajuda">Central de ajuda</a>
+  <input name="q" value="caneta">
+  <ul class="produtos">
+    <li class="produto" data-sku="A1">Caneta <script>track()</script>azul</li>
+    <li class="produto" data-sku="B2">Lápis</li>
+  </ul>
+</body></html>
+"""
+
+
+class TestDomSnapshot:
+    def setup_method(self):
+        self.snapshot = DomSnapshot(HTML)
+
+    def test_locator_strategies(self):
+        """Todas as estratégias de Locator devem ser resolvidas localmente"""
+        assert self.snapshot.get_text(Locator.id('titulo')) == 'Lista de produtos'
+        assert self.snapshot.get_attribute(Locator.name('q'), 'value') == 'caneta'
+        assert self.snapshot.get_texts(Locator.css_selector('ul.produtos > li')) == ['Caneta azul', 'Lápis']
+        assert len(self.snapshot.find_elements(Locator.class_name('produto'))) == 2
+        assert self.snapshot.get_text(Locator.xpath("//li[@data-sku='B2']")) == 'Lápis'
+        assert self.snapshot.exists(Locator.tag_name('h1'))
+        assert self.snapshot.get_attribute(Locator.link_text('Central de ajuda'), 'href') == '/ajuda'
+        assert self.snapshot.exists(Locator.partial_link_text('ajuda'))
+
+    def test_text_and_fallback_chain(self):
+        """Estratégia de texto e alternativas devem seguir a ordem de preferência"""
+        assert self.snapshot.find_element(Locator.text('Lista de produtos')).tag_name == 'h1'
+        chain = Locator.id('banner').or_text('Lápis').or_css('li.produto')
+        assert [element.get_attribute('data-sku') for element in self.snapshot.find_elements(chain)] == ['B2', 'A1']
+
+    def test_bulk_extraction(self):
+        """Extração em lote deve seguir o formato de read_elements"""
+        items = self.snapshot.extract(Locator.class_name('produto'), attributes=['data-sku'])
+        assert [item['attributes']['data-sku'] for item in items] == ['A1', 'B2']
+
+        result = self.snapshot.read_elements(
+            {'titulo': Locator.id('titulo'), 'banner': Locator.id('banner')}, attributes=['id']
+        )
+        assert result['titulo'] == {'present': True, 'text': 'Lista de produtos',
+                                    'attributes': {'id': 'titulo'}, 'properties': {}}
+        assert result['banner']['present'] is False
+
+    def test_missing_and_nested(self):
+        """Elementos ausentes devem lançar ElementNotFound; buscas relativas devem funcionar"""
+        with pytest.raises(ElementNotFound):
+            self.snapshot.get_text(Locator.id('inexistente'))
+        lista = self.snapshot.find_element(Locator.css_selector('ul'))
+        assert lista.find_element(Locator.xpath("./li[2]")).text == 'Lápis'
+
+
+class SourceDriver:
+    session_name = None
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_page_source(self):
+        self.calls += 1
+        return HTML
+
+    def get_current_url(self):
+        return 'https://exemplo.com/produtos'
+
+
+def test_page_snapshot_uses_single_source_call():
+    """BasePage.snapshot() deve ler o código-fonte uma única vez"""
+    driver = SourceDriver()
+    snapshot = BasePage(driver).snapshot()
+    snapshot.get_text(Locator.id('titulo'))
+    snapshot.get_texts(Locator.class_name('produto'))
+    assert driver.calls == 1
+    assert snapshot.url == 'https://exemplo.com/produtos'
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,111 @@
+"""
+Testes da linha do tempo de inicialização dos navegadores
+"""
+
+import pytest
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from automation_framework.core.exceptions import BrowserException
+from automation_framework.web.timeline import StartupTimeline, TimelineRecorder, percentile, startup_recorder
+from fake_driver import FakeDriver
+
+
+class StubService:
+    """Serviço do driver simulado (o construtor do WebDriver chama start)"""
+
+    def start(self):
+        time.sleep(0.02)
+
+
+class StubSession:
+    def __init__(self, service, options):
+        service.start()
+        time.sleep(0.01)
+
+    def maximize_window(self):
+        pass
+
+    def set_page_load_timeout(self, timeout):
+        pass
+
+    def quit(self):
+        pass
+
+
+class FakeTimedDriver(FakeDriver):
+    def __init__(self, config=None, fail=False):
+        super().__init__({'headless': True, **(config or {})})
+        self.fail = fail
+
+    def _create_driver(self):
+        if self.fail:
+            raise RuntimeError("navegador não abriu")
+        self.driver = self._launch_browser(StubSession, StubService(), None)
+
+
+@pytest.fixture(autouse=True)
+def clean_recorder():
+    startup_recorder.clear()
+    yield
+    startup_recorder.clear()
+
+
+class TestStartupTimeline:
+    def test_percentile_nearest_rank(self):
+        """Percentil deve usar o método nearest-rank"""
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 95) == 95
+        assert percentile([3.0], 95) == 3.0
+        assert percentile([], 50) == 0.0
+
+    def test_recorder_stats(self):
+        """Estatísticas devem agregar fases repetidas por sessão e o total"""
+        recorder = TimelineRecorder()
+        for index in range(20):
+            timeline = StartupTimeline('chrome', f"s{index}")
+            timeline.record('driver_spawn', timeline.started, 0.001 * (index + 1))
+            timeline.record('driver_spawn', timeline.started, 0.001)
+            timeline.finish()
+            recorder.add(timeline)
+
+        stats = recorder.stats()
+        assert stats['driver_spawn']['count'] == 20
+        assert stats['driver_spawn']['p50_ms'] == 11.0
+        assert stats['driver_spawn']['p95_ms'] == 20.0
+        assert stats['total']['count'] == 20
+        assert len(recorder.timelines('s3')) == 1
+
+    def test_initialize_records_phases(self):
+        """initialize() deve separar processo do driver e abertura do navegador"""
+        driver = FakeTimedDriver()
+        driver.session_name = 'worker-1'
+        driver.initialize()
+
+        timeline = driver.timeline
+        assert timeline.ok is True
+        assert [phase['name'] for phase in timeline.phases] == \
+            ['driver_spawn', 'browser_launch', 'set_page_load_timeout']
+        assert timeline.duration('driver_spawn') >= 0.02
+        assert 0.01 <= timeline.duration('browser_launch') < 0.02
+
+        record = timeline.to_dict()
+        assert record['session'] == 'worker-1'
+        assert record['phases'][1]['start_ms'] >= record['phases'][0]['start_ms']
+        assert startup_recorder.timelines('worker-1') == [timeline]
+
+    def test_failed_initialize_is_recorded(self):
+        """Falha na inicialização também deve ser registrada"""
+        with pytest.raises(BrowserException):
+            FakeTimedDriver(fail=True).initialize()
+        timelines = startup_recorder.timelines()
+        assert len(timelines) == 1
+        assert timelines[0].ok is False
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,104 @@
+"""
+Testes do rastreador de comandos WebDriver
+Usam o servidor W3C simulado de w3c_stub
+"""
+
+import json
+import pytest
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from automation_framework.web.locators import Locator
+from automation_framework.web.page_object import BasePage
+from automation_framework.web.tracer import DIRECT_CALLER, CommandTracer
+from automation_framework.web.w3c import ELEMENT_KEY
+from fake_driver import FakeDriver
+from w3c_stub import SESSION_ID, StubW3CServer
+
+
+class FakeSelenium:
+    """WebDriver do Selenium simulado: comandos diretos passam por execute()"""
+
+    def __init__(self, url):
+        self.command_executor = SimpleNamespace(client_config=SimpleNamespace(remote_server_addr=url))
+        self.session_id = SESSION_ID
+
+    def execute(self, driver_command, params=None):
+        return {'value': 'Título'}
+
+
+class TracedDriver(FakeDriver):
+    def __init__(self, server):
+        super().__init__({'implicit_wait': 1, 'transport': 'w3c'}, FakeSelenium(server.url))
+
+
+class FormPage(BasePage):
+    SEND = Locator.id('enviar')
+    STATUS = Locator.id('status')
+
+    def submit(self):
+        self.click(self.SEND)
+        return self.get_text(self.STATUS)
+
+    def title(self):
+        return self.driver.driver.execute('getTitle')['value']
+
+
+@pytest.fixture
+def driver():
+    with StubW3CServer() as server:
+        server.routes[('POST', '/execute/sync')] = {ELEMENT_KEY: 'e1'}
+        server.routes[('POST', '/element/e1/click')] = None
+        server.routes[('GET', '/element/e1/text')] = 'Enviado'
+        traced = TracedDriver(server)
+        traced._attach_w3c_client()
+        yield traced
+        traced.quit()
+
+
+class TestCommandTracer:
+    def test_commands_are_attributed_to_page_methods(self, driver):
+        """Comandos devem ser atribuídos ao método do page object concreto"""
+        page = FormPage(driver)
+        with driver.trace() as tracer:
+            assert page.submit() == 'Enviado'
+            assert page.title() == 'Título'
+            driver.driver.execute('getCurrentUrl')
+
+        callers = [event.caller for event in tracer.events]
+        assert callers == ['FormPage.submit'] * 4 + ['FormPage.title', DIRECT_CALLER]
+        assert tracer.events[1].command == 'POST /element/{id}/click'
+        assert tracer.events[4].transport == 'selenium'
+
+        rows = {row['caller']: row for row in tracer.summary()}
+        assert rows['FormPage.submit']['round_trips'] == 4
+        assert rows['FormPage.submit']['commands']['POST /execute/sync'] == 2
+        assert 'FormPage.submit' in tracer.summary_table()
+
+    def test_stop_restores_driver(self, driver):
+        """Após stop() nenhum comando deve ser interceptado"""
+        tracer = CommandTracer(driver).start()
+        tracer.stop()
+        assert 'execute' not in vars(driver.driver)
+        assert 'execute' not in vars(driver.w3c)
+        driver.get_text('id', 'status')
+        assert tracer.events == []
+
+    def test_chrome_trace_export(self, driver, tmp_path):
+        """Trace exportado deve seguir o formato Trace Event"""
+        with CommandTracer(driver) as tracer:
+            FormPage(driver).submit()
+        path = tmp_path / 'trace.json'
+        tracer.export_chrome_trace(str(path))
+
+        events = json.loads(path.read_text())['traceEvents']
+        assert len(events) == 4
+        assert all(event['ph'] == 'X' and event['dur'] >= 0 for event in events)
+        assert events[0]['cat'] == 'FormPage.submit'
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
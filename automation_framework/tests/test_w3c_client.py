@@ -0,0 +1,103 @@
+"""
+Testes do cliente W3C síncrono e do transporte 'w3c' do BaseWebDriver
+Usam o servidor W3C simulado de w3c_stub
+"""
+
+import pytest
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from selenium.webdriver.remote.webelement import WebElement
+
+from automation_framework.core.exceptions import ElementNotFound, TimeoutException, WebDriverProtocolException
+from automation_framework.web.w3c import ELEMENT_KEY, W3CClient
+from fake_driver import FakeDriver
+from w3c_stub import SESSION_ID, StubW3CServer, W3CError
+
+
+class W3CTransportDriver(FakeDriver):
+    """Driver com transporte W3C apontando para o servidor simulado"""
+
+    def __init__(self, server):
+        super().__init__({'implicit_wait': 1, 'transport': 'w3c'}, server.selenium_driver())
+
+
+@pytest.fixture
+def server():
+    with StubW3CServer() as stub:
+        yield stub
+
+
+class TestW3CClient:
+    def test_keep_alive_and_element_references(self, server):
+        """Comandos devem reutilizar a conexão e converter referências a elementos"""
+        server.routes[('POST', '/elements')] = [{ELEMENT_KEY: 'e1'}, {ELEMENT_KEY: 'e2'}]
+        server.routes[('POST', '/execute/sync')] = lambda payload: payload['args']
+
+        client = W3CClient(server.url, SESSION_ID, make_element=lambda ref: f"<{ref}>",
+                           element_id=lambda value: value[1:-1] if str(value).startswith('<') else None)
+        elements = client.find_elements('name', 'q')
+        echoed = client.execute_script('return arguments;', elements[0], 3)
+        client.close()
+
+        assert elements == ['<e1>', '<e2>']
+        assert echoed == ['<e1>', 3]
+        assert server.commands[1][2]['args'] == [{ELEMENT_KEY: 'e1'}, 3]
+        assert server.connections == 1
+        assert client.connections == 1
+
+    def test_errors_are_mapped(self, server):
+        """Erros W3C devem virar exceções do framework"""
+        server.routes[('POST', '/element/x/click')] = W3CError('no such element')
+        server.routes[('POST', '/element/y/click')] = W3CError('element click intercepted', status=400)
+        client = W3CClient(server.url, SESSION_ID)
+
+        with pytest.raises(ElementNotFound):
+            client.element_click('x')
+        with pytest.raises(WebDriverProtocolException) as error:
+            client.element_click('y')
+        assert error.value.error == 'element click intercepted'
+
+    def test_timeout_is_mapped_and_closes_connection(self, server):
+        """Timeout de socket deve virar TimeoutException e descartar a conexão pendente"""
+        server.routes[('POST', '/element/lento/click')] = lambda payload: time.sleep(1)
+        server.routes[('GET', '/element/e1/text')] = 'ok'
+        client = W3CClient(server.url, SESSION_ID, timeout=0.2)
+
+        with pytest.raises(TimeoutException):
+            client.element_click('lento')
+        assert client.element_text('e1') == 'ok'
+        assert (client.commands, client.connections) == (2, 2)
+        client.close()
+
+
+class TestW3CTransport:
+    def test_hot_commands_use_w3c_client(self, server):
+        """click/type_text/get_text devem ir direto ao driver com elementos do Selenium"""
+        server.routes[('POST', '/execute/sync')] = {ELEMENT_KEY: 'e1'}
+        for command in ('click', 'clear', 'value'):
+            server.routes[('POST', f'/element/e1/{command}')] = None
+        server.routes[('GET', '/element/e1/text')] = 'Enviado'
+
+        driver = W3CTransportDriver(server)
+        driver._attach_w3c_client()
+
+        driver.click('id', 'enviar')
+        driver.type_text('id', 'nome', 'Maria')
+        assert driver.get_text('id', 'status') == 'Enviado'
+        assert isinstance(driver.execute_script('return 1;'), WebElement)
+
+        commands = [command for _, command, _ in server.commands]
+        assert commands[:4] == ['/execute/sync', '/element/e1/click', '/execute/sync', '/element/e1/clear']
+        assert server.commands[4][2] == {'text': 'Maria', 'value': list('Maria')}
+        assert server.connections == 1
+
+        driver.quit()
+        assert driver.w3c is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
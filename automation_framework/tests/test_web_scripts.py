@@ -0,0 +1,249 @@
+"""
+Testes dos scripts injetados e das APIs em lote do BaseWebDriver
+Não dependem de navegador: os scripts são validados com Node.js (se disponível)
+e a execução é simulada por um driver falso
+"""
+
+import pytest
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from automation_framework.web import scripts
+from automation_framework.web.locators import Form, Locator, Table
+from fake_driver import FakeDriver
+
+
+SCRIPT_NAMES = sorted(name for name in dir(scripts) if name.endswith('_JS'))
+
+
+class ScriptedWebDriver(FakeDriver):
+    """Driver falso que responde a execute_script com respostas pré-definidas"""
+
+    def __init__(self, responses=None):
+        super().__init__()
+        self.responses = list(responses or [])
+        self.calls = []
+
+    def execute_script(self, script: str, *args):
+        self.calls.append((script, args))
+        return self.responses.pop(0)
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason="Node.js não disponível")
+@pytest.mark.parametrize('name', SCRIPT_NAMES)
+def test_script_syntax(tmp_path, name):
+    """Scripts injetados devem ser JavaScript válido"""
+    source = tmp_path / f"{name}.js"
+    source.write_text(f"(function () {{\n{getattr(scripts, name)}\n}});\n", encoding='utf-8')
+    result = subprocess.run(['node', '--check', str(source)], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+class TestReadElements:
+    def test_single_script_call_with_presence_flags(self):
+        """Leitura em lote deve usar um único script e marcar ausentes"""
+        driver = ScriptedWebDriver([[
+            {'text': 'Maria', 'attributes': {'href': '/perfil'}, 'properties': {}},
+            None,
+        ]])
+
+        result = driver.read_elements(
+            {'nome': Locator.id('nome'), 'banner': Locator.css_selector('.banner')},
+            attributes=['href'],
+        )
+
+        assert len(driver.calls) == 1
+        assert driver.calls[0][1][0] == [['id', 'nome'], ['css selector', '.banner']]
+        assert result['nome'] == {'present': True, 'text': 'Maria', 'attributes': {'href': '/perfil'}, 'properties': {}}
+        assert result['banner']['present'] is False
+        assert result['banner']['attributes'] == {'href': None}
+
+    def test_list_keys_are_locators(self):
+        """Com lista, as chaves do resultado devem ser os próprios localizadores"""
+        locator = Locator.name('q')
+        driver = ScriptedWebDriver([[{'attributes': {}, 'properties': {'value': 'abc'}}]])
+
+        result = driver.read_elements([locator], properties=['value'], text=False)
+        assert result[locator]['properties']['value'] == 'abc'
+        assert result[locator]['text'] is None
+
+
+class FakeTableBrowser:
+    """Emula TABLE_INFO_JS/TABLE_ROWS_JS sobre linhas em memória (None = linha de cabeçalho)"""
+
+    def __init__(self, headers, rows):
+        self.headers = headers
+        self.rows = [None] + rows
+        self.calls = 0
+
+    def execute_script(self, script, table, *args):
+        self.calls += 1
+        if script == scripts.TABLE_INFO_JS:
+            return {'rows': len(self.rows), 'columns': len(self.headers), 'headers': self.headers}
+        index, limit = args
+        data = []
+        while index < len(self.rows) and len(data) < limit:
+            if self.rows[index] is not None:
+                data.append(self.rows[index])
+            index += 1
+        return {'rows': data, 'next': index, 'done': index >= len(self.rows)}
+
+
+class FakeTableElement:
+    def __init__(self, browser):
+        self.parent = browser
+
+
+class TestTable:
+    def make_table(self, count=25):
+        browser = FakeTableBrowser(['id', 'nome'], [[str(i), f"item {i}"] for i in range(count)])
+        return Table(FakeTableElement(browser)), browser
+
+    def test_iter_rows_in_chunks(self):
+        """Linhas devem ser lidas com uma chamada por bloco"""
+        table, browser = self.make_table(25)
+        rows = list(table.iter_rows(chunk_size=10))
+
+        assert len(rows) == 25
+        assert rows[0] == ['0', 'item 0']
+        assert browser.calls == 3
+
+    @pytest.mark.parametrize('chunk_size', [0, -5])
+    def test_invalid_chunk_size(self, chunk_size):
+        """chunk_size menor que 1 deve ser recusado antes de consultar o navegador"""
+        table, browser = self.make_table(3)
+        with pytest.raises(ValueError):
+            table.iter_rows(chunk_size=chunk_size)
+        assert browser.calls == 0
+
+    def test_dict_rows_and_counts(self):
+        """Linhas como dicionário devem usar os cabeçalhos"""
+        table, browser = self.make_table(3)
+
+        assert table.get_all_dicts()[2] == {'id': '2', 'nome': 'item 2'}
+        assert table.get_row_count() == 4
+        assert table.get_column_count() == 2
+        assert table.get_row_data(0) == []
+        assert table.get_row_data(1) == ['0', 'item 0']
+
+
+class FakeField:
+    def __init__(self):
+        self.typed = []
+
+    def clear(self):
+        self.typed.clear()
+
+    def send_keys(self, text):
+        self.typed.append(text)
+
+
+class FakeFormElement:
+    """Formulário falso: script responde 'ok' e campos digitados são registrados"""
+
+    def __init__(self):
+        self.parent = self
+        self.scripts = []
+        self.fields = {}
+
+    def execute_script(self, script, form, values):
+        self.scripts.append(values)
+        return {name: 'ok' for name in values}
+
+    def find_element(self, by, name):
+        return self.fields.setdefault(name, FakeField())
+
+
+class TestForm:
+    def test_fill_uses_one_script_and_types_flagged_fields(self):
+        """fill() deve usar um único script e digitar apenas campos marcados"""
+        element = FakeFormElement()
+        result = Form(element).fill(
+            {'nome': 'Maria', 'uf': 'SP', 'aceito': True, 'cpf': '12345678900'},
+            keystroke_fields=['cpf'],
+        )
+
+        assert element.scripts == [{'nome': 'Maria', 'uf': 'SP', 'aceito': True}]
+        assert element.fields['cpf'].typed == ['12345678900']
+        assert set(result.values()) == {'ok'}
+
+
+class FakeSeleniumDriver:
+    """Simula a API do Selenium usada pelas esperas"""
+
+    def __init__(self, async_results):
+        self.async_results = list(async_results)
+        self.async_calls = 0
+        self.finds = 0
+        self.script_timeout = None
+
+    def set_script_timeout(self, timeout):
+        self.script_timeout = timeout
+
+    def execute_async_script(self, script, *args):
+        self.async_calls += 1
+        result = self.async_results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def find_element(self, by, value):
+        self.finds += 1
+        return 'elemento-polling'
+
+
+class TestEventWaits:
+    def make_driver(self, async_results):
+        driver = ScriptedWebDriver()
+        driver.wait_strategy = 'event'
+        driver.driver = FakeSeleniumDriver(async_results)
+        return driver
+
+    def test_event_wait_resolves_without_polling(self):
+        """Espera por evento deve retornar o elemento do script assíncrono"""
+        driver = self.make_driver([{'element': 'elemento-evento'}])
+        assert driver.find_element('id', 'x') == 'elemento-evento'
+        assert driver.driver.finds == 0
+        assert driver.driver.script_timeout >= driver.wait_timeout
+
+    def test_event_timeout_raises(self):
+        """Timeout no navegador não deve cair no polling"""
+        from automation_framework.core.exceptions import TimeoutException
+
+        driver = self.make_driver([{'timeout': True}])
+        with pytest.raises(TimeoutException):
+            driver.wait_for_element('id', 'x', timeout=1)
+        assert driver.driver.finds == 0
+
+    def test_interrupted_script_falls_back_to_polling(self):
+        """Scripts interrompidos devem cair para o polling"""
+        from selenium.common.exceptions import WebDriverException
+
+        failures = [WebDriverException('document unloaded')] * 3
+        driver = self.make_driver(failures)
+        assert driver.wait_for_element('id', 'x', timeout=1) == 'elemento-polling'
+        assert driver.driver.async_calls == 3
+
+
+class TestProbes:
+    def test_exists_now_uses_single_script(self):
+        """exists_now deve consultar o DOM uma única vez"""
+        driver = ScriptedWebDriver([None, 'elemento'])
+        assert driver.exists_now('css selector', '.banner') is False
+        assert driver.exists_now('css selector', '.banner', visible=True) is True
+        assert driver.calls[1][1] == ('css selector', '.banner', 'visible')
+
+    def test_expect_absent_returns_when_settled(self):
+        """expect_absent deve usar o estado estável informado pelo navegador"""
+        driver = ScriptedWebDriver()
+        driver.driver = FakeSeleniumDriver([{'present': False, 'settled': True}, {'present': True, 'settled': False}])
+        assert driver.expect_absent('id', 'aviso', timeout=5) is True
+        assert driver.expect_absent('id', 'aviso', timeout=5) is False
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,99 @@
+"""
+Servidor W3C WebDriver mínimo para testes dos clientes HTTP do framework
+Responde comandos de uma sessão fixa com valores pré-definidos por rota
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+
+SESSION_ID = "sessao-stub"
+
+
+class W3CError:
+    """Resposta de erro W3C"""
+
+    def __init__(self, error, message="", status=404):
+        self.error = error
+        self.message = message
+        self.status = status
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        self.server.stub.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _handle(self, method):
+        length = int(self.headers.get('Content-Length') or 0)
+        payload = json.loads(self.rfile.read(length)) if length else None
+        prefix = f"/session/{SESSION_ID}"
+        command = self.path[len(prefix):] if self.path.startswith(prefix) else self.path
+
+        stub = self.server.stub
+        stub.commands.append((method, command, payload))
+        response = stub.routes.get((method, command), W3CError('unknown command', command))
+        if callable(response):
+            response = response(payload)
+
+        status = 200
+        if isinstance(response, W3CError):
+            status = response.status
+            response = {'error': response.error, 'message': response.message, 'stacktrace': ''}
+        body = json.dumps({'value': response}).encode('utf-8')
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def do_DELETE(self):
+        self._handle('DELETE')
+
+
+class StubW3CServer:
+    """
+    Servidor em thread; `routes` mapeia (método, comando relativo à sessão) para um
+    valor, um W3CError ou uma função que recebe o payload
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.commands = []
+        self.connections = 0
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def selenium_driver(self):
+        """Objeto com os atributos do WebDriver do Selenium lidos por remote_endpoint()"""
+        executor = SimpleNamespace(client_config=SimpleNamespace(remote_server_addr=self.url))
+        return SimpleNamespace(command_executor=executor, session_id=SESSION_ID)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._server.shutdown()
+        self._server.server_close()
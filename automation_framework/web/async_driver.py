@@ -0,0 +1,539 @@
+"""
+API web assíncrona (asyncio)
+Os comandos são enviados direto ao chromedriver/geckodriver pelo protocolo W3C
+com HTTP keep-alive, permitindo conduzir várias sessões em um único event loop
+sem uma thread por sessão
+"""
+
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from automation_framework.core.config import ConfigManager
+from automation_framework.core.exceptions import (
+    ElementNotFound,
+    TimeoutException,
+    WebDriverProtocolException,
+)
+from automation_framework.core.logger import Logger
+from automation_framework.web.driver_manager import BaseWebDriver, DriverManager
+from automation_framework.web.locators import SCRIPT_STRATEGIES, Locator
+from automation_framework.web.scripts import (
+    LOCATE_ALL_JS,
+    PROBE_JS,
+    READ_ELEMENTS_JS,
+    WAIT_FOR_ELEMENT_JS,
+    WAIT_FOR_URL_JS,
+)
+from automation_framework.web.w3c import (
+    decode_value,
+    encode_value,
+    parse_response,
+    remote_endpoint,
+    split_url,
+    to_w3c_locator,
+)
+
+
+class AsyncHTTPConnection:
+    """
+    Conexão HTTP/1.1 persistente sobre streams do asyncio
+
+    Requisições são serializadas (o driver atende uma por conexão); se a conexão
+    reaproveitada tiver sido fechada pelo servidor, a requisição é repetida uma vez.
+    """
+
+    def __init__(self, host: str, port: int, timeout: Optional[float] = 300):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.connections = 0
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock = asyncio.Lock()
+
+    async def _connect(self) -> None:
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        self.connections += 1
+
+    async def close(self) -> None:
+        """Fecha a conexão atual"""
+        writer, self._reader, self._writer = self._writer, None, None
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    async def request(self, method: str, path: str, payload: Any = None) -> Tuple[int, bytes]:
+        """
+        Envia requisição JSON
+
+        Returns:
+            Tupla (status HTTP, corpo da resposta)
+        """
+        body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+        head = (
+            f"{method} {path} HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.port}\r\n"
+            "Connection: keep-alive\r\n"
+            "Accept: application/json\r\n"
+            "Content-Type: application/json;charset=UTF-8\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n"
+        ).encode('ascii')
+
+        async with self._lock:
+            for attempt in range(2):
+                reused = self._writer is not None
+                if not reused:
+                    await self._connect()
+                try:
+                    self._writer.write(head + body)
+                    await self._writer.drain()
+                    status, headers, data = await asyncio.wait_for(self._read_response(), self.timeout)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    await self.close()
+                    # Só repete se a falha veio de uma conexão ociosa fechada pelo servidor
+                    if reused and attempt == 0:
+                        continue
+                    raise
+                except asyncio.TimeoutError:
+                    await self.close()
+                    raise TimeoutException(f"Driver não respondeu em {self.timeout}s: {method} {path}")
+                if headers.get('connection', '').lower() == 'close':
+                    await self.close()
+                return status, data
+
+    async def _read_response(self) -> Tuple[int, Dict[str, str], bytes]:
+        status_line = await self._reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Conexão fechada pelo driver")
+        status = int(status_line.split()[1])
+
+        headers = {}
+        while True:
+            line = await self._reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await self._reader.readline()).split(b';')[0], 16)
+                if size == 0:
+                    await self._reader.readline()
+                    break
+                chunks.append(await self._reader.readexactly(size))
+                await self._reader.readline()
+            return status, headers, b''.join(chunks)
+
+        if 'content-length' in headers:
+            return status, headers, await self._reader.readexactly(int(headers['content-length']))
+
+        headers['connection'] = 'close'
+        return status, headers, await self._reader.read()
+
+
+class AsyncWebElement:
+    """Referência assíncrona a um elemento W3C"""
+
+    def __init__(self, driver: 'AsyncBaseWebDriver', element_id: str):
+        self.driver = driver
+        self.id = element_id
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, AsyncWebElement) and other.id == self.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    def __repr__(self) -> str:
+        return f"AsyncWebElement({self.id})"
+
+    async def _command(self, method: str, command: str, payload: Any = None) -> Any:
+        return await self.driver.execute(method, f"/element/{self.id}{command}", payload)
+
+    async def click(self) -> None:
+        await self._command('POST', '/click', {})
+
+    async def clear(self) -> None:
+        await self._command('POST', '/clear', {})
+
+    async def send_keys(self, text: str) -> None:
+        await self._command('POST', '/value', {'text': text})
+
+    async def text(self) -> str:
+        return await self._command('GET', '/text')
+
+    async def get_attribute(self, attribute: str) -> Optional[str]:
+        return await self._command('GET', f"/attribute/{attribute}")
+
+    async def get_property(self, name: str) -> Any:
+        return await self._command('GET', f"/property/{name}")
+
+    async def find_element(self, by: str, value: str) -> 'AsyncWebElement':
+        using, selector = to_w3c_locator(by, value)
+        result = await self._command('POST', '/element', {'using': using, 'value': selector})
+        return self.driver._decode(result)
+
+
+class AsyncBaseWebDriver:
+    """
+    Driver assíncrono sobre uma sessão já iniciada
+
+    A sessão é criada pelo BaseWebDriver (Selenium) para reaproveitar opções,
+    resolução de drivers e retentativas; depois disso todos os comandos usam
+    o cliente HTTP assíncrono.
+    """
+
+    def __init__(self, driver: BaseWebDriver, semaphore: Optional[asyncio.Semaphore] = None):
+        """
+        Args:
+            driver: Driver síncrono já inicializado (dono do processo do navegador)
+            semaphore: Limita comandos simultâneos entre drivers que compartilham o semáforo
+                (esperas no navegador via execute_async_script não ocupam o semáforo)
+        """
+        self.sync_driver = driver
+        self.semaphore = semaphore
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        self.wait_timeout = driver.wait_timeout
+        self.wait_strategy = driver.wait_strategy
+        self.navigation_count = 0
+
+        url, self.session_id = remote_endpoint(driver.driver)
+        host, port, prefix = split_url(url)
+        self._base_path = f"{prefix}/session/{self.session_id}"
+        self._http = AsyncHTTPConnection(host, port)
+        self._script_timeout: Optional[float] = None
+
+    @classmethod
+    async def create(cls, browser_type: Optional[str] = None,
+                     semaphore: Optional[asyncio.Semaphore] = None) -> 'AsyncBaseWebDriver':
+        """
+        Inicia navegador sem bloquear o event loop
+
+        Args:
+            browser_type: Tipo de navegador (padrão: configuração)
+            semaphore: Semáforo compartilhado de comandos simultâneos
+        """
+        browser_config = ConfigManager().get_browser_config()
+        browser_type = (browser_type or browser_config.browser_type).lower()
+
+        def launch() -> BaseWebDriver:
+            driver = DriverManager._get_driver_class(browser_type)(browser_config.__dict__)
+            driver.initialize()
+            return driver
+
+        driver = await asyncio.get_running_loop().run_in_executor(None, launch)
+        return cls(driver, semaphore)
+
+    async def __aenter__(self) -> 'AsyncBaseWebDriver':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.quit()
+
+    def _decode(self, value: Any) -> Any:
+        return decode_value(value, lambda element_id: AsyncWebElement(self, element_id))
+
+    @staticmethod
+    def _encode(value: Any) -> Any:
+        return encode_value(value, lambda item: item.id if isinstance(item, AsyncWebElement) else None)
+
+    async def execute(self, method: str, command: str, payload: Any = None, bounded: bool = True) -> Any:
+        """
+        Envia comando W3C da sessão
+
+        Args:
+            method: Método HTTP
+            command: Caminho relativo à sessão (ex: '/url')
+            payload: Corpo JSON
+            bounded: Se o comando ocupa o semáforo; False para esperas longas no navegador,
+                que não devem bloquear os comandos das demais sessões
+        """
+        path = f"{self._base_path}{command}"
+        if self.semaphore is None or not bounded:
+            status, body = await self._http.request(method, path, payload)
+        else:
+            async with self.semaphore:
+                status, body = await self._http.request(method, path, payload)
+        return parse_response(status, body)
+
+    async def quit(self) -> None:
+        """Encerra a sessão e o navegador"""
+        await self._http.close()
+        await asyncio.get_running_loop().run_in_executor(None, self.sync_driver.quit)
+
+    async def get(self, url: str) -> None:
+        """Navega para URL"""
+        await self.execute('POST', '/url', {'url': url})
+        self.navigation_count += 1
+        self.logger.info(f"Navegou para: {url}")
+
+    async def refresh(self) -> None:
+        """Recarrega página"""
+        await self.execute('POST', '/refresh', {})
+        self.navigation_count += 1
+
+    async def get_current_url(self) -> str:
+        """Retorna URL atual"""
+        return await self.execute('GET', '/url')
+
+    async def get_title(self) -> str:
+        """Retorna título da página"""
+        return await self.execute('GET', '/title')
+
+    async def get_page_source(self) -> str:
+        """Retorna código fonte da página"""
+        return await self.execute('GET', '/source')
+
+    async def execute_script(self, script: str, *args) -> Any:
+        """Executa JavaScript"""
+        result = await self.execute('POST', '/execute/sync', {'script': script, 'args': self._encode(list(args))})
+        return self._decode(result)
+
+    async def execute_async_script(self, script: str, *args) -> Any:
+        """Executa JavaScript assíncrono (último argumento é o callback); não ocupa o semáforo"""
+        result = await self.execute('POST', '/execute/async', {'script': script, 'args': self._encode(list(args))},
+                                    bounded=False)
+        return self._decode(result)
+
+    async def _ensure_script_timeout(self, timeout: float) -> None:
+        """Garante que o timeout de scripts assíncronos comporte a espera"""
+        required = timeout + 5
+        if self._script_timeout is None or self._script_timeout < required:
+            await self.execute('POST', '/timeouts', {'script': int(required * 1000)})
+            self._script_timeout = required
+
+    async def _wait_until_element(self, by: str, value: str, timeout: float,
+                                  condition: str = 'present') -> AsyncWebElement:
+        """
+        Aguarda elemento atingir a condição ('present', 'visible' ou 'clickable')
+
+        Mesma estratégia do BaseWebDriver: espera no navegador com `wait_strategy='event'`
+        e polling (sem bloquear o event loop) como alternativa.
+
+        Raises:
+            TimeoutException: Se a condição não for atingida no tempo
+        """
+        deadline = time.monotonic() + timeout
+        if self.wait_strategy == 'event':
+            for _ in range(3):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    await self._ensure_script_timeout(remaining)
+                    result = await self.execute_async_script(
+                        WAIT_FOR_ELEMENT_JS, by, value, condition, int(remaining * 1000)
+                    )
+                except WebDriverProtocolException as e:
+                    self.logger.debug(f"Espera por evento interrompida, repetindo: {e.error}")
+                    continue
+                if result and result.get('element') is not None:
+                    return result['element']
+                raise TimeoutException(f"Timeout aguardando elemento ({condition}): {by}={value}")
+
+        while True:
+            element = await self.execute_script(PROBE_JS, by, value, condition)
+            if element is not None:
+                return element
+            if time.monotonic() >= deadline:
+                raise TimeoutException(f"Timeout aguardando elemento ({condition}): {by}={value}")
+            await asyncio.sleep(0.25)
+
+    async def find_element(self, by: str, value: str) -> AsyncWebElement:
+        """Localiza um elemento"""
+        try:
+            return await self._wait_until_element(by, value, self.wait_timeout)
+        except TimeoutException:
+            self.logger.error(f"Elemento não encontrado: {by}={value}")
+            raise ElementNotFound(f"Elemento não encontrado: {by}={value}")
+
+    async def find_elements(self, by: str, value: str, timeout: Optional[float] = None) -> List[AsyncWebElement]:
+        """
+        Localiza múltiplos elementos
+
+        Args:
+            timeout: Tempo máximo aguardando o primeiro elemento (padrão: implicit_wait;
+                0 consulta apenas o DOM atual)
+        """
+        deadline = time.monotonic() + (self.wait_timeout if timeout is None else timeout)
+        while True:
+            if by in SCRIPT_STRATEGIES:
+                elements = await self.execute_script(LOCATE_ALL_JS, by, value)
+            else:
+                using, selector = to_w3c_locator(by, value)
+                elements = self._decode(await self.execute('POST', '/elements', {'using': using, 'value': selector}))
+            if elements or time.monotonic() >= deadline:
+                return elements
+            await asyncio.sleep(0.25)
+
+    async def wait_for_element(self, by: str, value: str, timeout: Optional[float] = None) -> AsyncWebElement:
+        """Aguarda um elemento aparecer (mesma condição do BaseWebDriver: presente no DOM)"""
+        return await self._wait_until_element(by, value, timeout or self.wait_timeout)
+
+    async def is_element_visible(self, by: str, value: str, timeout: float = 5) -> bool:
+        """Verifica se elemento está visível"""
+        try:
+            await self._wait_until_element(by, value, timeout, 'visible')
+            return True
+        except TimeoutException:
+            return False
+
+    async def exists_now(self, by: str, value: str, visible: bool = False) -> bool:
+        """Verifica imediatamente se o elemento existe no DOM atual"""
+        element = await self.execute_script(PROBE_JS, by, value, 'visible' if visible else 'present')
+        return element is not None
+
+    async def click(self, by: str, value: str) -> None:
+        """Clica em um elemento"""
+        element = await self._wait_until_element(by, value, self.wait_timeout, 'clickable')
+        await element.click()
+        self.logger.debug(f"Clicou em: {by}={value}")
+
+    async def type_text(self, by: str, value: str, text: str, clear_first: bool = True) -> None:
+        """Digita texto em um elemento"""
+        element = await self.find_element(by, value)
+        if clear_first:
+            await element.clear()
+        await element.send_keys(text)
+
+    async def get_text(self, by: str, value: str) -> str:
+        """Obtém texto de um elemento"""
+        element = await self.find_element(by, value)
+        return await element.text()
+
+    async def get_attribute(self, by: str, value: str, attribute: str) -> Optional[str]:
+        """Obtém atributo de um elemento"""
+        element = await self.find_element(by, value)
+        return await element.get_attribute(attribute)
+
+    async def wait_for_url(self, partial_url: str, timeout: float = 10) -> bool:
+        """Aguarda a URL atual conter o trecho informado"""
+        deadline = time.monotonic() + timeout
+        if self.wait_strategy == 'event':
+            try:
+                await self._ensure_script_timeout(timeout)
+                return bool(await self.execute_async_script(WAIT_FOR_URL_JS, partial_url, int(timeout * 1000)))
+            except WebDriverProtocolException:
+                pass
+        while True:
+            if partial_url in await self.get_current_url():
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(0.25)
+
+    async def read_elements(self,
+                            locators: Union[Sequence[Any], Mapping[Any, Any]],
+                            attributes: Optional[Iterable[str]] = None,
+                            properties: Optional[Iterable[str]] = None,
+                            text: bool = True,
+                            include_elements: bool = False) -> Dict[Any, dict]:
+        """Lê vários elementos em um único script (mesmo formato de BaseWebDriver.read_elements)"""
+        items = BaseWebDriver._locator_items(locators)
+        specs = [BaseWebDriver._locator_spec(loc) for _, loc in items]
+        attributes = list(attributes or [])
+        properties = list(properties or [])
+        raw = await self.execute_script(READ_ELEMENTS_JS, specs, attributes, properties, text, include_elements)
+        return BaseWebDriver._read_results(items, raw, attributes, properties, include_elements)
+
+
+class AsyncBasePage:
+    """
+    Classe base para Page Objects assíncronos
+    Usa os mesmos Locator dos page objects síncronos
+    """
+
+    def __init__(self, driver: AsyncBaseWebDriver):
+        self.driver = driver
+        self.logger = Logger.get_logger(self.__class__.__name__)
+
+    async def navigate_to(self, url: str) -> None:
+        """Navega para URL"""
+        await self.driver.get(url)
+        self.logger.info(f"Navegando para: {url}")
+
+    async def find_element(self, locator: Locator) -> AsyncWebElement:
+        """Localiza elemento usando Locator"""
+        return await self.driver.find_element(locator.by, locator.value)
+
+    async def find_elements(self, locator: Locator, timeout: Optional[float] = None) -> List[AsyncWebElement]:
+        """Localiza múltiplos elementos usando Locator (timeout=0 não aguarda)"""
+        return await self.driver.find_elements(locator.by, locator.value, timeout)
+
+    async def exists_now(self, locator: Locator, visible: bool = False) -> bool:
+        """Verifica imediatamente se o elemento existe no DOM atual"""
+        return await self.driver.exists_now(locator.by, locator.value, visible)
+
+    async def click(self, locator: Locator) -> None:
+        """Clica em elemento"""
+        await self.driver.click(locator.by, locator.value)
+
+    async def type_text(self, locator: Locator, text: str, clear_first: bool = True) -> None:
+        """Digita texto"""
+        await self.driver.type_text(locator.by, locator.value, text, clear_first)
+
+    async def get_text(self, locator: Locator) -> str:
+        """Obtém texto"""
+        return await self.driver.get_text(locator.by, locator.value)
+
+    async def get_attribute(self, locator: Locator, attribute: str) -> Optional[str]:
+        """Obtém atributo"""
+        return await self.driver.get_attribute(locator.by, locator.value, attribute)
+
+    async def is_element_visible(self, locator: Locator, timeout: float = 5) -> bool:
+        """Verifica se elemento está visível"""
+        return await self.driver.is_element_visible(locator.by, locator.value, timeout)
+
+    async def wait_for_element(self, locator: Locator, timeout: Optional[float] = None) -> AsyncWebElement:
+        """Aguarda elemento aparecer"""
+        return await self.driver.wait_for_element(locator.by, locator.value, timeout)
+
+    async def wait_for_url(self, partial_url: str, timeout: float = 10) -> bool:
+        """Aguarda URL conter determinado texto"""
+        return await self.driver.wait_for_url(partial_url, timeout)
+
+    async def read_elements(self, locators: Union[Sequence[Locator], Mapping[str, Locator]],
+                            attributes: Optional[Iterable[str]] = None,
+                            properties: Optional[Iterable[str]] = None,
+                            text: bool = True) -> Dict[Any, dict]:
+        """Lê texto/atributos/propriedades de vários elementos em uma única chamada"""
+        return await self.driver.read_elements(locators, attributes, properties, text)
+
+    async def execute_script(self, script: str, *args) -> Any:
+        """Executa JavaScript"""
+        return await self.driver.execute_script(script, *args)
+
+    async def get_current_url(self) -> str:
+        """Obtém URL atual"""
+        return await self.driver.get_current_url()
+
+    async def get_page_title(self) -> str:
+        """Obtém título da página"""
+        return await self.driver.get_title()
+
+    async def refresh(self) -> None:
+        """Recarrega página"""
+        await self.driver.refresh()
+
+
+async def gather_bounded(coros: Iterable[Awaitable[Any]], concurrency: int) -> List[Any]:
+    """
+    Executa corrotinas com no máximo `concurrency` simultâneas
+
+    Returns:
+        Resultados na ordem das corrotinas
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(coro: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(run(coro) for coro in coros))
@@ -4,19 +4,39 @@ Implementa padrão Strategy para suportar múltiplos navegadores
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List, Tuple
+from contextlib import contextmanager
+from typing import Any, Callable, Optional, List, Tuple, Dict, Iterator, Mapping, Sequence, Union, TYPE_CHECKING
+import json
+import threading
+import time
+# selenium.webdriver carrega os backends (webdriver.Chrome, webdriver.ChromeService, ...) sob demanda
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.edge.service import Service as EdgeService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
-from automation_framework.web.driver_utils import ensure_driver_installed
+from selenium.common.exceptions import SessionNotCreatedException, WebDriverException
+from selenium.common.exceptions import TimeoutException as SeleniumTimeoutException
+from automation_framework.web.driver_utils import ensure_driver_installed, invalidate_driver
+from automation_framework.web.locators import SCRIPT_STRATEGIES
+from automation_framework.web.profile_template import ProfileTemplate
+from automation_framework.web.readiness import ReadinessSignal, resolve_signal
+from automation_framework.web.resource_policy import ResourcePolicy
+from automation_framework.web.timeline import StartupTimeline, startup_recorder
+from automation_framework.web.w3c import W3CClient, remote_endpoint
+from automation_framework.web.scripts import (
+    EXPECT_ABSENT_JS,
+    LOCATE_ALL_JS,
+    NETWORK_TRACKER_BOOTSTRAP_JS,
+    PROBE_JS,
+    READ_ELEMENTS_JS,
+    READY_CHECK_JS,
+    RESOLVE_JS,
+    SETTLED_STATE_JS,
+    WAIT_FOR_READY_JS,
+    WAIT_FOR_ELEMENT_JS,
+    WAIT_FOR_URL_JS,
+)
 from pathlib import Path
 
 from automation_framework.core.logger import Logger
@@ -25,18 +45,56 @@ from automation_framework.core.exceptions import (
     InvalidBrowserType,
     BrowserException,
     ElementNotFound,
-    TimeoutException
+    TimeoutException,
+    WebDriverProtocolException,
 )
 
+if TYPE_CHECKING:
+    from automation_framework.web.driver_pool import DriverPool
+    from automation_framework.web.session_state import SessionStateCache
+    from automation_framework.web.tracer import CommandTracer
+
+
+# Condições de espera por polling equivalentes às do script orientado a eventos
+_EC_CONDITIONS = {
+    'present': EC.presence_of_element_located,
+    'visible': EC.visibility_of_element_located,
+    'clickable': EC.element_to_be_clickable,
+}
+
+# Falhas de comando equivalentes nos dois transportes (Selenium e cliente W3C)
+_COMMAND_ERRORS = (WebDriverException, WebDriverProtocolException, TimeoutException)
+
 
 class BaseWebDriver(ABC):
     """Classe abstrata base para WebDrivers"""
 
+    browser_name: str = ""
+
     def __init__(self, config: dict):
         self.config = config
         self.driver: Optional[webdriver.Remote] = None
+        self.session_name: Optional[str] = None
+        # Incrementado a cada navegação feita pelo framework (invalida caches de elementos)
+        self.navigation_count = 0
         self.logger = Logger.get_logger(self.__class__.__name__)
         self.wait_timeout = config.get('implicit_wait', 10)
+        # 'polling' (WebDriverWait) ou 'event' (MutationObserver no navegador)
+        self.wait_strategy = config.get('wait_strategy', 'polling')
+        # 'selenium' (RemoteConnection) ou 'w3c' (cliente keep-alive próprio nos comandos frequentes)
+        self.transport = config.get('transport', 'selenium')
+        self.w3c: Optional[W3CClient] = None
+        self.resource_policy = ResourcePolicy.from_config(config.get('resource_policy'))
+        # 'normal', 'eager' ou 'none'; com eager/none o sinal de prontidão decide quando get() retorna
+        self.page_load_strategy = config.get('page_load_strategy', 'normal')
+        self.network_quiet_ms = config.get('network_quiet_ms', 500)
+        self.ready_signal = resolve_signal(config.get('ready_signal'), self.network_quiet_ms)
+        # Clone do template de perfil usado pela sessão (removido no quit)
+        self.profile_dir: Optional[Path] = None
+        self.profile_stats: Dict[str, float] = {}
+        # Fases de inicialização da sessão (começa a contar na criação do objeto)
+        self.timeline = StartupTimeline(browser=self.browser_name)
+        self._script_timeout: Optional[float] = None
 
     @abstractmethod
     def _create_options(self):
@@ -48,47 +106,414 @@ class BaseWebDriver(ABC):
         """Cria instância do WebDriver"""
         pass
 
+    def _drivers_dir(self) -> str:
+        """Pasta onde os drivers do projeto são mantidos"""
+        return self.config.get('drivers_dir') or str(Path(__file__).resolve().parents[2] / "drivers")
+
+    def _driver_path(self) -> str:
+        """Resolve o executável do driver (manifesto local ou webdriver-manager)"""
+        with self.timeline.phase('driver_resolve'):
+            return ensure_driver_installed(
+                self.browser_name,
+                target_dir=self._drivers_dir(),
+                offline=self.config.get('drivers_offline', False),
+            )
+
+    def _launch_browser(self, webdriver_class: Any, service: Any, options: Any) -> Any:
+        """
+        Cria a sessão medindo separadamente o processo do driver e a abertura do navegador
+
+        O Selenium inicia o serviço dentro do construtor; `service.start` é envolvido
+        para registrar a fase 'driver_spawn'.
+        """
+        original_start = service.start
+
+        def timed_start() -> None:
+            with self.timeline.phase('driver_spawn'):
+                original_start()
+
+        service.start = timed_start
+        spawn_before = self.timeline.duration('driver_spawn')
+        started = time.perf_counter()
+        driver = webdriver_class(service=service, options=options)
+        spawn = self.timeline.duration('driver_spawn') - spawn_before
+        self.timeline.record('browser_launch', started + spawn, time.perf_counter() - started - spawn)
+        return driver
+
+    def _create_driver_checked(self) -> None:
+        """Cria o driver; se o navegador foi atualizado, resolve o driver novamente e tenta outra vez"""
+        try:
+            self._create_driver()
+        except SessionNotCreatedException as e:
+            if self.config.get('drivers_offline', False):
+                raise
+            self.logger.warning(f"Driver registrado incompatível com o navegador; resolvendo novamente: {str(e)}")
+            invalidate_driver(self.browser_name, target_dir=self._drivers_dir())
+            self._create_driver()
+
+    def _clone_profile_template(self) -> None:
+        """Clona o template de perfil configurado e aponta user_data_dir para o clone"""
+        template = ProfileTemplate(self.config['profile_template'], self.config.get('profile_clone_method', 'auto'))
+        started = time.perf_counter()
+        self.profile_dir = template.clone()
+        self.profile_stats = {
+            'clone_seconds': time.perf_counter() - started,
+            'cold_start_seconds': template.metadata.get('cold_start_seconds', 0.0),
+        }
+        # Cópia própria: a configuração pode ser compartilhada entre drivers (pool)
+        self.config = {**self.config, 'user_data_dir': str(self.profile_dir)}
+
+    def _remove_profile_clone(self) -> None:
+        if self.profile_dir is not None:
+            ProfileTemplate.remove_clone(self.profile_dir)
+            self.profile_dir = None
+
     def initialize(self) -> None:
         """Inicializa o navegador"""
+        if self.timeline.finished is not None:
+            self.timeline = StartupTimeline(browser=self.browser_name)
+        timeline = self.timeline
+        started = time.perf_counter()
         try:
-            self._create_driver()
+            if self.config.get('profile_template') and self.profile_dir is None:
+                with timeline.phase('profile_clone'):
+                    self._clone_profile_template()
+            self._create_driver_checked()
             if not self.config.get('headless', False):
-                self.driver.maximize_window()
-            self.driver.set_page_load_timeout(self.config.get('page_load_timeout', 30))
+                with timeline.phase('maximize_window'):
+                    self.driver.maximize_window()
+            with timeline.phase('set_page_load_timeout'):
+                self.driver.set_page_load_timeout(self.config.get('page_load_timeout', 30))
+            if self.resource_policy:
+                with timeline.phase('resource_policy'):
+                    self.resource_policy.install(self.driver, self.browser_name)
+            if self.ready_signal is not None and hasattr(self.driver, 'execute_cdp_cmd'):
+                # Rastreador de rede ativo antes dos scripts da página (requisições iniciais contam)
+                with timeline.phase('readiness_bootstrap'):
+                    self.driver.execute_cdp_cmd(
+                        'Page.addScriptToEvaluateOnNewDocument', {'source': NETWORK_TRACKER_BOOTSTRAP_JS}
+                    )
+            if self.transport == 'w3c':
+                with timeline.phase('w3c_client'):
+                    self._attach_w3c_client()
             self.logger.info(f"Navegador {self.__class__.__name__} inicializado com sucesso")
         except Exception as e:
+            self._remove_profile_clone()
+            self._publish_timeline(ok=False)
             self.logger.error(f"Erro ao inicializar navegador: {str(e)}")
             raise BrowserException(f"Falha ao inicializar navegador: {str(e)}")
+        self._publish_timeline(ok=True)
+
+        if self.profile_dir is not None:
+            startup = time.perf_counter() - started
+            cold = self.profile_stats['cold_start_seconds']
+            self.profile_stats.update(startup_seconds=startup, time_saved_seconds=cold - startup if cold else 0.0)
+            self.logger.info(
+                f"Perfil clonado em {self.profile_stats['clone_seconds']:.2f}s; início em {startup:.2f}s "
+                f"(perfil vazio: {cold:.2f}s, economia: {self.profile_stats['time_saved_seconds']:.2f}s)"
+            )
+
+    def trace(self, capture_caller: bool = True) -> 'CommandTracer':
+        """
+        Rastreador de comandos WebDriver desta sessão (opt-in)
+
+        Exemplo:
+            with driver.trace() as tracer:
+                LoginPage(driver).login(usuario, senha)
+            print(tracer.summary_table())
+        """
+        from automation_framework.web.tracer import CommandTracer
+        return CommandTracer(self, capture_caller)
+
+    def _publish_timeline(self, ok: bool) -> None:
+        """Encerra a linha do tempo, registra no agregado da execução e grava um único log estruturado"""
+        self.timeline.session = self.session_name
+        self.timeline.finish(ok)
+        startup_recorder.add(self.timeline)
+        self.logger.info(f"Linha do tempo de inicialização: {json.dumps(self.timeline.to_dict())}")
+
+    def _attach_w3c_client(self) -> None:
+        """Cria o cliente W3C da sessão; elementos continuam sendo WebElement do Selenium"""
+        url, session_id = remote_endpoint(self.driver)
+        self.w3c = W3CClient(
+            url,
+            session_id,
+            make_element=lambda ref: WebElement(self.driver, ref),
+            element_id=lambda value: value.id if isinstance(value, WebElement) else None,
+        )
+        self.logger.debug(f"Transporte W3C ativo: {url}")
+
+    @property
+    def _executor(self) -> Any:
+        """Destino dos comandos frequentes (cliente W3C ou WebDriver do Selenium)"""
+        return self.w3c or self.driver
+
+    def resource_stats(self) -> dict:
+        """Contadores de requisições bloqueadas pela política de recursos"""
+        if not self.resource_policy:
+            return {'supported': False, 'blocked_requests': 0, 'blocked_by_type': {}, 'estimated_bytes_saved': 0}
+        if self.driver:
+            self.resource_policy.collect(self.driver)
+        return self.resource_policy.stats()
+
+    def _after_navigation(self) -> None:
+        """Drena periodicamente o log de performance da política de recursos"""
+        if not self.resource_policy:
+            return
+        try:
+            self.resource_policy.on_navigation(self.driver)
+        except _COMMAND_ERRORS as e:
+            self.logger.debug(f"Coleta de contadores de bloqueio falhou: {str(e)}")
 
     def quit(self) -> None:
         """Encerra o navegador"""
+        if self.w3c:
+            self.w3c.close()
+            self.w3c = None
+        if self.resource_policy:
+            try:
+                stats = self.resource_stats()
+                if stats['blocked_requests']:
+                    self.logger.info(
+                        f"Requisições bloqueadas: {stats['blocked_requests']} "
+                        f"(~{stats['estimated_bytes_saved'] // 1024} KB economizados)"
+                    )
+            except Exception as e:
+                self.logger.debug(f"Contadores de bloqueio indisponíveis: {str(e)}")
+            self.resource_policy.close()
         if self.driver:
             try:
                 self.driver.quit()
                 self.logger.info("Navegador encerrado")
             except Exception as e:
                 self.logger.warning(f"Erro ao encerrar navegador: {str(e)}")
+        self._remove_profile_clone()
 
-    def get(self, url: str) -> None:
-        """Navega para URL"""
+    def is_alive(self) -> bool:
+        """Verifica se a sessão do navegador ainda responde"""
+        if not self.driver:
+            return False
+        try:
+            self.driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    def reset_state(self, blank_url: str = "about:blank") -> None:
+        """
+        Limpa o estado da sessão para reutilização (abas, cookies e storage)
+
+        Args:
+            blank_url: URL carregada ao final da limpeza
+        """
+        handles = self.driver.window_handles
+        main_handle = handles[0]
+        for handle in handles[1:]:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        self.driver.switch_to.window(main_handle)
+
+        # Storage só pode ser limpo enquanto a página ainda está na origem
+        try:
+            self.driver.execute_script(
+                "try { window.localStorage.clear(); } catch (e) {}"
+                "try { window.sessionStorage.clear(); } catch (e) {}"
+            )
+        except Exception:
+            pass
+
+        if hasattr(self.driver, 'execute_cdp_cmd'):
+            # Chromium: remove cookies de todos os domínios, não só da página atual
+            self.driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        else:
+            self.driver.delete_all_cookies()
+
+        self.driver.get(blank_url)
+        self.navigation_count += 1
+        self._after_navigation()
+        self.logger.debug("Estado da sessão reiniciado")
+
+    def get(self, url: str, ready: Union[None, str, ReadinessSignal, Any] = None) -> None:
+        """
+        Navega para URL
+
+        Args:
+            url: URL de destino
+            ready: Sinal de prontidão ('dom_content_loaded', 'load', 'network_idle',
+                ReadinessSignal ou Locator); padrão: `ready_signal` da configuração
+        """
+        signal = resolve_signal(ready, self.network_quiet_ms) if ready is not None else self.ready_signal
+        if signal is not None and self.page_load_strategy != 'normal':
+            # get() pode retornar antes do novo documento existir: marca o documento atual
+            try:
+                self._executor.execute_script("window.__afPrevious = true;")
+            except _COMMAND_ERRORS:
+                pass
         self.driver.get(url)
+        self.navigation_count += 1
+        self._after_navigation()
+        if signal is not None:
+            self.wait_until_ready(signal, url=url)
         self.logger.info(f"Navegou para: {url}")
 
+    def wait_until_ready(self, signal: Union[str, ReadinessSignal, Any], timeout: Optional[float] = None,
+                         url: Optional[str] = None) -> bool:
+        """
+        Aguarda o sinal de prontidão da página
+
+        Args:
+            signal: Nome do sinal, ReadinessSignal ou Locator
+            timeout: Tempo máximo (padrão: page_load_timeout)
+            url: URL navegada (ignora o documento anterior à navegação)
+
+        Returns:
+            True se o sinal ocorreu; False no timeout (página segue utilizável)
+        """
+        signal = resolve_signal(signal, self.network_quiet_ms)
+        timeout = self.config.get('page_load_timeout', 30) if timeout is None else timeout
+        options = dict(signal.options(), url=url)
+        deadline = time.monotonic() + timeout
+        started = time.monotonic()
+
+        ready = False
+        for _ in range(3):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                self._ensure_script_timeout(remaining)
+                ready = bool(self._executor.execute_async_script(
+                    WAIT_FOR_READY_JS, signal.name, options, int(remaining * 1000)
+                ))
+                break
+            except _COMMAND_ERRORS as e:
+                # Documento trocado durante a espera (navegação em andamento)
+                self.logger.debug(f"Espera de prontidão interrompida, repetindo: {str(e).splitlines()[0]}")
+        else:
+            while time.monotonic() < deadline:
+                try:
+                    if self._executor.execute_script(READY_CHECK_JS, signal.name, options):
+                        ready = True
+                        break
+                except _COMMAND_ERRORS:
+                    pass
+                time.sleep(0.1)
+
+        elapsed = time.monotonic() - started
+        if ready:
+            self.logger.debug(f"Página pronta ({signal.name}) em {elapsed:.2f}s")
+        else:
+            self.logger.warning(f"Sinal de prontidão {signal!r} não ocorreu em {timeout}s")
+        return ready
+
+    def _wait_until_element(self, by: By, value: str, timeout: float, condition: str = 'present') -> WebElement:
+        """
+        Aguarda elemento atingir a condição ('present', 'visible' ou 'clickable')
+
+        Com `wait_strategy='event'` a espera acontece no navegador (MutationObserver) e
+        retorna assim que a condição é satisfeita; se o script for interrompido (ex: navegação)
+        o tempo restante é aguardado por polling.
+        """
+        deadline = time.monotonic() + timeout
+        if self.wait_strategy == 'event':
+            element = self._event_wait_element(by, value, timeout, condition)
+            if element is not None:
+                return element
+        remaining = max(deadline - time.monotonic(), 0)
+        if self.w3c or by in SCRIPT_STRATEGIES:
+            return self._poll_element(by, value, remaining, condition)
+        return WebDriverWait(self.driver, remaining).until(_EC_CONDITIONS[condition]((by, value)))
+
+    def _poll_element(self, by: By, value: str, timeout: float, condition: str) -> WebElement:
+        """Polling com uma única chamada por tentativa (PROBE_JS; cliente W3C quando ativo)"""
+        deadline = time.monotonic() + timeout
+        while True:
+            element = self._executor.execute_script(PROBE_JS, by, value, condition)
+            if element is not None:
+                return element
+            if time.monotonic() >= deadline:
+                raise SeleniumTimeoutException(f"Timeout aguardando elemento ({condition}): {by}={value}")
+            time.sleep(0.25)
+
+    def _ensure_script_timeout(self, timeout: float) -> None:
+        """Garante que o timeout de scripts assíncronos comporte a espera"""
+        required = timeout + 5
+        if self._script_timeout is None or self._script_timeout < required:
+            self._executor.set_script_timeout(required)
+            self._script_timeout = required
+
+    def _event_wait_element(self, by: By, value: str, timeout: float, condition: str) -> Optional[WebElement]:
+        """
+        Espera orientada a eventos; retorna None quando é preciso continuar por polling
+
+        Raises:
+            SeleniumTimeoutException: Se a condição não foi atingida no tempo
+        """
+        deadline = time.monotonic() + timeout
+        for _ in range(3):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                self._ensure_script_timeout(remaining)
+                result = self._executor.execute_async_script(
+                    WAIT_FOR_ELEMENT_JS, by, value, condition, int(remaining * 1000)
+                )
+            except _COMMAND_ERRORS as e:
+                # Documento trocado durante a espera: tenta novamente no novo documento
+                self.logger.debug(f"Espera por evento interrompida, repetindo: {str(e).splitlines()[0]}")
+                continue
+            if result and result.get('element') is not None:
+                return result['element']
+            raise SeleniumTimeoutException(f"Timeout aguardando elemento ({condition}): {by}={value}")
+        return None
+
+    def wait_for_url(self, partial_url: str, timeout: float = 10) -> bool:
+        """Aguarda a URL atual conter o trecho informado"""
+        deadline = time.monotonic() + timeout
+        if self.wait_strategy == 'event':
+            try:
+                self._ensure_script_timeout(timeout)
+                if self._executor.execute_async_script(WAIT_FOR_URL_JS, partial_url, int(timeout * 1000)):
+                    return True
+                return False
+            except _COMMAND_ERRORS:
+                # Navegação completa interrompe o script; a URL é conferida por polling
+                pass
+        try:
+            remaining = max(deadline - time.monotonic(), 0)
+            WebDriverWait(self.driver, remaining).until(EC.url_contains(partial_url))
+            return True
+        except SeleniumTimeoutException:
+            return False
+
     def find_element(self, by: By, value: str) -> WebElement:
         """Localiza um elemento"""
         try:
-            wait = WebDriverWait(self.driver, self.wait_timeout)
-            element = wait.until(EC.presence_of_element_located((by, value)))
+            element = self._wait_until_element(by, value, self.wait_timeout)
             self.logger.debug(f"Elemento encontrado: {by}={value}")
             return element
         except Exception as e:
             self.logger.error(f"Elemento não encontrado: {by}={value}")
             raise ElementNotFound(f"Elemento não encontrado: {by}={value}")
 
-    def find_elements(self, by: By, value: str) -> List[WebElement]:
-        """Localiza múltiplos elementos"""
+    def find_elements(self, by: By, value: str, timeout: Optional[float] = None) -> List[WebElement]:
+        """
+        Localiza múltiplos elementos
+
+        Args:
+            timeout: Tempo máximo aguardando o primeiro elemento (padrão: implicit_wait;
+                0 consulta apenas o DOM atual)
+        """
+        timeout = self.wait_timeout if timeout is None else timeout
+        if by in SCRIPT_STRATEGIES:
+            return self._find_elements_script(by, value, timeout)
+        if timeout <= 0:
+            if self.w3c:
+                return self.w3c.find_elements(by, value)
+            return self.driver.find_elements(by, value)
         try:
-            wait = WebDriverWait(self.driver, self.wait_timeout)
+            wait = WebDriverWait(self.driver, timeout)
             elements = wait.until(EC.presence_of_all_elements_located((by, value)))
             self.logger.debug(f"Encontrados {len(elements)} elementos: {by}={value}")
             return elements
@@ -96,12 +521,46 @@ class BaseWebDriver(ABC):
             self.logger.warning(f"Nenhum elemento encontrado: {by}={value}")
             return []
 
+    def _find_elements_script(self, by: str, value: Any, timeout: float) -> List[WebElement]:
+        """find_elements para estratégias do framework ('text', 'any'), resolvidas no navegador"""
+        deadline = time.monotonic() + timeout
+        while True:
+            elements = self.execute_script(LOCATE_ALL_JS, by, value)
+            if elements or time.monotonic() >= deadline:
+                return elements
+            time.sleep(0.25)
+
+    def resolve(self, by: By, value: Any, condition: str = 'present') -> Tuple[Optional[WebElement], Optional[int]]:
+        """
+        Resolve o localizador no DOM atual em uma única chamada, sem aguardar
+
+        Para localizadores compostos (by='any') as alternativas são testadas em ordem
+        de preferência e o índice da alternativa usada é retornado.
+
+        Args:
+            condition: 'present', 'visible' ou 'clickable'
+
+        Returns:
+            Tupla (elemento, índice da alternativa) ou (None, None)
+        """
+        result = self.execute_script(RESOLVE_JS, by, value, condition)
+        if result is None:
+            return None, None
+        if result['index']:
+            self.logger.debug(f"Localizador resolvido pela alternativa {result['index']}: {by}={value}")
+        return result['element'], result['index']
+
     def click(self, by: By, value: str) -> None:
         """Clica em um elemento"""
         try:
-            element = self.find_element(by, value)
-            WebDriverWait(self.driver, self.wait_timeout).until(EC.element_to_be_clickable((by, value)))
-            element.click()
+            try:
+                element = self._wait_until_element(by, value, self.wait_timeout, 'clickable')
+            except SeleniumTimeoutException:
+                raise ElementNotFound(f"Elemento não clicável: {by}={value}")
+            if self.w3c:
+                self.w3c.element_click(element.id)
+            else:
+                element.click()
             self.logger.info(f"Clique realizado em: {by}={value}")
         except Exception as e:
             self.logger.error(f"Erro ao clicar: {str(e)}")
@@ -111,9 +570,14 @@ class BaseWebDriver(ABC):
         """Digita texto em um elemento"""
         try:
             element = self.find_element(by, value)
-            if clear_first:
-                element.clear()
-            element.send_keys(text)
+            if self.w3c:
+                if clear_first:
+                    self.w3c.element_clear(element.id)
+                self.w3c.element_send_keys(element.id, text)
+            else:
+                if clear_first:
+                    element.clear()
+                element.send_keys(text)
             self.logger.info(f"Texto digitado em {by}={value}: {text}")
         except Exception as e:
             self.logger.error(f"Erro ao digitar texto: {str(e)}")
@@ -122,7 +586,7 @@ class BaseWebDriver(ABC):
     def get_text(self, by: By, value: str) -> str:
         """Obtém texto de um elemento"""
         element = self.find_element(by, value)
-        text = element.text
+        text = self.w3c.element_text(element.id) if self.w3c else element.text
         self.logger.debug(f"Texto obtido de {by}={value}: {text}")
         return text
 
@@ -136,26 +600,156 @@ class BaseWebDriver(ABC):
     def is_element_visible(self, by: By, value: str, timeout: int = 5) -> bool:
         """Verifica se elemento está visível"""
         try:
-            WebDriverWait(self.driver, timeout).until(EC.visibility_of_element_located((by, value)))
+            self._wait_until_element(by, value, timeout, 'visible')
             return True
         except:
             return False
 
+    def probe(self, by: By, value: str, visible: bool = False) -> Optional[WebElement]:
+        """
+        Consulta o DOM atual sem aguardar
+
+        Args:
+            visible: Se True, considera apenas elementos visíveis
+
+        Returns:
+            Primeiro elemento encontrado ou None
+        """
+        return self.execute_script(PROBE_JS, by, value, 'visible' if visible else 'present')
+
+    def exists_now(self, by: By, value: str, visible: bool = False) -> bool:
+        """Verifica imediatamente (sem timeout) se o elemento existe no DOM atual"""
+        return self.probe(by, value, visible) is not None
+
+    def probe_many(self, locators: Union[Sequence[Any], Mapping[Any, Any]]) -> Dict[Any, bool]:
+        """Verifica a presença de vários localizadores em uma única chamada, sem aguardar"""
+        results = self.read_elements(locators, text=False)
+        return {key: data['present'] for key, data in results.items()}
+
+    def expect_absent(self, by: By, value: str, timeout: Optional[float] = None, quiet_ms: int = 500) -> bool:
+        """
+        Confirma que um elemento opcional não vai aparecer
+
+        Retorna assim que a página estabiliza (documento carregado e nenhuma requisição
+        fetch/XHR por `quiet_ms`), em vez de aguardar o timeout inteiro.
+
+        Args:
+            timeout: Tempo máximo aguardando a página estabilizar (padrão: implicit_wait)
+            quiet_ms: Janela sem atividade de rede para considerar a página estável
+
+        Returns:
+            True se o elemento está ausente, False se ele apareceu
+        """
+        timeout = self.wait_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        try:
+            self._ensure_script_timeout(timeout)
+            state = self._executor.execute_async_script(EXPECT_ABSENT_JS, by, value, quiet_ms, int(timeout * 1000))
+        except _COMMAND_ERRORS:
+            # Script interrompido (navegação): continua por polling no novo documento
+            state = {'present': False, 'settled': False}
+            while time.monotonic() < deadline:
+                try:
+                    state = self.execute_script(SETTLED_STATE_JS, by, value, quiet_ms)
+                except _COMMAND_ERRORS:
+                    state = {'present': False, 'settled': False}
+                if state['present'] or state['settled']:
+                    break
+                time.sleep(0.1)
+
+        if not state['settled'] and not state['present']:
+            self.logger.debug(f"Página não estabilizou em {timeout}s; elemento ausente: {by}={value}")
+        return not state['present']
+
     def wait_for_element(self, by: By, value: str, timeout: Optional[int] = None) -> WebElement:
         """Aguarda um elemento aparecer"""
         timeout = timeout or self.wait_timeout
         try:
-            wait = WebDriverWait(self.driver, timeout)
-            element = wait.until(EC.presence_of_element_located((by, value)))
+            element = self._wait_until_element(by, value, timeout)
             self.logger.info(f"Elemento aguardado: {by}={value}")
             return element
         except Exception as e:
             self.logger.error(f"Timeout aguardando elemento: {by}={value}")
             raise TimeoutException(f"Timeout aguardando elemento: {by}={value}")
 
+    def read_elements(self,
+                      locators: Union[Sequence[Any], Mapping[Any, Any]],
+                      attributes: Optional[Sequence[str]] = None,
+                      properties: Optional[Sequence[str]] = None,
+                      text: bool = True,
+                      include_elements: bool = False,
+                      timeout: float = 0) -> Dict[Any, dict]:
+        """
+        Resolve vários localizadores e lê seus dados em um único script
+
+        Args:
+            locators: Lista de Locator/(by, value) ou dicionário nome -> Locator/(by, value)
+            attributes: Atributos HTML lidos de cada elemento (getAttribute)
+            properties: Propriedades DOM lidas de cada elemento (ex: 'value', 'checked')
+            text: Se deve ler o texto visível de cada elemento
+            include_elements: Se deve incluir o WebElement encontrado em 'element'
+            timeout: Se maior que zero, repete a leitura até todos estarem presentes
+
+        Returns:
+            Dicionário chave -> {'present', 'text', 'attributes', 'properties'[, 'element']},
+            onde a chave é o nome (dicionário) ou o próprio localizador (lista)
+        """
+        items = self._locator_items(locators)
+        specs = [self._locator_spec(loc) for _, loc in items]
+        attributes = list(attributes or [])
+        properties = list(properties or [])
+
+        deadline = time.monotonic() + timeout
+        while True:
+            raw = self.execute_script(READ_ELEMENTS_JS, specs, attributes, properties, text, include_elements)
+            if all(raw) or time.monotonic() >= deadline:
+                break
+            time.sleep(0.1)
+
+        results = self._read_results(items, raw, attributes, properties, include_elements)
+        missing = sum(1 for data in raw if data is None)
+        self.logger.debug(f"Leitura em lote: {len(items)} localizadores, {missing} ausentes")
+        return results
+
+    @staticmethod
+    def _locator_items(locators: Union[Sequence[Any], Mapping[Any, Any]]) -> List[Tuple[Any, Any]]:
+        """Normaliza lista/dicionário de localizadores para pares (chave, localizador)"""
+        if isinstance(locators, Mapping):
+            return list(locators.items())
+        return [(loc, loc) for loc in locators]
+
+    @staticmethod
+    def _read_results(items: List[Tuple[Any, Any]], raw: List[Optional[dict]], attributes: List[str],
+                      properties: List[str], include_elements: bool) -> Dict[Any, dict]:
+        """Monta o resultado de READ_ELEMENTS_JS com a flag 'present' por localizador"""
+        results = {}
+        for (key, _), data in zip(items, raw):
+            if data is None:
+                results[key] = {
+                    'present': False,
+                    'text': None,
+                    'attributes': {name: None for name in attributes},
+                    'properties': {name: None for name in properties},
+                }
+                if include_elements:
+                    results[key]['element'] = None
+            else:
+                data.setdefault('text', None)
+                results[key] = {'present': True, **data}
+        return results
+
+    @staticmethod
+    def _locator_spec(locator: Any) -> List[str]:
+        """Converte Locator ou tupla (by, value) para o formato dos scripts injetados"""
+        if isinstance(locator, (tuple, list)):
+            by, value = locator
+        else:
+            by, value = locator.by, locator.value
+        return [by, value]
+
     def execute_script(self, script: str, *args):
         """Executa JavaScript"""
-        result = self.driver.execute_script(script, *args)
+        result = self._executor.execute_script(script, *args)
         self.logger.debug("Script JavaScript executado")
         return result
 
@@ -171,6 +765,8 @@ class BaseWebDriver(ABC):
     def refresh(self) -> None:
         """Atualiza a página"""
         self.driver.refresh()
+        self.navigation_count += 1
+        self._after_navigation()
         self.logger.info("Página atualizada")
 
     def get_current_url(self) -> str:
@@ -181,9 +777,12 @@ class BaseWebDriver(ABC):
 class ChromeWebDriver(BaseWebDriver):
     """Implementação para Chrome"""
 
+    browser_name = 'chrome'
+
     def _create_options(self):
         """Cria opções do Chrome"""
         options = webdriver.ChromeOptions()
+        options.page_load_strategy = self.config.get('page_load_strategy', 'normal')
 
         if self.config.get('headless', False):
             options.add_argument('--headless=new')
@@ -202,6 +801,9 @@ class ChromeWebDriver(BaseWebDriver):
         if window_size := self.config.get('window_size'):
             options.add_argument(f'--window-size={window_size}')
 
+        if self.resource_policy:
+            self.resource_policy.apply_to_options(options, self.browser_name)
+
         return options
 
     def _create_driver(self):
@@ -209,18 +811,20 @@ class ChromeWebDriver(BaseWebDriver):
         options = self._create_options()
 
         # Baixa/garante driver no diretório `drivers/` do projeto
-        drivers_dir = Path(__file__).resolve().parents[2] / "drivers"
-        driver_path = ensure_driver_installed('chrome', target_dir=str(drivers_dir))
-        service = ChromeService(driver_path)
-        self.driver = webdriver.Chrome(service=service, options=options)
+        driver_path = self._driver_path()
+        service = webdriver.ChromeService(driver_path)
+        self.driver = self._launch_browser(webdriver.Chrome, service, options)
 
 
 class FirefoxWebDriver(BaseWebDriver):
     """Implementação para Firefox"""
 
+    browser_name = 'firefox'
+
     def _create_options(self):
         """Cria opções do Firefox"""
         options = webdriver.FirefoxOptions()
+        options.page_load_strategy = self.config.get('page_load_strategy', 'normal')
 
         if self.config.get('headless', False):
             options.add_argument('--headless')
@@ -239,18 +843,20 @@ class FirefoxWebDriver(BaseWebDriver):
         """Cria WebDriver do Firefox"""
         options = self._create_options()
 
-        drivers_dir = Path(__file__).resolve().parents[2] / "drivers"
-        driver_path = ensure_driver_installed('firefox', target_dir=str(drivers_dir))
-        service = FirefoxService(driver_path)
-        self.driver = webdriver.Firefox(service=service, options=options)
+        driver_path = self._driver_path()
+        service = webdriver.FirefoxService(driver_path)
+        self.driver = self._launch_browser(webdriver.Firefox, service, options)
 
 
 class EdgeWebDriver(BaseWebDriver):
     """Implementação para Edge"""
 
+    browser_name = 'edge'
+
     def _create_options(self):
         """Cria opções do Edge"""
         options = webdriver.EdgeOptions()
+        options.page_load_strategy = self.config.get('page_load_strategy', 'normal')
 
         if self.config.get('headless', False):
             options.add_argument('--headless=new')
@@ -264,86 +870,245 @@ class EdgeWebDriver(BaseWebDriver):
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
 
+        if self.resource_policy:
+            self.resource_policy.apply_to_options(options, self.browser_name)
+
         return options
 
     def _create_driver(self):
         """Cria WebDriver do Edge"""
         options = self._create_options()
 
-        drivers_dir = Path(__file__).resolve().parents[2] / "drivers"
-        driver_path = ensure_driver_installed('edge', target_dir=str(drivers_dir))
-        service = EdgeService(driver_path)
-        self.driver = webdriver.Edge(service=service, options=options)
+        driver_path = self._driver_path()
+        service = webdriver.EdgeService(driver_path)
+        self.driver = self._launch_browser(webdriver.Edge, service, options)
 
 
 class DriverManager:
     """
     Gerenciador centralizado de drivers
     Implementa padrão Factory + Singleton
+
+    Cada sessão de navegador é identificada por uma chave: o nome explícito
+    passado aos métodos, o nome vinculado à thread via `use_session()` ou,
+    por padrão, o nome da thread atual. Assim várias threads do mesmo
+    processo controlam navegadores independentes.
     """
 
     _instance: Optional['DriverManager'] = None
-    _driver: Optional[BaseWebDriver] = None
+    _instance_lock = threading.Lock()
     _browser_type: str = "chrome"
+    _sessions: Dict[str, BaseWebDriver] = {}
+    _session_browsers: Dict[str, str] = {}
+    _session_locks: Dict[str, threading.Lock] = {}
+    _sessions_lock = threading.Lock()
+    _local = threading.local()
+    _pools: Dict[str, 'DriverPool'] = {}
+    _pools_lock = threading.Lock()
+    _session_state: Optional['SessionStateCache'] = None
 
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(DriverManager, cls).__new__(cls)
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = super(DriverManager, cls).__new__(cls)
         return cls._instance
 
     def __init__(self):
         self.config_manager = ConfigManager()
         self.logger = Logger.get_logger(self.__class__.__name__)
 
-    def initialize_browser(self, browser_type: Optional[str] = None) -> BaseWebDriver:
+    def session_key(self, session: Optional[str] = None) -> str:
         """
-        Inicializa navegador especificado
+        Resolve a chave da sessão
 
         Args:
-            browser_type: Tipo de navegador (chrome, firefox, edge)
+            session: Nome explícito da sessão
 
         Returns:
-            BaseWebDriver: Instância do driver inicializado
+            Nome explícito, nome vinculado à thread ou nome da thread atual
         """
-        if browser_type:
-            self._browser_type = browser_type.lower()
-
-        if self._driver:
-            self._driver.quit()
-
-        config = self.config_manager.get_browser_config().__dict__
-
-        driver_class = self._get_driver_class(self._browser_type)
-        self._driver = driver_class(config)
-        self._driver.initialize()
+        if session:
+            return session
+        bound = getattr(self._local, 'session', None)
+        if bound:
+            return bound
+        return threading.current_thread().name
+
+    @contextmanager
+    def use_session(self, session: str) -> Iterator[None]:
+        """
+        Vincula um nome de sessão à thread atual
 
-        return self._driver
+        Args:
+            session: Nome da sessão usado por padrão dentro do bloco
+        """
+        previous = getattr(self._local, 'session', None)
+        self._local.session = session
+        try:
+            yield
+        finally:
+            self._local.session = previous
+
+    def _lock_for(self, key: str) -> threading.Lock:
+        """Retorna o lock que serializa criação/encerramento de uma sessão"""
+        with self._sessions_lock:
+            lock = self._session_locks.get(key)
+            if lock is None:
+                lock = self._session_locks[key] = threading.Lock()
+            return lock
+
+    def initialize_browser(self, browser_type: Optional[str] = None, session: Optional[str] = None,
+                           credential_id: Optional[str] = None,
+                           is_logged_in: Union[None, Callable[[], bool], Any] = None,
+                           url: Optional[str] = None,
+                           login: Optional[Callable[[BaseWebDriver], None]] = None) -> BaseWebDriver:
+        """
+        Inicializa navegador especificado
 
-    def get_driver(self) -> BaseWebDriver:
-        """Obtém driver atual ou inicializa o padrão"""
-        if not self._driver:
-            self.initialize_browser()
-        return self._driver
+        Args:
+            browser_type: Tipo de navegador (chrome, firefox, edge)
+            session: Nome da sessão (padrão: sessão da thread atual)
+            credential_id: Restaura o estado de login salvo para esta credencial (SessionStateCache)
+            is_logged_in: Obrigatório com credential_id; função ou Locator que confirma o login
+                restaurado (sessão caída: estado invalidado)
+            url: Página autenticada aberta após a restauração (padrão: origem do estado)
+            login: Executa o login quando não há estado válido (recebe o driver); o estado é capturado
 
-    def switch_browser(self, browser_type: str) -> BaseWebDriver:
+        Returns:
+            BaseWebDriver: Instância do driver inicializado
+        """
+        if credential_id and is_logged_in is None:
+            raise ValueError("credential_id requer is_logged_in para validar a sessão restaurada")
+        key = self.session_key(session)
+
+        with self._lock_for(key):
+            with self._sessions_lock:
+                if browser_type:
+                    self._session_browsers[key] = browser_type.lower()
+                current_type = self._session_browsers.get(key, self._browser_type)
+                previous = self._sessions.pop(key, None)
+
+            config = self.config_manager.get_browser_config().__dict__
+
+            driver_class = self._get_driver_class(current_type)
+            driver = driver_class(config)
+            driver.session_name = key
+            if previous:
+                # Encerrar a sessão anterior faz parte do tempo de (re)inicialização
+                with driver.timeline.phase('quit_previous'):
+                    previous.quit()
+            driver.initialize()
+            if credential_id:
+                try:
+                    cache = self.session_state_cache()
+                    if not cache.restore_and_verify(driver, credential_id, is_logged_in, url) and login:
+                        login(driver)
+                        cache.capture(driver, credential_id)
+                except Exception:
+                    # Ainda não registrado na sessão: sem isto o navegador ficaria órfão
+                    driver.quit()
+                    raise
+
+            with self._sessions_lock:
+                self._sessions[key] = driver
+
+        return driver
+
+    def session_state_cache(self) -> 'SessionStateCache':
+        """Cache de estado de sessão compartilhado pelas sessões do gerenciador"""
+        with self._sessions_lock:
+            if DriverManager._session_state is None:
+                from automation_framework.web.session_state import SessionStateCache
+                DriverManager._session_state = SessionStateCache()
+            return DriverManager._session_state
+
+    def get_driver(self, session: Optional[str] = None) -> BaseWebDriver:
+        """Obtém driver da sessão ou inicializa o padrão"""
+        key = self.session_key(session)
+        with self._sessions_lock:
+            driver = self._sessions.get(key)
+        if not driver:
+            driver = self.initialize_browser(session=key)
+        return driver
+
+    def has_session(self, session: Optional[str] = None) -> bool:
+        """Verifica se a sessão possui navegador aberto"""
+        with self._sessions_lock:
+            return self.session_key(session) in self._sessions
+
+    def list_sessions(self) -> List[str]:
+        """Retorna os nomes das sessões abertas"""
+        with self._sessions_lock:
+            return list(self._sessions)
+
+    def switch_browser(self, browser_type: str, session: Optional[str] = None) -> BaseWebDriver:
         """
         Troca de navegador
 
         Args:
             browser_type: Novo tipo de navegador
+            session: Nome da sessão (padrão: sessão da thread atual)
 
         Returns:
             BaseWebDriver: Novo driver inicializado
         """
         self.logger.info(f"Alternando para navegador: {browser_type}")
-        return self.initialize_browser(browser_type)
-
-    def quit_browser(self) -> None:
-        """Encerra o navegador atual"""
-        if self._driver:
-            self._driver.quit()
-            self._driver = None
-            self.logger.info("Navegador encerrado")
+        return self.initialize_browser(browser_type, session=session)
+
+    def startup_timelines(self, session: Optional[str] = None) -> List[dict]:
+        """Linhas do tempo de inicialização registradas na execução (opcionalmente de uma sessão)"""
+        return [timeline.to_dict() for timeline in startup_recorder.timelines(session)]
+
+    def startup_stats(self) -> Dict[str, dict]:
+        """Percentis p50/p95 por fase de inicialização entre todas as sessões da execução"""
+        return startup_recorder.stats()
+
+    def quit_browser(self, session: Optional[str] = None) -> None:
+        """Encerra o navegador da sessão"""
+        key = self.session_key(session)
+        with self._lock_for(key):
+            with self._sessions_lock:
+                driver = self._sessions.pop(key, None)
+            if driver:
+                driver.quit()
+                self.logger.info(f"Navegador encerrado (sessão: {key})")
+
+    def quit_all(self) -> None:
+        """Encerra os navegadores de todas as sessões"""
+        for key in self.list_sessions():
+            self.quit_browser(key)
+
+    def get_pool(self, browser_type: Optional[str] = None) -> 'DriverPool':
+        """
+        Obtém (ou cria) o pool de sessões reutilizáveis do navegador
+
+        Args:
+            browser_type: Tipo de navegador (padrão: browser.browser_type da configuração)
+
+        Returns:
+            DriverPool: Pool compartilhado para o tipo de navegador (aquecido até
+                `pool.min_sessions` a partir do primeiro empréstimo)
+        """
+        from automation_framework.web.driver_pool import DriverPool
+
+        browser_type = (browser_type or self.config_manager.get('browser.browser_type', 'chrome')).lower()
+        self._get_driver_class(browser_type)
+
+        with self._pools_lock:
+            pool = self._pools.get(browser_type)
+            if pool is None:
+                pool = DriverPool(browser_type)
+                self._pools[browser_type] = pool
+        return pool
+
+    def close_pools(self) -> None:
+        """Encerra todos os pools de sessões"""
+        with self._pools_lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.close()
 
     @staticmethod
     def _get_driver_class(browser_type: str):
@@ -0,0 +1,280 @@
+"""
+Pool de sessões WebDriver reutilizáveis
+Mantém navegadores aquecidos e os empresta (lease/release) para fluxos curtos,
+evitando o custo de abrir um navegador novo a cada execução
+"""
+
+import threading
+from collections import deque
+from contextlib import contextmanager
+from time import monotonic
+from typing import Callable, Deque, Dict, Iterator, Optional
+
+from automation_framework.core.logger import Logger
+from automation_framework.core.config import ConfigManager
+from automation_framework.core.exceptions import BrowserException, TimeoutException
+from automation_framework.web.driver_manager import BaseWebDriver, DriverManager
+
+
+class DriverPool:
+    """
+    Pool de sessões de navegador com semântica de empréstimo
+
+    Sessões devolvidas têm abas extras, cookies e storage limpos antes de
+    voltarem ao pool; sessões que falham no health check são descartadas.
+    O pool é aquecido até `min_sessions` no primeiro empréstimo (ou no `with`)
+    e sessões descartadas são repostas em segundo plano.
+    """
+
+    def __init__(self,
+                 browser_type: str = "chrome",
+                 min_sessions: Optional[int] = None,
+                 max_sessions: Optional[int] = None,
+                 lease_timeout: Optional[float] = None,
+                 config: Optional[dict] = None,
+                 driver_factory: Optional[Callable[[], BaseWebDriver]] = None):
+        """
+        Args:
+            browser_type: Tipo de navegador (chrome, firefox, edge)
+            min_sessions: Sessões mantidas aquecidas (padrão: config 'pool')
+            max_sessions: Limite de sessões simultâneas (padrão: config 'pool')
+            lease_timeout: Tempo máximo aguardando uma sessão livre
+            config: Configuração do navegador (padrão: config 'browser')
+            driver_factory: Função que cria e inicializa um BaseWebDriver
+        """
+        config_manager = ConfigManager()
+        pool_config = config_manager.get_pool_config()
+
+        self.browser_type = browser_type.lower()
+        self.min_sessions = pool_config.min_sessions if min_sessions is None else min_sessions
+        self.max_sessions = pool_config.max_sessions if max_sessions is None else max_sessions
+        self.lease_timeout = pool_config.lease_timeout if lease_timeout is None else lease_timeout
+        self.max_uses = pool_config.max_uses
+        self.health_check = pool_config.health_check
+        self.reset_state = pool_config.reset_state
+
+        if self.max_sessions < 1 or self.min_sessions > self.max_sessions:
+            raise ValueError(
+                f"Limites inválidos para o pool: min={self.min_sessions}, max={self.max_sessions}"
+            )
+
+        self.config = config or config_manager.get_browser_config().__dict__
+        self._driver_factory = driver_factory or self._default_factory
+        self.logger = Logger.get_logger(self.__class__.__name__)
+
+        self._idle: Deque[BaseWebDriver] = deque()
+        self._leased: Dict[int, BaseWebDriver] = {}
+        self._uses: Dict[int, int] = {}
+        self._creating = 0
+        self._closed = False
+        self._warmed = False
+        self._cond = threading.Condition()
+        self._stats = {'created': 0, 'reused': 0, 'discarded': 0, 'leases': 0}
+
+    def _default_factory(self) -> BaseWebDriver:
+        """Cria e inicializa uma nova sessão do navegador configurado"""
+        driver_class = DriverManager._get_driver_class(self.browser_type)
+        driver = driver_class(dict(self.config))
+        driver.initialize()
+        return driver
+
+    @property
+    def size(self) -> int:
+        """Total de sessões abertas (livres + emprestadas + em criação)"""
+        with self._cond:
+            return len(self._idle) + len(self._leased) + self._creating
+
+    def warm_up(self) -> None:
+        """Abre sessões até atingir `min_sessions`"""
+        with self._cond:
+            self._warmed = True
+        while True:
+            with self._cond:
+                if self._closed or len(self._idle) + len(self._leased) + self._creating >= self.min_sessions:
+                    return
+                self._creating += 1
+
+            driver = self._create_session()
+            with self._cond:
+                self._creating -= 1
+                closed = self._closed
+                if not closed:
+                    self._idle.append(driver)
+                    self._cond.notify()
+            if closed:
+                # Pool encerrado durante a criação
+                self._discard(driver)
+                return
+
+    def _refill(self) -> None:
+        """Repõe sessões até `min_sessions` em segundo plano"""
+        with self._cond:
+            self._warmed = True
+            if self._closed or len(self._idle) + len(self._leased) + self._creating >= self.min_sessions:
+                return
+
+        def run() -> None:
+            try:
+                self.warm_up()
+            except Exception as e:
+                self.logger.warning(f"Falha ao repor sessões do pool: {str(e)}")
+
+        threading.Thread(target=run, name=f"DriverPool-{self.browser_type}-refill", daemon=True).start()
+
+    def lease(self, timeout: Optional[float] = None) -> BaseWebDriver:
+        """
+        Empresta uma sessão do pool, criando uma nova se houver capacidade
+
+        Args:
+            timeout: Tempo máximo aguardando sessão livre (padrão: lease_timeout)
+
+        Returns:
+            BaseWebDriver: Sessão pronta para uso
+        """
+        timeout = self.lease_timeout if timeout is None else timeout
+        deadline = monotonic() + timeout
+        if not self._warmed:
+            self._refill()
+
+        while True:
+            driver = None
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise BrowserException("Pool de sessões encerrado")
+                    if self._idle:
+                        driver = self._idle.popleft()
+                        break
+                    if len(self._idle) + len(self._leased) + self._creating < self.max_sessions:
+                        self._creating += 1
+                        break
+                    remaining = deadline - monotonic()
+                    if remaining <= 0:
+                        raise TimeoutException(
+                            f"Nenhuma sessão livre no pool após {timeout}s (max_sessions={self.max_sessions})"
+                        )
+                    self._cond.wait(remaining)
+
+            created = driver is None
+            if created:
+                driver = self._create_session()
+            elif self.health_check and not driver.is_alive():
+                self.logger.warning("Sessão do pool falhou no health check; descartando")
+                self._discard(driver)
+                continue
+            else:
+                with self._cond:
+                    self._stats['reused'] += 1
+
+            with self._cond:
+                if created:
+                    self._creating -= 1
+                self._leased[id(driver)] = driver
+                self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+                self._stats['leases'] += 1
+            return driver
+
+    def release(self, driver: BaseWebDriver, discard: bool = False) -> None:
+        """
+        Devolve uma sessão ao pool
+
+        Args:
+            driver: Sessão obtida via lease()
+            discard: Se True, encerra a sessão em vez de reutilizá-la
+        """
+        # A sessão continua contabilizada em `_leased` durante a limpeza,
+        # para que outro lease não abra uma sessão acima de `max_sessions`
+        with self._cond:
+            if id(driver) not in self._leased:
+                raise BrowserException("Sessão não pertence a este pool ou já foi devolvida")
+            uses = self._uses.get(id(driver), 0)
+            closed = self._closed
+
+        if not discard and (closed or (self.max_uses and uses >= self.max_uses)):
+            discard = True
+
+        if not discard and self.reset_state:
+            try:
+                driver.reset_state()
+            except Exception as e:
+                self.logger.warning(f"Falha ao limpar sessão do pool; descartando: {str(e)}")
+                discard = True
+
+        if discard:
+            self._discard(driver)
+            return
+
+        with self._cond:
+            self._leased.pop(id(driver), None)
+            self._idle.append(driver)
+            self._cond.notify()
+
+    @contextmanager
+    def session(self, timeout: Optional[float] = None) -> Iterator[BaseWebDriver]:
+        """Context manager que empresta e devolve uma sessão"""
+        driver = self.lease(timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def stats(self) -> dict:
+        """Retorna contadores de uso do pool"""
+        with self._cond:
+            return {
+                **self._stats,
+                'idle': len(self._idle),
+                'leased': len(self._leased),
+            }
+
+    def close(self) -> None:
+        """Encerra sessões livres; sessões emprestadas são encerradas ao serem devolvidas"""
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+
+        for driver in idle:
+            self._discard(driver)
+        self.logger.info("Pool de sessões encerrado")
+
+    def _create_session(self) -> BaseWebDriver:
+        """
+        Cria uma sessão já contabilizada em `_creating`
+
+        Em caso de sucesso o chamador transfere a vaga para `_idle`/`_leased`.
+        """
+        try:
+            driver = self._driver_factory()
+        except Exception:
+            with self._cond:
+                self._creating -= 1
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self._stats['created'] += 1
+        self.logger.info(f"Nova sessão {self.browser_type} criada no pool")
+        return driver
+
+    def _discard(self, driver: BaseWebDriver) -> None:
+        """Encerra sessão e libera sua vaga no pool"""
+        try:
+            driver.quit()
+        finally:
+            with self._cond:
+                self._leased.pop(id(driver), None)
+                self._uses.pop(id(driver), None)
+                self._stats['discarded'] += 1
+                self._cond.notify()
+        self._refill()
+
+    def __enter__(self):
+        """Context manager support"""
+        self.warm_up()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager support"""
+        self.close()
@@ -1,85 +1,299 @@
 """
 Utility para garantir que drivers de navegador estejam instalados/atualizados
 Baixa os drivers usando webdriver-manager e armazena na pasta `drivers/` do projeto.
+
+Cada driver resolvido é registrado em `drivers/manifest.json` (versão do navegador,
+versão do driver, caminho e checksum). Quando o manifesto já aponta para um executável
+íntegro, o webdriver-manager não é consultado, evitando consultas de versão pela rede.
 """
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, Optional
+import hashlib
+import json
 import logging
+import os
+import re
 import shutil
+import subprocess
+import threading
+import time
+
 
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
+from automation_framework.core.exceptions import BrowserException
 
 
 logger = logging.getLogger(__name__)
 
+MANIFEST_NAME = "manifest.json"
+
+# Nome base do executável de cada driver (sem extensão)
+DRIVER_BINARIES = {
+    'chrome': 'chromedriver',
+    'firefox': 'geckodriver',
+    'edge': 'msedgedriver',
+}
+
+# Caminhos já validados neste processo: (pasta, navegador) -> executável
+_resolved: Dict[tuple, str] = {}
+_resolved_lock = threading.Lock()
+
 
 def _default_drivers_dir() -> Path:
     # pasta raiz do projeto: automation_framework/.. -> Framework
     return Path(__file__).resolve().parents[2] / "drivers"
 
 
-def ensure_driver_installed(browser_type: str, target_dir: Optional[str] = None, force_download: bool = False) -> str:
+@contextmanager
+def _file_lock(lock_path: Path, timeout: float = 120.0) -> Iterator[None]:
+    """
+    Lock entre processos baseado em arquivo (fcntl no POSIX, msvcrt no Windows)
+
+    Args:
+        lock_path: Arquivo usado como lock
+        timeout: Tempo máximo aguardando o lock
+    """
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    handle = open(lock_path, 'a+b')
+    deadline = time.monotonic() + timeout
+
+    try:
+        while True:
+            try:
+                if os.name == 'nt':
+                    import msvcrt
+                    handle.seek(0)
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+                else:
+                    import fcntl
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise BrowserException(f"Timeout aguardando lock de drivers: {lock_path}")
+                time.sleep(0.1)
+
+        yield
+    finally:
+        try:
+            if os.name == 'nt':
+                import msvcrt
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        except OSError:
+            pass
+        handle.close()
+
+
+def _sha256(file_path: Path) -> str:
+    """Calcula checksum SHA-256 de um arquivo"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def read_manifest(drivers_dir: Path) -> dict:
+    """Lê o manifesto de drivers (vazio se não existir ou estiver corrompido)"""
+    manifest_path = Path(drivers_dir) / MANIFEST_NAME
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _update_manifest(drivers_dir: Path, browser: str, entry: Optional[dict]) -> None:
+    """Atualiza (ou remove, se `entry` for None) a entrada de um navegador no manifesto"""
+    with _file_lock(drivers_dir / ".manifest.lock"):
+        manifest = read_manifest(drivers_dir)
+        if entry is None:
+            manifest.pop(browser, None)
+        else:
+            manifest[browser] = entry
+
+        # Escrita atômica: leitores sem lock nunca veem arquivo parcial
+        tmp_path = drivers_dir / f".{MANIFEST_NAME}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, drivers_dir / MANIFEST_NAME)
+
+
+def _validate_entry(entry: Optional[dict]) -> Optional[str]:
+    """Retorna o caminho do driver se a entrada do manifesto estiver íntegra"""
+    if not entry:
+        return None
+    path = Path(entry.get('path', ''))
+    if not path.is_file():
+        return None
+    try:
+        if entry.get('sha256') and _sha256(path) != entry['sha256']:
+            logger.warning(f"Checksum divergente para {path}; driver será resolvido novamente")
+            return None
+    except OSError:
+        return None
+    return str(path.resolve())
+
+
+def _create_manager(browser: str):
+    """Cria o manager do webdriver-manager para o navegador (importado só quando um download é necessário)"""
+    if browser == 'chrome':
+        from webdriver_manager.chrome import ChromeDriverManager
+        return ChromeDriverManager()
+    if browser == 'firefox':
+        from webdriver_manager.firefox import GeckoDriverManager
+        return GeckoDriverManager()
+    if browser == 'edge':
+        from webdriver_manager.microsoft import EdgeChromiumDriverManager
+        return EdgeChromiumDriverManager()
+    raise ValueError(f"Tipo de navegador não suportado: {browser}")
+
+
+def _driver_version(executable: Path) -> Optional[str]:
+    """Obtém a versão reportada por `<driver> --version`"""
+    try:
+        result = subprocess.run([str(executable), '--version'], capture_output=True, text=True, timeout=15)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = re.search(r'\d+(?:\.\d+)+', result.stdout or '')
+    return match.group(0) if match else None
+
+
+def _find_local_driver(drivers_dir: Path, browser: str) -> Optional[Path]:
+    """Procura um executável do driver já presente na pasta (modo offline sem manifesto)"""
+    binary = DRIVER_BINARIES[browser]
+    for name in (binary, f"{binary}.exe"):
+        candidate = drivers_dir / name
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def invalidate_driver(browser_type: str, target_dir: Optional[str] = None) -> None:
+    """
+    Remove a entrada do navegador do manifesto, forçando nova resolução
+
+    Útil quando o navegador foi atualizado e o driver registrado deixou de ser compatível.
+    """
+    drivers_dir = Path(target_dir) if target_dir else _default_drivers_dir()
+    browser = browser_type.lower()
+    with _resolved_lock:
+        _resolved.pop((str(drivers_dir), browser), None)
+    if drivers_dir.exists():
+        _update_manifest(drivers_dir, browser, None)
+
+
+def ensure_driver_installed(browser_type: str, target_dir: Optional[str] = None, force_download: bool = False,
+                            offline: bool = False) -> str:
     """
     Garante que o driver do `browser_type` esteja disponível em `target_dir`.
-    Usa `webdriver-manager` para baixar o driver (em seu cache) e copia o executável para a pasta do projeto.
+    Consulta primeiro o manifesto local; só em caso de ausência usa `webdriver-manager`
+    para baixar o driver (em seu cache) e copia o executável para a pasta do projeto.
 
     Args:
         browser_type: 'chrome' | 'firefox' | 'edge'
         target_dir: Pasta onde salvar o driver (se None, usa ./drivers no projeto)
-        force_download: Se True, remove qualquer driver existente no destino e força cópia do cache
+        force_download: Se True, ignora memória e manifesto, resolve o driver novamente pelo
+            webdriver-manager e substitui (de forma atômica) o executável e a entrada do manifesto;
+            nenhum arquivo é removido antes da nova cópia
+        offline: Se True, nunca consulta o webdriver-manager (usa apenas manifesto/pasta local)
 
     Returns:
         caminho absoluto para o executável do driver
     """
     drivers_dir = Path(target_dir) if target_dir else _default_drivers_dir()
-    drivers_dir.mkdir(parents=True, exist_ok=True)
-
     browser = browser_type.lower()
 
-    if browser == 'chrome':
-        manager = ChromeDriverManager()
-    elif browser == 'firefox':
-        manager = GeckoDriverManager()
-    elif browser == 'edge':
-        manager = EdgeChromiumDriverManager()
-    else:
+    if browser not in DRIVER_BINARIES:
         raise ValueError(f"Tipo de navegador não suportado: {browser_type}")
 
-    # Remover drivers antigos no destino se for forçar
-    if force_download:
-        for p in drivers_dir.glob('*'):
+    memo_key = (str(drivers_dir), browser)
+    if not force_download:
+        with _resolved_lock:
+            cached_path = _resolved.get(memo_key)
+        if cached_path and Path(cached_path).is_file():
+            return cached_path
+
+        cached_path = _validate_entry(read_manifest(drivers_dir).get(browser))
+        if cached_path:
+            logger.debug(f"Driver para {browser} obtido do manifesto: {cached_path}")
+            with _resolved_lock:
+                _resolved[memo_key] = cached_path
+            return cached_path
+
+    if offline:
+        local_driver = _find_local_driver(drivers_dir, browser)
+        if local_driver is None:
+            raise BrowserException(
+                f"Modo offline: nenhum driver para {browser} encontrado em {drivers_dir}"
+            )
+        logger.warning(f"Modo offline: usando driver sem registro no manifesto: {local_driver}")
+        return str(local_driver.resolve())
+
+    drivers_dir.mkdir(parents=True, exist_ok=True)
+
+    # Apenas um processo resolve/copia o driver de cada navegador por vez
+    with _file_lock(drivers_dir / f".{browser}.lock"):
+        if not force_download:
+            # Outro processo pode ter resolvido enquanto aguardávamos o lock
+            cached_path = _validate_entry(read_manifest(drivers_dir).get(browser))
+            if cached_path:
+                with _resolved_lock:
+                    _resolved[memo_key] = cached_path
+                return cached_path
+
+        try:
+            manager = _create_manager(browser)
+            # manager.install() baixa para cache do webdriver-manager e retorna o caminho do executável
+            cached_executable = Path(manager.install())
+
+            # Copiar para a pasta de drivers do projeto, a não ser que já exista
+            destination = drivers_dir / cached_executable.name
+
+            if force_download or not destination.exists() or _sha256(destination) != _sha256(cached_executable):
+                # Copia para arquivo temporário e substitui de forma atômica
+                tmp_destination = drivers_dir / f".{cached_executable.name}.{os.getpid()}.tmp"
+                shutil.copy2(str(cached_executable), str(tmp_destination))
+                os.replace(tmp_destination, destination)
+
             try:
-                if p.is_file():
-                    p.unlink()
+                browser_version = manager.driver.get_browser_version_from_os()
             except Exception:
-                pass
+                browser_version = None
 
-    try:
-        # manager.install() baixa para cache do webdriver-manager e retorna o caminho do executável
-        cached_executable = Path(manager.install())
-
-        # Copiar para a pasta de drivers do projeto, a não ser que já exista
-        destination = drivers_dir / cached_executable.name
+            entry = {
+                'browser_version': browser_version,
+                'driver_version': _driver_version(destination),
+                'path': str(destination.resolve()),
+                'sha256': _sha256(destination),
+                'resolved_at': datetime.now().isoformat(timespec='seconds'),
+            }
+            _update_manifest(drivers_dir, browser, entry)
 
-        if not destination.exists() or force_download:
-            shutil.copy2(str(cached_executable), str(destination))
+            with _resolved_lock:
+                _resolved[memo_key] = entry['path']
 
-        logger.info(f"Driver para {browser} disponível em: {str(destination.resolve())}")
-        return str(destination.resolve())
-    except Exception as e:
-        logger.exception(f"Falha ao instalar driver para {browser}: {e}")
-        raise
+            logger.info(f"Driver para {browser} disponível em: {entry['path']}")
+            return entry['path']
+        except Exception as e:
+            logger.exception(f"Falha ao instalar driver para {browser}: {e}")
+            raise
 
 
-def ensure_all_drivers(target_dir: Optional[str] = None, browsers: Optional[list] = None) -> dict:
-    """Garante drivers para múltiplos navegadores e retorna mapeamento browser->path"""
+def ensure_all_drivers(target_dir: Optional[str] = None, browsers: Optional[list] = None,
+                       offline: bool = False) -> dict:
+    """Garante drivers para múltiplos navegadores (em paralelo) e retorna mapeamento browser->path"""
     browsers = browsers or ['chrome', 'firefox', 'edge']
-    results = {}
-
-    for b in browsers:
-        path = ensure_driver_installed(b, target_dir=target_dir)
-        results[b] = path
 
-    return results
+    with ThreadPoolExecutor(max_workers=len(browsers)) as executor:
+        futures = {
+            b: executor.submit(ensure_driver_installed, b, target_dir=target_dir, offline=offline)
+            for b in browsers
+        }
+        return {b: future.result() for b, future in futures.items()}
@@ -0,0 +1,130 @@
+"""
+Cache de elementos por Locator
+Evita relocalizar o mesmo elemento (find_element + WebDriverWait) a cada ação
+enquanto a página não muda
+"""
+
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.remote.webelement import WebElement
+
+from automation_framework.core.logger import Logger
+from automation_framework.web.driver_manager import BaseWebDriver
+
+
+T = TypeVar('T')
+
+
+class ElementCache:
+    """
+    Cache de WebElements válido para o documento atual
+
+    O cache é descartado quando o driver navega (get/refresh/reset) e, com
+    `verify_url=True`, também quando a URL muda sem navegação do framework
+    (ex: rotas de SPA). Elementos que ficaram obsoletos são relocalizados
+    automaticamente em `run()`.
+    """
+
+    def __init__(self, driver: BaseWebDriver, verify_url: bool = False):
+        """
+        Args:
+            driver: Driver dono dos elementos
+            verify_url: Se True, confere a URL atual antes de usar o cache (1 chamada extra)
+        """
+        self.driver = driver
+        self.verify_url = verify_url
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        self._elements: Dict[Hashable, WebElement] = {}
+        self._navigation_count = driver.navigation_count
+        self._url: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _key(locator: Any) -> Hashable:
+        """Chave do cache para o localizador"""
+        return (locator.by, locator.value)
+
+    def rebind(self, driver: BaseWebDriver) -> None:
+        """Associa o cache a outro driver, descartando os elementos atuais"""
+        self.driver = driver
+        self.invalidate()
+
+    def invalidate(self, locator: Optional[Any] = None) -> None:
+        """
+        Descarta elementos do cache
+
+        Args:
+            locator: Localizador a descartar (None para descartar todos)
+        """
+        if locator is not None:
+            self._elements.pop(self._key(locator), None)
+            return
+        if self._elements:
+            self.invalidations += 1
+        self._elements.clear()
+        self._navigation_count = self.driver.navigation_count
+        self._url = None
+
+    def _check_document(self) -> None:
+        """Descarta o cache se o documento mudou"""
+        if self.driver.navigation_count != self._navigation_count:
+            self.invalidate()
+        if self.verify_url:
+            url = self.driver.get_current_url()
+            if self._url is not None and url != self._url:
+                self.invalidate()
+            self._url = url
+
+    def get(self, locator: Any, resolve: Callable[[], WebElement]) -> WebElement:
+        """
+        Obtém elemento do cache ou resolve e armazena
+
+        Args:
+            locator: Localizador usado como chave
+            resolve: Função que localiza o elemento no navegador
+        """
+        self._check_document()
+        key = self._key(locator)
+        element = self._elements.get(key)
+        if element is not None:
+            self.hits += 1
+            return element
+
+        self.misses += 1
+        element = resolve()
+        self._elements[key] = element
+        return element
+
+    def run(self, locator: Any, resolve: Callable[[], WebElement], action: Callable[[WebElement], T]) -> T:
+        """
+        Executa ação sobre o elemento em cache, relocalizando-o se estiver obsoleto
+
+        Args:
+            locator: Localizador usado como chave
+            resolve: Função que localiza o elemento no navegador
+            action: Ação executada com o elemento
+        """
+        element = self.get(locator, resolve)
+        try:
+            return action(element)
+        except StaleElementReferenceException:
+            self.stale += 1
+            self.logger.debug(f"Elemento obsoleto no cache, relocalizando: {locator}")
+            self.invalidate(locator)
+            return action(self.get(locator, resolve))
+
+    def stats(self) -> dict:
+        """Retorna contadores de acertos/falhas do cache"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'stale': self.stale,
+            'invalidations': self.invalidations,
+            'size': len(self._elements),
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
@@ -3,21 +3,128 @@ Localizadores fluentes e helpers para elementos web
 Implementa pattern Fluent Interface para queries elegantes
 """
 
-from typing import Optional, Callable, Any
+import threading
+import weakref
+from typing import Optional, Callable, Any, Dict, Iterable, Iterator, List, Mapping, Tuple, Union
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from automation_framework.core.logger import Logger
+from automation_framework.web.scripts import FORM_FILL_JS, LOCATE_ALL_JS, TABLE_INFO_JS, TABLE_ROWS_JS
+
+
+# Estratégias do framework resolvidas por script no navegador (sem equivalente no WebDriver)
+TEXT = 'text'
+ANY = 'any'
+SCRIPT_STRATEGIES = frozenset({TEXT, ANY})
 
 
 class Locator:
-    """Encapsula um localizador (By, value)"""
+    """
+    Encapsula um localizador (By, value)
 
-    def __init__(self, by: By, value: str):
-        self.by = by
-        self.value = value
+    Localizadores são imutáveis e internados: o mesmo (by, value) sempre retorna a
+    mesma instância, servindo como chave de cache. Alternativas podem ser
+    encadeadas (`or_css`, `or_xpath`, `or_text`); a cadeia é resolvida no navegador
+    em uma única chamada, na ordem de preferência, sem aguardar o timeout de cada uma.
+
+    Exemplo:
+        ENVIAR = Locator.id("enviar").or_css("form button[type=submit]").or_text("Enviar")
+    """
+
+    __slots__ = ('by', 'value', '_hash', '__weakref__')
+
+    _interned: 'weakref.WeakValueDictionary' = weakref.WeakValueDictionary()
+    _intern_lock = threading.Lock()
+
+    def __new__(cls, by: By, value: Any) -> 'Locator':
+        if by == ANY:
+            value = cls._flatten(value)
+            if len(value) == 1:
+                by, value = value[0]
+        key = (cls, by, value)
+        with cls._intern_lock:
+            locator = cls._interned.get(key)
+            if locator is None:
+                locator = super().__new__(cls)
+                object.__setattr__(locator, 'by', by)
+                object.__setattr__(locator, 'value', value)
+                object.__setattr__(locator, '_hash', hash((by, value)))
+                cls._interned[key] = locator
+        return locator
+
+    @staticmethod
+    def _flatten(alternatives: Iterable[Any]) -> tuple:
+        """Normaliza alternativas para tupla de pares (by, value), sem repetição"""
+        flat = []
+        for alternative in alternatives:
+            if isinstance(alternative, Locator):
+                pairs = alternative.value if alternative.by == ANY else ((alternative.by, alternative.value),)
+            else:
+                pairs = (tuple(alternative),)
+            for pair in pairs:
+                if pair not in flat:
+                    flat.append(pair)
+        if not flat:
+            raise ValueError("Localizador composto sem alternativas")
+        return tuple(flat)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Locator é imutável")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Locator é imutável")
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Locator):
+            return NotImplemented
+        return self.by == other.by and self.value == other.value
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        return (self.__class__, (self.by, self.value))
 
     def __repr__(self):
-        return f"Locator({self.by.name}, '{self.value}')"
+        if self.by == ANY:
+            return f"Locator.any({', '.join(repr(alternative) for alternative in self.alternatives)})"
+        # By.* são strings ('css selector'); exibidas como o nome da constante (CSS_SELECTOR)
+        return f"Locator({self.by.upper().replace(' ', '_')}, '{self.value}')"
+
+    @property
+    def is_composite(self) -> bool:
+        """Se possui alternativas"""
+        return self.by == ANY
+
+    @property
+    def alternatives(self) -> Tuple['Locator', ...]:
+        """Alternativas em ordem de preferência (o próprio localizador se não for composto)"""
+        if self.by == ANY:
+            return tuple(Locator(by, value) for by, value in self.value)
+        return (self,)
+
+    @classmethod
+    def any(cls, *locators: 'Locator') -> 'Locator':
+        """Combina localizadores em uma cadeia de alternativas (ordem de preferência)"""
+        return cls(ANY, locators)
+
+    def or_(self, locator: 'Locator') -> 'Locator':
+        """Adiciona alternativa usada quando as anteriores não encontram o elemento"""
+        return Locator.any(self, locator)
+
+    def or_css(self, value: str) -> 'Locator':
+        """Adiciona alternativa por CSS Selector"""
+        return self.or_(Locator.css_selector(value))
+
+    def or_xpath(self, value: str) -> 'Locator':
+        """Adiciona alternativa por XPath"""
+        return self.or_(Locator.xpath(value))
+
+    def or_text(self, value: str) -> 'Locator':
+        """Adiciona alternativa por texto exato"""
+        return self.or_(Locator.text(value))
 
     @staticmethod
     def id(value: str) -> 'Locator':
@@ -59,6 +166,11 @@ class Locator:
         """Localiza link por texto parcial"""
         return Locator(By.PARTIAL_LINK_TEXT, value)
 
+    @staticmethod
+    def text(value: str) -> 'Locator':
+        """Localiza o elemento mais interno com o texto exato (espaços normalizados)"""
+        return Locator(TEXT, value)
+
 
 class ElementHelper:
     """
@@ -117,6 +229,8 @@ class ElementHelper:
     def find_child_element(element: WebElement, by: By, value: str) -> Optional[WebElement]:
         """Localiza elemento filho"""
         try:
+            if by in SCRIPT_STRATEGIES:
+                return (element.parent.execute_script(LOCATE_ALL_JS, by, value, element) or [None])[0]
             return element.find_element(by, value)
         except:
             return None
@@ -125,6 +239,8 @@ class ElementHelper:
     def find_child_elements(element: WebElement, by: By, value: str) -> list:
         """Localiza múltiplos elementos filhos"""
         try:
+            if by in SCRIPT_STRATEGIES:
+                return element.parent.execute_script(LOCATE_ALL_JS, by, value, element)
             return element.find_elements(by, value)
         except:
             return []
@@ -133,31 +249,46 @@ class ElementHelper:
 class Table:
     """
     Helper para trabalhar com tabelas HTML
+
+    Contagens e extração de linhas são feitas por script no navegador, em blocos,
+    em vez de uma chamada WebDriver por linha/célula.
     """
 
+    DEFAULT_CHUNK_SIZE = 500
+
     def __init__(self, table_element: WebElement):
         self.table = table_element
         self.logger = Logger.get_logger(self.__class__.__name__)
 
+    def _execute_script(self, script: str, *args):
+        """Executa script no navegador dono da tabela, com a tabela como primeiro argumento"""
+        return self.table.parent.execute_script(script, self.table, *args)
+
+    def get_info(self) -> dict:
+        """Obtém número de linhas, colunas e cabeçalhos em uma única chamada"""
+        return self._execute_script(TABLE_INFO_JS)
+
     def get_row_count(self) -> int:
         """Obtém número de linhas da tabela"""
         try:
-            rows = self.table.find_elements(By.XPATH, ".//tr")
-            return len(rows)
+            return self.get_info()['rows']
         except:
             return 0
 
     def get_column_count(self) -> int:
         """Obtém número de colunas da tabela"""
         try:
-            headers = self.table.find_elements(By.XPATH, ".//th")
-            if headers:
-                return len(headers)
-            cells = self.table.find_elements(By.XPATH, ".//tr[1]/td")
-            return len(cells)
+            return self.get_info()['columns']
         except:
             return 0
 
+    def get_headers(self) -> List[str]:
+        """Obtém textos do cabeçalho (primeira linha com <th>)"""
+        try:
+            return self.get_info()['headers']
+        except:
+            return []
+
     def get_cell_text(self, row: int, column: int) -> str:
         """Obtém texto de uma célula"""
         try:
@@ -170,8 +301,12 @@ class Table:
     def get_row_data(self, row: int) -> list:
         """Obtém dados de uma linha completa"""
         try:
-            cells = self.table.find_elements(By.XPATH, f".//tr[{row + 1}]/td")
-            return [cell.text.strip() for cell in cells]
+            chunk = self._execute_script(TABLE_ROWS_JS, row, 1)
+            rows = chunk['rows']
+            # A linha pedida não tem <td> (ex: cabeçalho)
+            if not rows or chunk['next'] != row + 1:
+                return []
+            return rows[0]
         except:
             return []
 
@@ -183,17 +318,53 @@ class Table:
         except:
             return None
 
-    def get_all_data(self) -> list:
-        """Obtém todos os dados da tabela como lista de listas"""
-        data = []
-        rows = self.table.find_elements(By.XPATH, ".//tr")
+    def iter_rows(self, chunk_size: int = DEFAULT_CHUNK_SIZE, as_dict: bool = False) -> Iterator[Union[list, dict]]:
+        """
+        Percorre as linhas de dados da tabela em blocos
+
+        Cada bloco é lido com um único script, sem manter a tabela inteira em memória.
+
+        Args:
+            chunk_size: Linhas lidas por chamada ao navegador
+            as_dict: Se True, retorna cada linha como dicionário cabeçalho -> valor
+
+        Yields:
+            Lista de textos das células (ou dicionário, se `as_dict`)
 
-        for row in rows:
-            cells = row.find_elements(By.XPATH, ".//td")
-            if cells:
-                data.append([cell.text.strip() for cell in cells])
+        Raises:
+            ValueError: Se chunk_size for menor que 1
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size deve ser >= 1 (recebido: {chunk_size})")
+        return self._iter_rows(chunk_size, as_dict)
 
-        return data
+    def _iter_rows(self, chunk_size: int, as_dict: bool) -> Iterator[Union[list, dict]]:
+        headers = self.get_headers() if as_dict else []
+        index = 0
+
+        while True:
+            chunk = self._execute_script(TABLE_ROWS_JS, index, chunk_size)
+            for row in chunk['rows']:
+                yield self._row_to_dict(headers, row) if as_dict else row
+            if chunk['done']:
+                return
+            index = chunk['next']
+
+    @staticmethod
+    def _row_to_dict(headers: List[str], row: list) -> dict:
+        """Associa células aos cabeçalhos (colunas sem cabeçalho viram 'coluna_N')"""
+        return {
+            headers[i] if i < len(headers) and headers[i] else f"coluna_{i}": value
+            for i, value in enumerate(row)
+        }
+
+    def get_all_data(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> list:
+        """Obtém todos os dados da tabela como lista de listas"""
+        return list(self.iter_rows(chunk_size))
+
+    def get_all_dicts(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[dict]:
+        """Obtém todos os dados da tabela como lista de dicionários (cabeçalho -> valor)"""
+        return list(self.iter_rows(chunk_size, as_dict=True))
 
 
 class Form:
@@ -205,35 +376,64 @@ class Form:
         self.form = form_element
         self.logger = Logger.get_logger(self.__class__.__name__)
 
-    def fill_text_field(self, field_name: str, value: str) -> None:
-        """Preenche campo de texto por name"""
+    def fill_text_field(self, field_name: str, value: str) -> bool:
+        """Preenche campo de texto por name digitando o valor (send_keys)"""
         try:
             field = self.form.find_element(By.NAME, field_name)
             field.clear()
             field.send_keys(value)
             self.logger.info(f"Campo '{field_name}' preenchido")
+            return True
         except Exception as e:
             self.logger.error(f"Erro ao preencher campo '{field_name}': {str(e)}")
+            return False
+
+    def fill(self, values: Mapping[str, Any], keystroke_fields: Iterable[str] = ()) -> Dict[str, str]:
+        """
+        Preenche vários campos do formulário em uma única chamada ao navegador
+
+        Campos de texto recebem o valor e os eventos 'input'/'change'; selects são
+        escolhidos por value ou texto (lista para select múltiplo); checkboxes aceitam
+        bool (ou lista de values em grupos) e radios o value da opção.
+
+        Args:
+            values: Dicionário name -> valor
+            keystroke_fields: Campos que precisam de digitação real (send_keys),
+                por exemplo campos com máscara ou autocomplete
+
+        Returns:
+            Dicionário name -> status ('ok', 'not_found', 'option_not_found', 'disabled')
+        """
+        keystroke_fields = set(keystroke_fields)
+        scripted = {name: value for name, value in values.items() if name not in keystroke_fields}
+
+        result: Dict[str, str] = {}
+        if scripted:
+            result.update(self.form.parent.execute_script(FORM_FILL_JS, self.form, scripted))
+
+        for name in keystroke_fields:
+            if name in values:
+                result[name] = 'ok' if self.fill_text_field(name, str(values[name])) else 'not_found'
+
+        failed = {name: status for name, status in result.items() if status != 'ok'}
+        if failed:
+            self.logger.warning(f"Campos não preenchidos: {failed}")
+        self.logger.info(f"Formulário preenchido: {len(result) - len(failed)}/{len(result)} campos")
+        return result
 
     def select_dropdown(self, field_name: str, value: str) -> None:
-        """Seleciona opção de dropdown por name"""
+        """Seleciona opção de dropdown por name (valor ou texto da opção)"""
         try:
-            select = self.form.find_element(By.NAME, field_name)
-            options = select.find_elements(By.TAG_NAME, "option")
-            for option in options:
-                if option.text == value or option.get_attribute('value') == value:
-                    option.click()
-                    return
-            self.logger.warning(f"Opção '{value}' não encontrada em '{field_name}'")
+            status = self.fill({field_name: value})[field_name]
+            if status == 'option_not_found':
+                self.logger.warning(f"Opção '{value}' não encontrada em '{field_name}'")
         except Exception as e:
             self.logger.error(f"Erro ao selecionar dropdown '{field_name}': {str(e)}")
 
     def check_checkbox(self, field_name: str) -> None:
         """Marca checkbox por name"""
         try:
-            checkbox = self.form.find_element(By.NAME, field_name)
-            if not checkbox.is_selected():
-                checkbox.click()
+            if self.fill({field_name: True})[field_name] == 'ok':
                 self.logger.info(f"Checkbox '{field_name}' marcado")
         except Exception as e:
             self.logger.error(f"Erro ao marcar checkbox '{field_name}': {str(e)}")
@@ -241,9 +441,7 @@ class Form:
     def uncheck_checkbox(self, field_name: str) -> None:
         """Desmarca checkbox por name"""
         try:
-            checkbox = self.form.find_element(By.NAME, field_name)
-            if checkbox.is_selected():
-                checkbox.click()
+            if self.fill({field_name: False})[field_name] == 'ok':
                 self.logger.info(f"Checkbox '{field_name}' desmarcado")
         except Exception as e:
             self.logger.error(f"Erro ao desmarcar checkbox '{field_name}': {str(e)}")
@@ -3,13 +3,20 @@ Base Page Object Model
 Classe base para criar page objects reutilizáveis
 """
 
-from typing import Optional, List
+from typing import Any, Callable, Dict, Mapping, Optional, List, Sequence, Tuple, Union
+from selenium.common.exceptions import ElementClickInterceptedException, ElementNotInteractableException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 
+from automation_framework.core.config import ConfigManager
+from automation_framework.core.exceptions import ElementNotFound, TimeoutException
 from automation_framework.core.logger import Logger
-from automation_framework.web.driver_manager import BaseWebDriver
+from automation_framework.web.driver_manager import BaseWebDriver, DriverManager
+from automation_framework.web.element_cache import ElementCache
 from automation_framework.web.locators import Locator, ElementHelper, Table, Form
+from automation_framework.web.readiness import ReadinessSignal
+from automation_framework.web.self_healing import LocatorHealer
+from automation_framework.web.snapshot import DomSnapshot
 
 
 class BasePage:
@@ -18,45 +25,214 @@ class BasePage:
     Fornece métodos comuns para interação com páginas
     """
 
-    def __init__(self, driver: BaseWebDriver):
-        self.driver = driver
+    def __init__(self, driver: Optional[BaseWebDriver] = None, session: Optional[str] = None,
+                 cache_elements: bool = False, self_healing: Optional[bool] = None):
+        """
+        Args:
+            driver: Driver usado pela página
+            session: Nome da sessão do DriverManager (usado quando `driver` não é informado)
+            cache_elements: Reutiliza elementos já localizados em click/type_text/get_text/get_attribute
+            self_healing: Cura localizadores da classe que quebraram (padrão: self_healing.enabled)
+        """
+        self._driver = driver
+        self.session = DriverManager().session_key(session) if driver is None else driver.session_name
         self.logger = Logger.get_logger(self.__class__.__name__)
-
-    def navigate_to(self, url: str) -> None:
-        """Navega para URL"""
-        self.driver.get(url)
+        self.element_cache: Optional[ElementCache] = None
+        if cache_elements:
+            self.enable_element_cache()
+        if self_healing is None:
+            self_healing = ConfigManager().get_self_healing_config().enabled
+        self.healer: Optional[LocatorHealer] = LocatorHealer.shared() if self_healing else None
+
+    @property
+    def driver(self) -> BaseWebDriver:
+        """Driver da página; páginas vinculadas por nome seguem a sessão do DriverManager"""
+        if self._driver is not None:
+            return self._driver
+        return DriverManager().get_driver(self.session)
+
+    @driver.setter
+    def driver(self, driver: BaseWebDriver) -> None:
+        self._driver = driver
+
+    def enable_element_cache(self, verify_url: bool = False) -> ElementCache:
+        """
+        Ativa o cache de elementos da página
+
+        Args:
+            verify_url: Se True, confere a URL antes de cada uso do cache (para SPAs)
+
+        Returns:
+            ElementCache: Cache ativo (expõe `stats()` com acertos/falhas)
+        """
+        self.element_cache = ElementCache(self.driver, verify_url=verify_url)
+        return self.element_cache
+
+    def disable_element_cache(self) -> None:
+        """Desativa o cache de elementos da página"""
+        self.element_cache = None
+
+    def _cached(self, locator: Locator, action: Callable[[WebElement], Any]) -> Any:
+        """Executa ação no elemento em cache, relocalizando quando necessário"""
+        driver = self.driver
+        if self.element_cache.driver is not driver:
+            self.element_cache.rebind(driver)
+        return self.element_cache.run(locator, lambda: self.find_element(locator), action)
+
+    def _heal(self, locator: Locator, condition: str = 'present', timeout: Optional[float] = None) -> Optional[WebElement]:
+        """Elemento localizado com cura; None se a cura está desligada ou o localizador é avulso"""
+        if self.healer is None:
+            return None
+        return self.healer.locate(self.driver, type(self), locator, condition, timeout)
+
+    def navigate_to(self, url: str, ready: Union[None, str, Locator, ReadinessSignal] = None) -> None:
+        """
+        Navega para URL
+
+        Args:
+            ready: Sinal de prontidão ('dom_content_loaded', 'network_idle', Locator...);
+                padrão: `ready_signal` da configuração
+        """
+        self.driver.get(url, ready=ready)
+        if self.element_cache:
+            self.element_cache.invalidate()
         self.logger.info(f"Navegando para: {url}")
 
     def find_element(self, locator: Locator) -> WebElement:
         """Localiza elemento usando Locator"""
+        element = self._heal(locator)
+        if element is not None:
+            return element
         return self.driver.find_element(locator.by, locator.value)
 
-    def find_elements(self, locator: Locator) -> List[WebElement]:
-        """Localiza múltiplos elementos usando Locator"""
-        return self.driver.find_elements(locator.by, locator.value)
+    def find_elements(self, locator: Locator, timeout: Optional[float] = None) -> List[WebElement]:
+        """Localiza múltiplos elementos usando Locator (timeout=0 não aguarda)"""
+        return self.driver.find_elements(locator.by, locator.value, timeout)
+
+    def probe(self, locator: Locator, visible: bool = False) -> Optional[WebElement]:
+        """Retorna o elemento se existir no DOM atual, sem aguardar"""
+        return self.driver.probe(locator.by, locator.value, visible)
+
+    def resolve(self, locator: Locator, visible: bool = False) -> Tuple[Optional[WebElement], Optional[Locator]]:
+        """
+        Resolve o localizador (e suas alternativas) em uma única chamada, sem aguardar
+
+        Returns:
+            Tupla (elemento, alternativa que encontrou o elemento) ou (None, None)
+        """
+        element, index = self.driver.resolve(locator.by, locator.value, 'visible' if visible else 'present')
+        if element is None:
+            return None, None
+        return element, locator.alternatives[index]
+
+    def exists_now(self, locator: Locator, visible: bool = False) -> bool:
+        """Verifica imediatamente se o elemento existe no DOM atual"""
+        return self.driver.exists_now(locator.by, locator.value, visible)
+
+    def probe_many(self, locators: Union[Sequence[Locator], Mapping[str, Locator]]) -> Dict[Any, bool]:
+        """Verifica a presença de vários elementos em uma única chamada"""
+        return self.driver.probe_many(locators)
+
+    def expect_absent(self, locator: Locator, timeout: Optional[float] = None, quiet_ms: int = 500) -> bool:
+        """Confirma ausência do elemento assim que a página estabiliza"""
+        return self.driver.expect_absent(locator.by, locator.value, timeout, quiet_ms)
 
     def click(self, locator: Locator) -> None:
         """Clica em elemento"""
-        self.driver.click(locator.by, locator.value)
+        if not self.element_cache:
+            element = self._heal(locator, 'clickable')
+            if element is not None:
+                element.click()
+                return
+            self.driver.click(locator.by, locator.value)
+            return
+        try:
+            self._cached(locator, lambda element: element.click())
+        except (ElementClickInterceptedException, ElementNotInteractableException):
+            # Elemento ainda não clicável: usa o caminho com espera explícita
+            self.driver.click(locator.by, locator.value)
 
     def type_text(self, locator: Locator, text: str, clear_first: bool = True) -> None:
         """Digita texto"""
-        self.driver.type_text(locator.by, locator.value, text, clear_first)
+        def type_into(element: WebElement) -> None:
+            if clear_first:
+                element.clear()
+            element.send_keys(text)
+
+        if not self.element_cache:
+            element = self._heal(locator)
+            if element is not None:
+                type_into(element)
+                return
+            self.driver.type_text(locator.by, locator.value, text, clear_first)
+            return
+
+        self._cached(locator, type_into)
 
     def get_text(self, locator: Locator) -> str:
         """Obtém texto do elemento"""
-        return self.driver.get_text(locator.by, locator.value)
+        if not self.element_cache:
+            element = self._heal(locator)
+            if element is not None:
+                return element.text
+            return self.driver.get_text(locator.by, locator.value)
+        return self._cached(locator, lambda element: element.text)
 
     def get_attribute(self, locator: Locator, attribute: str) -> str:
         """Obtém atributo do elemento"""
-        return self.driver.get_attribute(locator.by, locator.value, attribute)
+        if not self.element_cache:
+            element = self._heal(locator)
+            if element is not None:
+                return element.get_attribute(attribute)
+            return self.driver.get_attribute(locator.by, locator.value, attribute)
+        return self._cached(locator, lambda element: element.get_attribute(attribute))
+
+    def read_elements(self,
+                      locators: Union[Sequence[Locator], Mapping[str, Locator]],
+                      attributes: Optional[Sequence[str]] = None,
+                      properties: Optional[Sequence[str]] = None,
+                      text: bool = True,
+                      timeout: float = 0) -> Dict[Any, dict]:
+        """Lê texto/atributos de vários elementos em uma única chamada ao navegador"""
+        return self.driver.read_elements(locators, attributes, properties, text=text, timeout=timeout)
+
+    def snapshot(self, root: Optional[Locator] = None) -> DomSnapshot:
+        """
+        Captura o DOM atual para consultas locais (sem chamadas WebDriver por leitura)
+
+        Args:
+            root: Captura apenas o HTML deste elemento (padrão: página inteira)
+
+        Returns:
+            DomSnapshot: Consultas por Locator sobre o DOM congelado
+        """
+        if root is None:
+            source = self.driver.get_page_source()
+        else:
+            source = self.driver.execute_script("return arguments[0].outerHTML;", self.find_element(root))
+        snapshot = DomSnapshot(source, url=self.driver.get_current_url())
+        self.logger.debug(f"Snapshot do DOM capturado ({len(source)} caracteres)")
+        return snapshot
 
     def is_element_visible(self, locator: Locator, timeout: int = 5) -> bool:
         """Verifica se elemento está visível"""
+        if self.healer is not None:
+            try:
+                element = self._heal(locator, 'visible', timeout)
+            except ElementNotFound:
+                return False
+            if element is not None:
+                return True
         return self.driver.is_element_visible(locator.by, locator.value, timeout)
 
     def wait_for_element(self, locator: Locator, timeout: Optional[int] = None) -> WebElement:
         """Aguarda elemento aparecer"""
+        try:
+            element = self._heal(locator, 'present', timeout)
+        except ElementNotFound:
+            raise TimeoutException(f"Timeout aguardando elemento: {locator!r}")
+        if element is not None:
+            return element
         return self.driver.wait_for_element(locator.by, locator.value, timeout)
 
     def execute_script(self, script: str, *args):
@@ -78,6 +254,8 @@ class BasePage:
     def refresh(self) -> None:
         """Atualiza a página"""
         self.driver.refresh()
+        if self.element_cache:
+            self.element_cache.invalidate()
 
     def get_table(self, locator: Locator) -> Table:
         """Retorna helper para trabalhar com tabela"""
@@ -91,14 +269,8 @@ class BasePage:
 
     def wait_for_url(self, partial_url: str, timeout: int = 10) -> bool:
         """Aguarda URL conter texto específico"""
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-
         try:
-            WebDriverWait(self.driver.driver, timeout).until(
-                EC.url_contains(partial_url)
-            )
-            return True
+            return self.driver.wait_for_url(partial_url, timeout)
         except:
             return False
 
@@ -122,11 +294,29 @@ class BaseComponent:
     Usada para agrupar elementos e ações relacionadas
     """
 
-    def __init__(self, driver: BaseWebDriver, root_locator: Locator):
-        self.driver = driver
+    def __init__(self, driver: Optional[BaseWebDriver], root_locator: Locator, session: Optional[str] = None):
+        """
+        Args:
+            driver: Driver usado pelo componente (None para usar `session`)
+            root_locator: Localizador do elemento raiz
+            session: Nome da sessão do DriverManager (usado quando `driver` é None)
+        """
+        self._driver = driver
+        self.session = DriverManager().session_key(session) if driver is None else driver.session_name
         self.root_locator = root_locator
         self.logger = Logger.get_logger(self.__class__.__name__)
 
+    @property
+    def driver(self) -> BaseWebDriver:
+        """Driver do componente; componentes vinculados por nome seguem a sessão do DriverManager"""
+        if self._driver is not None:
+            return self._driver
+        return DriverManager().get_driver(self.session)
+
+    @driver.setter
+    def driver(self, driver: BaseWebDriver) -> None:
+        self._driver = driver
+
     def get_root_element(self) -> WebElement:
         """Obtém elemento raiz do componente"""
         return self.driver.find_element(self.root_locator.by, self.root_locator.value)
@@ -0,0 +1,169 @@
+"""
+Templates de perfil do navegador
+Um perfil aquecido (cache HTTP, primeira execução concluída) é preparado uma vez
+e cada sessão recebe um clone descartável, permitindo navegadores em paralelo
+sem compartilhar o mesmo user_data_dir
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional, Sequence
+
+from automation_framework.core.exceptions import ConfigurationException
+from automation_framework.core.logger import Logger
+
+
+# Arquivos de trava que impedem abrir o clone (Chromium e Firefox)
+LOCK_FILES = {'SingletonLock', 'SingletonCookie', 'SingletonSocket', 'lockfile', 'parent.lock', '.parentlock', 'lock'}
+
+METADATA_FILE = 'af-template.json'
+
+# Sem hardlink: caches (simple cache, code cache, cache2) são alterados no lugar e o
+# arquivo compartilhado seria corrompido entre clones e template
+CLONE_METHODS = ('auto', 'reflink', 'copy')
+
+
+class ProfileTemplate:
+    """
+    Perfil modelo clonado a cada sessão
+
+    Métodos de clonagem:
+        auto: reflink (copy-on-write) se o sistema de arquivos suportar, senão cópia
+        reflink: `cp --reflink` (Btrfs/XFS/APFS) — falha se não suportado
+        copy: cópia completa
+    """
+
+    _reflink_supported: Optional[bool] = None
+
+    def __init__(self, template_dir: str, clone_method: str = 'auto'):
+        if clone_method not in CLONE_METHODS:
+            raise ConfigurationException(f"Método de clonagem inválido: {clone_method} (use {CLONE_METHODS})")
+        self.template_dir = Path(template_dir)
+        if not self.template_dir.is_dir():
+            raise ConfigurationException(f"Template de perfil não encontrado: {template_dir}")
+        self.clone_method = clone_method
+        # Clones no mesmo sistema de arquivos do template (requisito de reflink)
+        self.clones_dir = self.template_dir.parent / f"{self.template_dir.name}.clones"
+        self.logger = Logger.get_logger(self.__class__.__name__)
+
+    @property
+    def metadata(self) -> dict:
+        """Metadados gravados na preparação (browser, cold_start_seconds, ...)"""
+        try:
+            return json.loads((self.template_dir / METADATA_FILE).read_text(encoding='utf-8'))
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    @classmethod
+    def prepare(cls, template_dir: str, browser_type: Optional[str] = None,
+                warm_urls: Sequence[str] = (), clone_method: str = 'auto') -> 'ProfileTemplate':
+        """
+        Cria o template abrindo o navegador com perfil vazio e visitando `warm_urls`
+
+        O tempo de inicialização com perfil vazio fica registrado para comparação
+        com as sessões que usam clones.
+        """
+        from automation_framework.core.config import ConfigManager
+        from automation_framework.web.driver_manager import DriverManager
+
+        browser_config = ConfigManager().get_browser_config()
+        browser_type = (browser_type or browser_config.browser_type).lower()
+        path = Path(template_dir)
+        if path.exists():
+            shutil.rmtree(path)
+        path.mkdir(parents=True)
+
+        config = {**browser_config.__dict__, 'user_data_dir': str(path.resolve()), 'profile_template': None}
+        driver = DriverManager._get_driver_class(browser_type)(config)
+        started = time.perf_counter()
+        driver.initialize()
+        cold_start = time.perf_counter() - started
+        try:
+            for url in warm_urls:
+                driver.get(url)
+        finally:
+            driver.quit()
+
+        metadata = {
+            'browser': browser_type,
+            'created_at': time.time(),
+            'cold_start_seconds': round(cold_start, 3),
+            'warm_urls': list(warm_urls),
+        }
+        (path / METADATA_FILE).write_text(json.dumps(metadata, indent=2), encoding='utf-8')
+        template = cls(str(path), clone_method)
+        template.logger.info(f"Template de perfil preparado em {path} (início a frio: {cold_start:.2f}s)")
+        return template
+
+    @classmethod
+    def _reflink_command(cls) -> Optional[list]:
+        if sys.platform == 'darwin':
+            return ['cp', '-c', '-R']
+        if sys.platform.startswith('linux'):
+            return ['cp', '--reflink=always', '-R']
+        return None
+
+    def _clone_reflink(self, target: Path) -> bool:
+        command = self._reflink_command()
+        if command is None or ProfileTemplate._reflink_supported is False:
+            return False
+        result = subprocess.run(command + [f"{self.template_dir}/.", str(target)], capture_output=True)
+        ProfileTemplate._reflink_supported = result.returncode == 0
+        if result.returncode != 0:
+            # Cópia parcial deixada pelo cp é descartada antes do fallback
+            shutil.rmtree(target, ignore_errors=True)
+            target.mkdir()
+        return result.returncode == 0
+
+    def _clone_files(self, target: Path) -> None:
+        for root, dirs, files in os.walk(self.template_dir):
+            destination = target / Path(root).relative_to(self.template_dir)
+            destination.mkdir(exist_ok=True)
+            for name in files:
+                if name in LOCK_FILES:
+                    continue
+                source = Path(root) / name
+                if source.is_symlink():
+                    continue
+                shutil.copy2(source, destination / name)
+
+    def clone(self) -> Path:
+        """
+        Cria clone descartável do template
+
+        Returns:
+            Pasta do clone (remover com `remove_clone`)
+        """
+        self.clones_dir.mkdir(exist_ok=True)
+        target = Path(tempfile.mkdtemp(prefix='profile-', dir=str(self.clones_dir)))
+
+        method = self.clone_method
+        if method in ('auto', 'reflink'):
+            if self._clone_reflink(target):
+                method = 'reflink'
+            elif method == 'reflink':
+                self.remove_clone(target)
+                raise ConfigurationException("Sistema de arquivos não suporta reflink")
+            else:
+                method = 'copy'
+        if method != 'reflink':
+            self._clone_files(target)
+
+        for name in LOCK_FILES:
+            lock = target / name
+            if lock.is_symlink() or lock.exists():
+                lock.unlink()
+        (target / METADATA_FILE).unlink(missing_ok=True)
+        self.logger.debug(f"Perfil clonado ({method}): {target}")
+        return target
+
+    @staticmethod
+    def remove_clone(path: Path) -> None:
+        """Remove o clone de perfil"""
+        shutil.rmtree(path, ignore_errors=True)
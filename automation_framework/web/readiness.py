@@ -0,0 +1,93 @@
+"""
+Sinais de prontidão de página
+Com `page_load_strategy` eager/none o `get()` retorna cedo e a página é
+considerada pronta pelo sinal configurado, sem esperar anúncios e analytics
+"""
+
+from typing import Any, Dict, Optional, Union
+
+
+class ReadinessSignal:
+    """
+    Sinal avaliado no navegador por READY_JS
+
+    Subclasses definem `name` e as opções enviadas ao script; novos sinais
+    precisam do case correspondente em `afReady`.
+    """
+
+    name: str = ""
+
+    def options(self) -> Dict[str, Any]:
+        """Opções do sinal passadas ao script"""
+        return {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.options() or ''})"
+
+
+class DomContentLoaded(ReadinessSignal):
+    """HTML analisado (DOMContentLoaded), sem aguardar imagens e subrecursos"""
+
+    name = 'dom_content_loaded'
+
+
+class DocumentLoaded(ReadinessSignal):
+    """Evento load completo (equivalente ao page_load_strategy normal)"""
+
+    name = 'load'
+
+
+class NetworkIdle(ReadinessSignal):
+    """DOM pronto e nenhum fetch/XHR em andamento há `quiet_ms`"""
+
+    name = 'network_idle'
+
+    def __init__(self, quiet_ms: int = 500):
+        self.quiet_ms = quiet_ms
+
+    def options(self) -> Dict[str, Any]:
+        return {'quietMs': self.quiet_ms}
+
+
+class LocatorPresent(ReadinessSignal):
+    """Elemento específico presente (ou visível/clicável) na página"""
+
+    name = 'locator'
+
+    def __init__(self, by: str, value: str, condition: str = 'present'):
+        self.by = by
+        self.value = value
+        self.condition = condition
+
+    @classmethod
+    def of(cls, locator: Any, condition: str = 'present') -> 'LocatorPresent':
+        """Cria o sinal a partir de um Locator"""
+        return cls(locator.by, locator.value, condition)
+
+    def options(self) -> Dict[str, Any]:
+        return {'by': self.by, 'value': self.value, 'condition': self.condition}
+
+
+SIGNALS = {
+    DomContentLoaded.name: DomContentLoaded,
+    DocumentLoaded.name: DocumentLoaded,
+    NetworkIdle.name: NetworkIdle,
+}
+
+
+def resolve_signal(ready: Union[None, str, ReadinessSignal, Any], quiet_ms: int = 500) -> Optional[ReadinessSignal]:
+    """
+    Converte a especificação de prontidão em sinal
+
+    Args:
+        ready: Nome do sinal ('dom_content_loaded', 'load', 'network_idle'),
+            instância de ReadinessSignal ou Locator (aguarda o elemento)
+        quiet_ms: Janela de rede ociosa usada por 'network_idle'
+    """
+    if ready is None or isinstance(ready, ReadinessSignal):
+        return ready
+    if isinstance(ready, str):
+        if ready not in SIGNALS:
+            raise ValueError(f"Sinal de prontidão desconhecido: {ready} (use {sorted(SIGNALS)})")
+        return NetworkIdle(quiet_ms) if ready == NetworkIdle.name else SIGNALS[ready]()
+    return LocatorPresent.of(ready)
@@ -0,0 +1,212 @@
+"""
+Política de bloqueio de recursos (imagens, fontes, mídia, rastreadores)
+Reduz tempo de carregamento e memória quando os fluxos só precisam de HTML e XHR
+
+Chrome/Edge: bloqueio por URL via DevTools (Network.setBlockedURLs) e preferência
+de conteúdo para imagens; contadores lidos do log de performance (só eventos de rede,
+drenado periodicamente a cada navegação para não acumular no driver).
+Firefox: extensão temporária com webRequest bloqueante (sem contadores).
+"""
+
+import json
+import re
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from automation_framework.core.exceptions import ConfigurationException
+from automation_framework.core.logger import Logger
+
+
+# Extensões usadas para bloquear tipos de recurso por URL no DevTools
+TYPE_EXTENSIONS = {
+    'image': ['png', 'jpg', 'jpeg', 'gif', 'webp', 'svg', 'ico', 'avif', 'bmp'],
+    'font': ['woff', 'woff2', 'ttf', 'otf', 'eot'],
+    'media': ['mp4', 'webm', 'ogg', 'mp3', 'wav', 'm4a', 'mov'],
+    'stylesheet': ['css'],
+    'script': ['js'],
+}
+
+# Tipos equivalentes da API webRequest do Firefox
+FIREFOX_TYPES = {
+    'image': ['image', 'imageset'],
+    'font': ['font'],
+    'media': ['media'],
+    'stylesheet': ['stylesheet'],
+    'script': ['script'],
+}
+
+# Tamanho médio por tipo de recurso (bytes), usado para estimar a economia
+AVERAGE_BYTES = {
+    'Image': 40_000,
+    'Font': 30_000,
+    'Media': 500_000,
+    'Stylesheet': 20_000,
+    'Script': 30_000,
+    'Other': 10_000,
+}
+
+_LOGGING_CAPABILITY = {
+    'chrome': 'goog:loggingPrefs',
+    'edge': 'ms:loggingPrefs',
+}
+
+_EXTENSION_BACKGROUND = r"""
+var TYPES = %(types)s;
+var PATTERNS = %(patterns)s.map(function (source) { return new RegExp(source); });
+browser.webRequest.onBeforeRequest.addListener(function (details) {
+    if (TYPES.indexOf(details.type) !== -1) { return {cancel: true}; }
+    for (var i = 0; i < PATTERNS.length; i++) {
+        if (PATTERNS[i].test(details.url)) { return {cancel: true}; }
+    }
+    return {};
+}, {urls: ['<all_urls>']}, ['blocking']);
+"""
+
+
+def wildcard_to_regex(pattern: str) -> str:
+    """Converte padrão com '*' (formato do DevTools) em expressão regular ancorada"""
+    return '^' + '.*'.join(re.escape(part) for part in pattern.split('*')) + '$'
+
+
+class ResourcePolicy:
+    """
+    Bloqueio de recursos por tipo e por padrão de URL
+
+    Configuração (`browser.resource_policy` no config.json):
+        block_types: Tipos bloqueados (image, font, media, stylesheet, script)
+        block_patterns: Padrões de URL com '*' (ex: '*://*.doubleclick.net/*')
+        collect_stats: Coleta contadores de requisições bloqueadas (Chrome/Edge)
+        collect_every: Navegações entre coletas do log de performance (padrão: 10)
+    """
+
+    def __init__(self, block_types: Iterable[str] = (), block_patterns: Iterable[str] = (),
+                 collect_stats: bool = True, collect_every: int = 10):
+        self.block_types = [name.lower() for name in block_types]
+        unknown = set(self.block_types) - set(TYPE_EXTENSIONS)
+        if unknown:
+            raise ConfigurationException(
+                f"Tipos de recurso não suportados: {sorted(unknown)} (use {sorted(TYPE_EXTENSIONS)})"
+            )
+        self.block_patterns = list(block_patterns)
+        self.collect_stats = collect_stats
+        self.collect_every = max(1, collect_every)
+        self._navigations = 0
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        self.blocked_requests = 0
+        self.blocked_by_type: Dict[str, int] = {}
+        self._stats_supported = False
+        self._extension_dir: Optional[Path] = None
+
+    @classmethod
+    def from_config(cls, data: Optional[Dict[str, Any]]) -> Optional['ResourcePolicy']:
+        """Cria política a partir da configuração; None se nada for bloqueado"""
+        if not data or not (data.get('block_types') or data.get('block_patterns')):
+            return None
+        return cls(
+            block_types=data.get('block_types', []),
+            block_patterns=data.get('block_patterns', []),
+            collect_stats=data.get('collect_stats', True),
+            collect_every=data.get('collect_every', 10),
+        )
+
+    def blocked_urls(self) -> List[str]:
+        """Padrões de URL para Network.setBlockedURLs"""
+        urls = list(self.block_patterns)
+        for name in self.block_types:
+            for extension in TYPE_EXTENSIONS[name]:
+                urls.extend([f"*.{extension}", f"*.{extension}?*"])
+        return urls
+
+    def apply_to_options(self, options: Any, browser_name: str) -> None:
+        """Ajusta opções do navegador antes da criação da sessão"""
+        if browser_name not in _LOGGING_CAPABILITY:
+            return
+        if 'image' in self.block_types:
+            # Bloqueia também imagens sem extensão na URL (data/CDN)
+            prefs = dict(options.experimental_options.get('prefs', {}))
+            prefs['profile.managed_default_content_settings.images'] = 2
+            options.add_experimental_option('prefs', prefs)
+        if self.collect_stats:
+            options.set_capability(_LOGGING_CAPABILITY[browser_name], {'performance': 'ALL'})
+            # Só o domínio Network: eventos de página e trace não são registrados
+            options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
+
+    def install(self, driver: Any, browser_name: str) -> None:
+        """Ativa o bloqueio na sessão recém-criada (WebDriver do Selenium)"""
+        if browser_name in _LOGGING_CAPABILITY:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.blocked_urls()})
+            self._stats_supported = self.collect_stats
+        elif browser_name == 'firefox':
+            driver.install_addon(str(self.build_firefox_extension()), temporary=True)
+        else:
+            self.logger.warning(f"Bloqueio de recursos não suportado em {browser_name}")
+            return
+        self.logger.info(
+            f"Política de recursos ativa: tipos={self.block_types} padrões={len(self.block_patterns)}"
+        )
+
+    def build_firefox_extension(self) -> Path:
+        """Gera a extensão temporária do Firefox com as regras da política"""
+        if self._extension_dir is None:
+            self._extension_dir = Path(tempfile.mkdtemp(prefix='af-resource-policy-'))
+        manifest = {
+            'manifest_version': 2,
+            'name': 'automation-framework-resource-policy',
+            'version': '1.0',
+            'permissions': ['webRequest', 'webRequestBlocking', '<all_urls>'],
+            'background': {'scripts': ['background.js']},
+            'browser_specific_settings': {'gecko': {'id': 'resource-policy@automation-framework'}},
+        }
+        types = [firefox for name in self.block_types for firefox in FIREFOX_TYPES[name]]
+        background = _EXTENSION_BACKGROUND % {
+            'types': json.dumps(types),
+            'patterns': json.dumps([wildcard_to_regex(pattern) for pattern in self.block_patterns]),
+        }
+        (self._extension_dir / 'manifest.json').write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+        (self._extension_dir / 'background.js').write_text(background, encoding='utf-8')
+        return self._extension_dir
+
+    def collect(self, driver: Any) -> None:
+        """Acumula requisições bloqueadas registradas no log de performance desde a última coleta"""
+        if not self._stats_supported:
+            return
+        for entry in driver.get_log('performance'):
+            message = json.loads(entry['message']).get('message', {})
+            if message.get('method') != 'Network.loadingFailed':
+                continue
+            params = message.get('params', {})
+            if not params.get('blockedReason'):
+                continue
+            resource_type = params.get('type', 'Other')
+            self.blocked_requests += 1
+            self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+
+    def on_navigation(self, driver: Any) -> None:
+        """Coleta a cada `collect_every` navegações, esvaziando o log mantido pelo driver"""
+        if not self._stats_supported:
+            return
+        self._navigations += 1
+        if self._navigations >= self.collect_every:
+            self._navigations = 0
+            self.collect(driver)
+
+    def stats(self) -> dict:
+        """Contadores da execução (bytes economizados são estimados pelo tamanho médio por tipo)"""
+        return {
+            'supported': self._stats_supported,
+            'blocked_requests': self.blocked_requests,
+            'blocked_by_type': dict(self.blocked_by_type),
+            'estimated_bytes_saved': sum(
+                count * AVERAGE_BYTES.get(name, AVERAGE_BYTES['Other'])
+                for name, count in self.blocked_by_type.items()
+            ),
+        }
+
+    def close(self) -> None:
+        """Remove arquivos temporários da política"""
+        if self._extension_dir is not None:
+            shutil.rmtree(self._extension_dir, ignore_errors=True)
+            self._extension_dir = None
@@ -0,0 +1,548 @@
+"""
+Scripts JavaScript injetados no navegador
+Permitem resolver vários localizadores e ler dados em uma única chamada WebDriver
+"""
+
+# Função `afLocate(by, value, root)` que reproduz no navegador as estratégias
+# de `selenium.webdriver.common.by.By`, mais as estratégias do framework:
+# 'text' (elemento mais interno com o texto exato, espaços normalizados) e
+# 'any' (value = lista de [by, value] em ordem de preferência; os elementos de
+# cada alternativa vêm em ordem e `found.sources[i]` indica a alternativa de
+# cada elemento). Deve ser concatenada no início dos scripts que a utilizam.
+LOCATE_JS = r"""
+function afLocate(by, value, root) {
+    root = root || document;
+    var doc = root.ownerDocument || root;
+    function query(selector) {
+        return Array.prototype.slice.call(root.querySelectorAll(selector));
+    }
+    function quote(text) {
+        return '"' + String(text).replace(/["\\]/g, '\\$&') + '"';
+    }
+    function links(match) {
+        return query('a').filter(function (a) {
+            return match((a.innerText || a.textContent || '').trim());
+        });
+    }
+    function normalized(text) {
+        return (text || '').replace(/\s+/g, ' ').trim();
+    }
+    switch (by) {
+        case 'id':
+            return query('[id=' + quote(value) + ']');
+        case 'name':
+            return query('[name=' + quote(value) + ']');
+        case 'class name':
+            return query('.' + CSS.escape(value));
+        case 'tag name':
+        case 'css selector':
+            return query(value);
+        case 'link text':
+            return links(function (text) { return text === value; });
+        case 'partial link text':
+            return links(function (text) { return text.indexOf(value) !== -1; });
+        case 'xpath':
+            var snapshot = doc.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var found = [];
+            for (var i = 0; i < snapshot.snapshotLength; i++) {
+                found.push(snapshot.snapshotItem(i));
+            }
+            return found;
+        case 'text':
+            var wanted = normalized(value);
+            return query('*').filter(function (el) {
+                if (normalized(el.textContent) !== wanted) { return false; }
+                for (var child = el.firstElementChild; child; child = child.nextElementSibling) {
+                    if (normalized(child.textContent) === wanted) { return false; }
+                }
+                return true;
+            });
+        case 'any':
+            var all = [], sources = [];
+            for (var a = 0; a < value.length; a++) {
+                var part = afLocate(value[a][0], value[a][1], root);
+                for (var p = 0; p < part.length; p++) {
+                    if (all.indexOf(part[p]) === -1) {
+                        all.push(part[p]);
+                        sources.push(a);
+                    }
+                }
+            }
+            all.sources = sources;
+            return all;
+    }
+    throw new Error('Estratégia de localização não suportada: ' + by);
+}
+function afText(el) {
+    var text = el.innerText;
+    if (text === undefined || text === null) {
+        text = el.textContent || '';
+    }
+    return text.trim();
+}
+"""
+
+# arguments[0]: lista de [by, value]; arguments[1]: atributos; arguments[2]: propriedades;
+# arguments[3]: ler texto; arguments[4]: incluir referência ao elemento
+READ_ELEMENTS_JS = LOCATE_JS + r"""
+var specs = arguments[0], attributes = arguments[1], properties = arguments[2];
+var withText = arguments[3], withElement = arguments[4];
+function plain(value) {
+    if (value === null || value === undefined) { return null; }
+    var kind = typeof value;
+    if (kind === 'string' || kind === 'number' || kind === 'boolean') { return value; }
+    return String(value);
+}
+return specs.map(function (spec) {
+    var el = afLocate(spec[0], spec[1])[0];
+    if (!el) {
+        return null;
+    }
+    var result = {attributes: {}, properties: {}};
+    if (withText) { result.text = afText(el); }
+    if (withElement) { result.element = el; }
+    attributes.forEach(function (name) { result.attributes[name] = el.getAttribute(name); });
+    properties.forEach(function (name) { result.properties[name] = plain(el[name]); });
+    return result;
+});
+"""
+
+# arguments[0]: elemento <table>
+TABLE_INFO_JS = LOCATE_JS + r"""
+var table = arguments[0];
+var rows = table.querySelectorAll('tr');
+var headers = [];
+for (var h = 0; h < rows.length && !headers.length; h++) {
+    headers = Array.prototype.map.call(rows[h].querySelectorAll('th'), afText);
+}
+var columns = table.querySelectorAll('th').length;
+if (!columns) {
+    for (var i = 0; i < rows.length; i++) {
+        var cells = Array.prototype.filter.call(rows[i].children, function (c) { return c.tagName === 'TD'; });
+        if (cells.length) { columns = cells.length; break; }
+    }
+}
+return {rows: rows.length, columns: columns, headers: headers};
+"""
+
+# arguments[0]: elemento <table>; arguments[1]: índice da <tr> inicial;
+# arguments[2]: máximo de linhas com <td> a retornar
+TABLE_ROWS_JS = LOCATE_JS + r"""
+var table = arguments[0], index = arguments[1], limit = arguments[2];
+var rows = table.querySelectorAll('tr');
+var data = [];
+while (index < rows.length && data.length < limit) {
+    var cells = rows[index].querySelectorAll('td');
+    if (cells.length) {
+        data.push(Array.prototype.map.call(cells, afText));
+    }
+    index++;
+}
+return {rows: data, next: index, done: index >= rows.length};
+"""
+
+# arguments[0]: elemento <form>; arguments[1]: dicionário name -> valor
+# Retorna dicionário name -> status ('ok', 'not_found', 'option_not_found', 'disabled')
+FORM_FILL_JS = r"""
+var form = arguments[0], values = arguments[1];
+function fire(el, names) {
+    names.forEach(function (name) {
+        el.dispatchEvent(new Event(name, {bubbles: true}));
+    });
+}
+function setValue(el, value) {
+    // Usa o setter nativo para que frameworks (React, Vue) percebam a alteração
+    var proto = Object.getPrototypeOf(el);
+    var descriptor = Object.getOwnPropertyDescriptor(proto, 'value');
+    if (descriptor && descriptor.set) {
+        descriptor.set.call(el, value);
+    } else {
+        el.value = value;
+    }
+    fire(el, ['input', 'change']);
+}
+function wanted(value) {
+    return (Array.isArray(value) ? value : [value]).map(String);
+}
+function fillSelect(el, value) {
+    var targets = wanted(value), matched = false;
+    Array.prototype.forEach.call(el.options, function (option) {
+        var hit = targets.indexOf(option.value) !== -1 || targets.indexOf(option.text.trim()) !== -1;
+        if (hit && (el.multiple || !matched)) {
+            option.selected = true;
+            matched = true;
+        } else if (el.multiple) {
+            option.selected = false;
+        }
+    });
+    if (matched) { fire(el, ['input', 'change']); }
+    return matched ? 'ok' : 'option_not_found';
+}
+function fillChecks(elements, value) {
+    var radio = elements[0].type === 'radio';
+    var multiple = radio || Array.isArray(value) || typeof value !== 'boolean';
+    var targets = multiple ? wanted(value) : null;
+    var matched = false;
+    for (var i = 0; i < elements.length; i++) {
+        var el = elements[i];
+        var target = multiple ? targets.indexOf(el.value) !== -1 : Boolean(value);
+        if (!multiple && i > 0) { break; }
+        if (radio && !target) { continue; }
+        matched = matched || target || !multiple;
+        if (el.checked !== target) {
+            // click() dispara click/input/change como uma interação real
+            el.click();
+        }
+    }
+    return matched ? 'ok' : 'option_not_found';
+}
+var result = {};
+Object.keys(values).forEach(function (name) {
+    var elements = form.querySelectorAll('[name="' + name.replace(/["\\]/g, '\\$&') + '"]');
+    if (!elements.length) { result[name] = 'not_found'; return; }
+    var el = elements[0], value = values[name];
+    if (el.disabled || el.readOnly) { result[name] = 'disabled'; return; }
+    if (el.tagName === 'SELECT') {
+        result[name] = fillSelect(el, value);
+    } else if (el.type === 'checkbox' || el.type === 'radio') {
+        result[name] = fillChecks(elements, value);
+    } else {
+        setValue(el, value === null || value === undefined ? '' : String(value));
+        result[name] = 'ok';
+    }
+});
+return result;
+"""
+
+# Funções de estado de elementos compartilhadas pelos scripts de espera
+ELEMENT_STATE_JS = r"""
+function afVisible(el) {
+    if (!el.isConnected) { return false; }
+    var rect = el.getBoundingClientRect();
+    if (rect.width === 0 && rect.height === 0) { return false; }
+    if (typeof el.checkVisibility === 'function') {
+        return el.checkVisibility({opacityProperty: true, visibilityProperty: true});
+    }
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none' && parseFloat(style.opacity) !== 0;
+}
+function afMatches(el, condition) {
+    if (condition === 'visible') { return afVisible(el); }
+    if (condition === 'clickable') { return afVisible(el) && !el.disabled; }
+    return true;
+}
+"""
+
+# Espera assíncrona (execute_async_script) por elemento via MutationObserver
+# arguments[0]: by; arguments[1]: value; arguments[2]: 'present' | 'visible' | 'clickable';
+# arguments[3]: timeout em ms. Retorna {element} ou {timeout: true}
+WAIT_FOR_ELEMENT_JS = LOCATE_JS + ELEMENT_STATE_JS + r"""
+var by = arguments[0], value = arguments[1], condition = arguments[2], timeout = arguments[3];
+var done = arguments[arguments.length - 1];
+function check() {
+    var found = afLocate(by, value);
+    for (var i = 0; i < found.length; i++) {
+        if (afMatches(found[i], condition)) { return found[i]; }
+    }
+    return null;
+}
+var initial = check();
+if (initial) { done({element: initial}); return; }
+var finished = false, observer, timer, interval;
+function finish(result) {
+    if (finished) { return; }
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    clearInterval(interval);
+    done(result);
+}
+function recheck() {
+    var el = check();
+    if (el) { finish({element: el}); }
+}
+observer = new MutationObserver(recheck);
+observer.observe(document.documentElement || document, {childList: true, subtree: true, attributes: true});
+// Visibilidade pode mudar sem mutação no DOM (animações CSS): verificação local complementar
+interval = setInterval(recheck, condition === 'present' ? 1000 : 100);
+timer = setTimeout(function () { finish({timeout: true}); }, timeout);
+"""
+
+# Espera assíncrona por URL contendo um trecho (history API, hashchange, popstate)
+# arguments[0]: trecho da URL; arguments[1]: timeout em ms. Retorna true/false
+WAIT_FOR_URL_JS = r"""
+var partial = arguments[0], timeout = arguments[1];
+var done = arguments[arguments.length - 1];
+if (window.location.href.indexOf(partial) !== -1) { done(true); return; }
+if (!window.__afHistoryHooked) {
+    window.__afHistoryHooked = true;
+    ['pushState', 'replaceState'].forEach(function (name) {
+        var original = history[name];
+        history[name] = function () {
+            var result = original.apply(this, arguments);
+            window.dispatchEvent(new Event('af:locationchange'));
+            return result;
+        };
+    });
+}
+var finished = false, timer;
+var events = ['af:locationchange', 'popstate', 'hashchange'];
+function check() {
+    if (window.location.href.indexOf(partial) !== -1) { finish(true); }
+}
+function finish(result) {
+    if (finished) { return; }
+    finished = true;
+    events.forEach(function (name) { window.removeEventListener(name, check); });
+    clearTimeout(timer);
+    done(result);
+}
+events.forEach(function (name) { window.addEventListener(name, check); });
+timer = setTimeout(function () { finish(false); }, timeout);
+"""
+
+# Primeiro elemento que atende à condição no DOM atual, sem espera
+# arguments[0]: by; arguments[1]: value; arguments[2]: 'present' | 'visible' | 'clickable'
+PROBE_JS = LOCATE_JS + ELEMENT_STATE_JS + r"""
+var found = afLocate(arguments[0], arguments[1]);
+for (var i = 0; i < found.length; i++) {
+    if (afMatches(found[i], arguments[2])) { return found[i]; }
+}
+return null;
+"""
+
+# Resolução de localizador com alternativas em uma chamada, sem espera
+# arguments[0]: by; arguments[1]: value; arguments[2]: 'present' | 'visible' | 'clickable'
+# Retorna {element, index} (índice da alternativa usada) ou null
+RESOLVE_JS = LOCATE_JS + ELEMENT_STATE_JS + r"""
+var found = afLocate(arguments[0], arguments[1]);
+for (var i = 0; i < found.length; i++) {
+    if (afMatches(found[i], arguments[2])) {
+        return {element: found[i], index: found.sources ? found.sources[i] : 0};
+    }
+}
+return null;
+"""
+
+# Impressão digital de um elemento (atributos, texto e vizinhança estrutural),
+# usada para gerar alternativas quando o localizador original deixa de funcionar
+FINGERPRINT_JS = r"""
+function afFingerprint(el) {
+    function describe(node) {
+        return {
+            tag: node.tagName.toLowerCase(),
+            id: node.id || null,
+            classes: Array.prototype.slice.call(node.classList, 0, 5)
+        };
+    }
+    var result = describe(el);
+    result.attributes = {};
+    ['data-testid', 'data-test', 'data-qa', 'name', 'aria-label', 'placeholder', 'title', 'role', 'type',
+     'href', 'for'].forEach(function (name) {
+        var value = el.getAttribute(name);
+        if (value) { result.attributes[name] = value; }
+    });
+    var text = afText(el);
+    result.text = text.length <= 80 ? text : null;
+    result.index = 1;
+    for (var sibling = el.previousElementSibling; sibling; sibling = sibling.previousElementSibling) {
+        if (sibling.tagName === el.tagName) { result.index++; }
+    }
+    result.parent = el.parentElement ? describe(el.parentElement) : null;
+    return result;
+}
+"""
+
+# Resolução com cura de localizadores: como RESOLVE_JS, incluindo a impressão digital do elemento
+# arguments[0]: by; arguments[1]: value; arguments[2]: condição. Retorna [{element, index, fingerprint}]
+# com o primeiro elemento que atende à condição de cada alternativa, na ordem das alternativas
+HEALING_RESOLVE_JS = LOCATE_JS + ELEMENT_STATE_JS + FINGERPRINT_JS + r"""
+var found = afLocate(arguments[0], arguments[1]);
+var matches = [];
+var seen = {};
+for (var i = 0; i < found.length; i++) {
+    var index = found.sources ? found.sources[i] : 0;
+    if (!seen[index] && afMatches(found[i], arguments[2])) {
+        seen[index] = true;
+        matches.push({element: found[i], index: index, fingerprint: afFingerprint(found[i])});
+    }
+}
+return matches;
+"""
+
+# Todos os elementos do localizador (estratégias do framework, sem equivalente no WebDriver)
+# arguments[0]: by; arguments[1]: value; arguments[2]: elemento raiz (opcional)
+LOCATE_ALL_JS = LOCATE_JS + r"""
+return afLocate(arguments[0], arguments[1], arguments[2]);
+"""
+
+# Rastreamento de atividade de rede (fetch/XHR em andamento e recursos concluídos)
+# `afNetworkIdle(quietMs)` instala o rastreador na primeira chamada e indica se a
+# página está sem requisições há pelo menos `quietMs`
+NETWORK_IDLE_JS = r"""
+function afInstallNetworkTracker() {
+    if (window.__afNetwork) { return window.__afNetwork; }
+    var state = window.__afNetwork = {inflight: 0, last: performance.now()};
+    function begin() { state.inflight++; state.last = performance.now(); }
+    function end() { state.inflight = Math.max(0, state.inflight - 1); state.last = performance.now(); }
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            begin();
+            return originalFetch.apply(this, arguments).then(
+                function (response) { end(); return response; },
+                function (error) { end(); throw error; }
+            );
+        };
+    }
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        begin();
+        this.addEventListener('loadend', end);
+        return originalSend.apply(this, arguments);
+    };
+    if (window.PerformanceObserver) {
+        try {
+            new PerformanceObserver(function (list) {
+                list.getEntries().forEach(function (entry) {
+                    state.last = Math.max(state.last, entry.responseEnd || entry.startTime);
+                });
+            }).observe({type: 'resource', buffered: true});
+        } catch (e) {}
+    }
+    return state;
+}
+function afNetworkIdle(quietMs) {
+    var state = afInstallNetworkTracker();
+    return state.inflight === 0 && performance.now() - state.last >= quietMs;
+}
+function afSettled(quietMs) {
+    return document.readyState === 'complete' && afNetworkIdle(quietMs);
+}
+"""
+
+# Espera assíncrona pela ausência de um elemento: retorna assim que a página
+# estabiliza (documento carregado + rede ociosa) ou assim que o elemento aparece
+# arguments[0]: by; arguments[1]: value; arguments[2]: janela de rede ociosa em ms;
+# arguments[3]: timeout em ms. Retorna {present, settled}
+EXPECT_ABSENT_JS = LOCATE_JS + NETWORK_IDLE_JS + r"""
+var by = arguments[0], value = arguments[1], quietMs = arguments[2], timeout = arguments[3];
+var done = arguments[arguments.length - 1];
+var finished = false, observer, timer, interval;
+function finish(present, settled) {
+    if (finished) { return; }
+    finished = true;
+    if (observer) { observer.disconnect(); }
+    clearTimeout(timer);
+    clearInterval(interval);
+    done({present: present, settled: settled});
+}
+function check() {
+    if (afLocate(by, value).length) { finish(true, false); }
+    else if (afSettled(quietMs)) { finish(false, true); }
+}
+check();
+if (!finished) {
+    observer = new MutationObserver(function () {
+        if (afLocate(by, value).length) { finish(true, false); }
+    });
+    observer.observe(document.documentElement || document, {childList: true, subtree: true, attributes: true});
+    interval = setInterval(check, 50);
+    timer = setTimeout(function () { finish(false, false); }, timeout);
+}
+"""
+
+# Versão síncrona de EXPECT_ABSENT_JS usada no fallback por polling
+SETTLED_STATE_JS = LOCATE_JS + NETWORK_IDLE_JS + r"""
+return {present: afLocate(arguments[0], arguments[1]).length > 0, settled: afSettled(arguments[2])};
+"""
+
+# Instala o rastreador de rede antes dos scripts da página (Page.addScriptToEvaluateOnNewDocument)
+NETWORK_TRACKER_BOOTSTRAP_JS = "(function () {\n" + NETWORK_IDLE_JS + "afInstallNetworkTracker();\n})();"
+
+# Sinais de prontidão da página: `afReady(signal, options)`
+# signal: 'dom_content_loaded' | 'load' | 'network_idle' | 'locator'
+# options: {quietMs, by, value, condition, url}. Com `window.__afPrevious` marcado antes da
+# navegação, o documento anterior nunca é considerado pronto (exceto navegação no mesmo documento)
+READY_JS = LOCATE_JS + ELEMENT_STATE_JS + NETWORK_IDLE_JS + r"""
+function afReady(signal, options) {
+    if (window.__afPrevious && options.url &&
+            window.location.href.split('#')[0] !== String(options.url).split('#')[0]) {
+        return false;
+    }
+    switch (signal) {
+        case 'dom_content_loaded':
+            return document.readyState !== 'loading';
+        case 'load':
+            return document.readyState === 'complete';
+        case 'network_idle':
+            return document.readyState !== 'loading' && afNetworkIdle(options.quietMs || 500);
+        case 'locator':
+            var found = afLocate(options.by, options.value);
+            for (var i = 0; i < found.length; i++) {
+                if (afMatches(found[i], options.condition || 'present')) { return true; }
+            }
+            return false;
+    }
+    return true;
+}
+"""
+
+# Espera assíncrona por um sinal de prontidão
+# arguments[0]: sinal; arguments[1]: opções; arguments[2]: timeout em ms. Retorna true/false
+WAIT_FOR_READY_JS = READY_JS + r"""
+var signal = arguments[0], options = arguments[1] || {}, timeout = arguments[2];
+var done = arguments[arguments.length - 1];
+if (signal === 'network_idle') { afInstallNetworkTracker(); }
+if (afReady(signal, options)) { done(true); return; }
+var finished = false, interval, timer;
+function finish(result) {
+    if (finished) { return; }
+    finished = true;
+    clearInterval(interval);
+    clearTimeout(timer);
+    document.removeEventListener('DOMContentLoaded', check);
+    window.removeEventListener('load', check);
+    done(result);
+}
+function check() {
+    if (afReady(signal, options)) { finish(true); }
+}
+document.addEventListener('DOMContentLoaded', check);
+window.addEventListener('load', check);
+interval = setInterval(check, 50);
+timer = setTimeout(function () { finish(false); }, timeout);
+"""
+
+# Versão síncrona de WAIT_FOR_READY_JS usada no fallback por polling
+READY_CHECK_JS = READY_JS + r"""
+if (arguments[0] === 'network_idle') { afInstallNetworkTracker(); }
+return afReady(arguments[0], arguments[1] || {});
+"""
+
+# Estado de armazenamento da origem atual. Retorna {origin, local, session}
+CAPTURE_STORAGE_JS = r"""
+function dump(storage) {
+    var items = {};
+    try {
+        for (var i = 0; i < storage.length; i++) {
+            var key = storage.key(i);
+            if (key !== '__afStateRestored') { items[key] = storage.getItem(key); }
+        }
+    } catch (e) {}
+    return items;
+}
+return {origin: window.location.origin, local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+# Expressão de função `(origin, local, session)` que grava o storage salvo; aplicada
+# uma única vez por aba e somente na origem capturada
+RESTORE_STORAGE_JS = r"""(function (origin, local, session) {
+    if (window.location.origin !== origin) { return; }
+    try {
+        if (window.sessionStorage.getItem('__afStateRestored')) { return; }
+        Object.keys(local).forEach(function (key) { window.localStorage.setItem(key, local[key]); });
+        Object.keys(session).forEach(function (key) { window.sessionStorage.setItem(key, session[key]); });
+        window.sessionStorage.setItem('__afStateRestored', '1');
+    } catch (e) {}
+})"""
@@ -0,0 +1,247 @@
+"""
+Cura automática de localizadores de page objects
+Quando um Locator quebra após uma mudança da interface, alternativas geradas a
+partir da última correspondência bem-sucedida (atributos, texto e vizinhança
+estrutural) são testadas em uma única chamada. A estratégia que funcionou fica
+gravada em disco e as execuções seguintes vão direto a ela, sem pagar timeout.
+"""
+
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from automation_framework.core.config import ConfigManager
+from automation_framework.core.exceptions import ElementNotFound
+from automation_framework.core.logger import Logger
+from automation_framework.web.driver_manager import BaseWebDriver
+from automation_framework.web.driver_utils import _file_lock
+from automation_framework.web.locators import Locator
+from automation_framework.web.scripts import HEALING_RESOLVE_JS
+
+
+# Atributos de teste, estáveis entre versões da interface (maior prioridade)
+_TEST_ATTRIBUTES = ('data-testid', 'data-test', 'data-qa')
+
+# Atributos descritivos usados junto com a tag
+_DESCRIPTIVE_ATTRIBUTES = ('aria-label', 'placeholder', 'title', 'href', 'for')
+
+# Semelhança mínima para aceitar um elemento encontrado por alternativa gerada
+MIN_SIMILARITY = 0.5
+
+_CSS_IDENTIFIER = re.compile(r'^-?[A-Za-z_][\w-]*$')
+
+
+def _css_string(value: str) -> str:
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def _css_classes(classes: List[str]) -> str:
+    return ''.join(f".{name}" for name in classes if _CSS_IDENTIFIER.match(name))
+
+
+def healing_candidates(fingerprint: Dict[str, Any]) -> List[Locator]:
+    """
+    Alternativas ordenadas (mais estáveis primeiro) para reencontrar o elemento
+
+    Ordem: atributos de teste, id, name, atributos descritivos, texto, posição
+    relativa ao elemento pai e, por fim, tag com classes.
+    """
+    tag = fingerprint['tag']
+    attributes = fingerprint.get('attributes', {})
+    candidates = []
+    for name in _TEST_ATTRIBUTES:
+        if attributes.get(name):
+            candidates.append(Locator.css_selector(f"[{name}={_css_string(attributes[name])}]"))
+    if fingerprint.get('id'):
+        candidates.append(Locator.id(fingerprint['id']))
+    if attributes.get('name'):
+        candidates.append(Locator.css_selector(f"{tag}[name={_css_string(attributes['name'])}]"))
+    for name in _DESCRIPTIVE_ATTRIBUTES:
+        if attributes.get(name):
+            candidates.append(Locator.css_selector(f"{tag}[{name}={_css_string(attributes[name])}]"))
+    if fingerprint.get('text'):
+        candidates.append(Locator.text(fingerprint['text']))
+
+    parent = fingerprint.get('parent')
+    if parent:
+        if parent.get('id'):
+            parent_selector = f"[id={_css_string(parent['id'])}]"
+        else:
+            parent_selector = parent['tag'] + _css_classes(parent.get('classes', []))
+        candidates.append(
+            Locator.css_selector(f"{parent_selector} > {tag}:nth-of-type({fingerprint.get('index', 1)})")
+        )
+    classes = _css_classes(fingerprint.get('classes', []))
+    if classes:
+        candidates.append(Locator.css_selector(f"{tag}{classes}"))
+    return candidates
+
+
+def similarity(previous: Dict[str, Any], current: Dict[str, Any]) -> float:
+    """Semelhança (0 a 1) entre impressões digitais; tags diferentes valem 0"""
+    if previous['tag'] != current['tag']:
+        return 0.0
+    checks = [previous.get('id') == current.get('id'), previous.get('text') == current.get('text')]
+    current_attributes = current.get('attributes', {})
+    checks.extend(current_attributes.get(name) == value for name, value in previous.get('attributes', {}).items())
+    previous_classes, current_classes = set(previous.get('classes', [])), set(current.get('classes', []))
+    if previous_classes or current_classes:
+        checks.append(len(previous_classes & current_classes) * 2 >= len(previous_classes | current_classes))
+    previous_parent, current_parent = previous.get('parent') or {}, current.get('parent') or {}
+    checks.append(previous_parent.get('tag') == current_parent.get('tag'))
+    checks.append(previous.get('index') == current.get('index'))
+    return sum(checks) / len(checks)
+
+
+def _stable(fingerprint: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Impressão digital sem o texto (conteúdo dinâmico não deve provocar gravações)"""
+    if fingerprint is None:
+        return None
+    return {key: value for key, value in fingerprint.items() if key != 'text'}
+
+
+def locator_name(page_class: type, locator: Locator) -> Optional[str]:
+    """Nome do atributo de classe que guarda o localizador (None para localizadores avulsos)"""
+    for cls in page_class.__mro__:
+        for name, value in vars(cls).items():
+            if value is locator:
+                return name
+    return None
+
+
+class HealingStore:
+    """
+    Memória em disco da cura de localizadores
+
+    Entradas chaveadas por "modulo.ClassePagina.NOME_LOCALIZADOR" com o localizador original,
+    a última impressão digital e a alternativa que passou a funcionar. Se o localizador
+    for alterado no código, a entrada antiga é descartada. Gravações releem o arquivo
+    sob lock entre processos: workers paralelos não sobrescrevem as entradas uns dos outros.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, dict]] = None
+
+    def _read(self) -> Dict[str, dict]:
+        try:
+            return json.loads(self.path.read_text(encoding='utf-8'))
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _load(self) -> Dict[str, dict]:
+        if self._entries is None:
+            self._entries = self._read()
+        return self._entries
+
+    def get(self, key: str, locator: Locator) -> Optional[dict]:
+        """Entrada do localizador, se ainda corresponde ao localizador do código"""
+        with self._lock:
+            entry = self._load().get(key)
+        if entry is None or Locator(*entry['locator']) is not locator:
+            return None
+        return entry
+
+    def put(self, key: str, locator: Locator, fingerprint: Dict[str, Any], healed: Optional[Locator]) -> None:
+        """Grava a entrada de forma atômica"""
+        entry = {
+            'locator': [locator.by, locator.value],
+            'fingerprint': fingerprint,
+            'healed': [healed.by, healed.value] if healed is not None else None,
+            'updated_at': time.time(),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, _file_lock(self.path.with_name(self.path.name + '.lock')):
+            # Relê o arquivo: outros processos podem ter gravado desde a última leitura
+            entries = self._read()
+            entries[key] = entry
+            self._entries = entries
+            fd, temp_path = tempfile.mkstemp(dir=str(self.path.parent), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(entries, f, indent=2, ensure_ascii=False)
+                os.replace(temp_path, self.path)
+            except Exception:
+                Path(temp_path).unlink(missing_ok=True)
+                raise
+
+
+class LocatorHealer:
+    """
+    Resolve localizadores de page objects com cura automática
+
+    A cadeia testada a cada tentativa (uma chamada ao navegador) é: alternativa já
+    curada, localizador original e alternativas geradas da última impressão digital.
+    """
+
+    _shared: Dict[str, 'LocatorHealer'] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, store: HealingStore):
+        self.store = store
+        self.logger = Logger.get_logger(self.__class__.__name__)
+
+    @classmethod
+    def shared(cls, store_path: Optional[str] = None) -> 'LocatorHealer':
+        """Instância compartilhada por arquivo de memória (padrão: self_healing.store_path)"""
+        path = str(Path(store_path or ConfigManager().get_self_healing_config().store_path).resolve())
+        with cls._shared_lock:
+            if path not in cls._shared:
+                cls._shared[path] = cls(HealingStore(path))
+            return cls._shared[path]
+
+    def locate(self, driver: BaseWebDriver, page_class: type, locator: Locator,
+               condition: str = 'present', timeout: Optional[float] = None) -> Optional[Any]:
+        """
+        Localiza o elemento com cura
+
+        Returns:
+            WebElement, ou None se o localizador não é atributo da página (sem chave estável)
+
+        Raises:
+            ElementNotFound: Se nenhuma alternativa encontrou o elemento no tempo
+        """
+        name = locator_name(page_class, locator)
+        if name is None:
+            return None
+        key = f"{page_class.__module__}.{page_class.__qualname__}.{name}"
+        entry = self.store.get(key, locator)
+        healed = Locator(*entry['healed']) if entry and entry['healed'] else None
+        previous = entry['fingerprint'] if entry else None
+
+        chain = ([healed] if healed else []) + [locator] + (healing_candidates(previous) if previous else [])
+        resolved = Locator.any(*chain)
+        alternatives = resolved.alternatives
+
+        timeout = driver.wait_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        while True:
+            matches = driver.execute_script(HEALING_RESOLVE_JS, resolved.by, resolved.value, condition) or []
+            # Primeira alternativa aceita; gerada só se o elemento se parece com o da última correspondência
+            result = next((match for match in matches
+                           if alternatives[match['index']] is healed
+                           or alternatives[match['index']] in locator.alternatives
+                           or similarity(previous, match['fingerprint']) >= MIN_SIMILARITY), None)
+            if result is not None:
+                matched = alternatives[result['index']]
+                break
+            if time.monotonic() >= deadline:
+                raise ElementNotFound(f"Elemento não encontrado (com cura): {key} = {locator!r}")
+            time.sleep(0.25)
+
+        if matched in locator.alternatives:
+            new_healed = None
+        else:
+            new_healed = matched
+            if matched is not healed:
+                self.logger.warning(f"Localizador {key} curado: {locator!r} -> {matched!r}")
+        # Só grava em cura (ou primeira correspondência); texto dinâmico não conta como mudança
+        if new_healed is not healed or _stable(result['fingerprint']) != _stable(previous):
+            self.store.put(key, locator, result['fingerprint'], new_healed)
+        return result['element']
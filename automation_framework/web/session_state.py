@@ -0,0 +1,254 @@
+"""
+Cache de estado de sessão do navegador (cookies, localStorage e sessionStorage)
+Permite pular o login pela interface restaurando o estado capturado após um
+login bem-sucedido, com expiração (TTL) e invalidação quando a sessão caiu
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from automation_framework.core.config import ConfigManager
+from automation_framework.core.logger import Logger
+from automation_framework.utils.credentials import CredentialManager
+from automation_framework.web.driver_manager import BaseWebDriver
+from automation_framework.web.scripts import CAPTURE_STORAGE_JS, RESTORE_STORAGE_JS
+
+
+@dataclass
+class SessionState:
+    """Estado capturado de uma origem"""
+    origin: str
+    cookies: List[Dict[str, Any]] = field(default_factory=list)
+    local_storage: Dict[str, str] = field(default_factory=dict)
+    session_storage: Dict[str, str] = field(default_factory=dict)
+    captured_at: float = field(default_factory=time.time)
+
+    def age(self) -> float:
+        """Idade do estado em segundos"""
+        return time.time() - self.captured_at
+
+
+def _cdp_cookie(cookie: Dict[str, Any]) -> Dict[str, Any]:
+    """Converte cookie do formato WebDriver para Network.setCookies"""
+    converted = {
+        'name': cookie['name'],
+        'value': cookie['value'],
+        'domain': cookie.get('domain'),
+        'path': cookie.get('path', '/'),
+        'secure': cookie.get('secure', False),
+        'httpOnly': cookie.get('httpOnly', False),
+    }
+    if cookie.get('sameSite'):
+        converted['sameSite'] = cookie['sameSite']
+    if cookie.get('expiry'):
+        converted['expires'] = cookie['expiry']
+    return {key: value for key, value in converted.items() if value is not None}
+
+
+class SessionStateCache:
+    """
+    Estados de sessão persistidos por credencial
+
+    A chave combina o id da credencial no CredentialManager com um hash do seu valor:
+    trocar a senha/usuário da credencial invalida o estado salvo. Os arquivos são
+    gravados com permissão 0600, pois contêm cookies de autenticação.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, ttl: Optional[float] = None,
+                 credentials: Optional[CredentialManager] = None, restore_path: Optional[str] = None):
+        """
+        Args:
+            cache_dir: Pasta dos estados (padrão: session_state.cache_dir da configuração)
+            ttl: Validade do estado em segundos
+            credentials: Gerenciador de credenciais usado na chave
+            restore_path: Caminho leve da origem carregado para restaurar fora do Chromium
+        """
+        config = ConfigManager().get_session_state_config()
+        self.cache_dir = Path(cache_dir or config.cache_dir)
+        self.ttl = config.ttl if ttl is None else ttl
+        self.restore_path = restore_path or config.restore_path
+        self.credentials = credentials or CredentialManager()
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        # Scripts de restauração do storage instalados por driver (Chromium)
+        self._pending_scripts: Dict[int, str] = {}
+
+    def key_for(self, credential_id: str) -> str:
+        """Chave de arquivo da credencial (não expõe o id nem o valor)"""
+        secret = self.credentials.get_credential(credential_id) or ''
+        return hashlib.sha256(f"{credential_id}\0{secret}".encode('utf-8')).hexdigest()[:32]
+
+    def _path(self, credential_id: str) -> Path:
+        return self.cache_dir / f"{self.key_for(credential_id)}.json"
+
+    def save(self, credential_id: str, state: SessionState) -> None:
+        """Grava o estado de forma atômica com permissão restrita"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+        path = self._path(credential_id)
+        fd, temp_path = tempfile.mkstemp(dir=str(self.cache_dir), suffix='.tmp')
+        try:
+            os.chmod(temp_path, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(asdict(state), f)
+            os.replace(temp_path, path)
+        except Exception:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+    def load(self, credential_id: str) -> Optional[SessionState]:
+        """Carrega o estado da credencial; None se não existir ou estiver expirado"""
+        path = self._path(credential_id)
+        try:
+            state = SessionState(**json.loads(path.read_text(encoding='utf-8')))
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError) as e:
+            self.logger.warning(f"Estado de sessão corrompido descartado: {str(e)}")
+            path.unlink(missing_ok=True)
+            return None
+        if self.ttl and state.age() > self.ttl:
+            self.logger.info(f"Estado de sessão expirado para '{credential_id}'")
+            path.unlink(missing_ok=True)
+            return None
+        return state
+
+    def invalidate(self, credential_id: str) -> None:
+        """Descarta o estado salvo da credencial"""
+        self._path(credential_id).unlink(missing_ok=True)
+        self.logger.info(f"Estado de sessão invalidado para '{credential_id}'")
+
+    def capture(self, driver: BaseWebDriver, credential_id: str) -> SessionState:
+        """
+        Captura cookies e storage da origem atual (chamar após login bem-sucedido)
+
+        Returns:
+            SessionState: Estado salvo
+        """
+        storage = driver.execute_script(CAPTURE_STORAGE_JS)
+        state = SessionState(
+            origin=storage['origin'],
+            cookies=driver.driver.get_cookies(),
+            local_storage=storage['local'],
+            session_storage=storage['session'],
+        )
+        self.save(credential_id, state)
+        self.logger.info(
+            f"Estado de sessão capturado para '{credential_id}': {len(state.cookies)} cookies, "
+            f"{len(state.local_storage)} itens de localStorage"
+        )
+        return state
+
+    def restore(self, driver: BaseWebDriver, credential_id: str) -> bool:
+        """
+        Restaura o estado salvo em uma sessão nova, antes da primeira navegação
+
+        No Chromium cookies e storage são aplicados pelo DevTools sem navegação extra;
+        nos demais navegadores a origem é aberta em `restore_path` para aplicar o estado.
+        No Chromium o script de storage fica ativo até `finish_restore` (chamar após a
+        primeira navegação); `restore_and_verify` já faz isso.
+
+        Returns:
+            True se havia estado válido e ele foi aplicado
+        """
+        state = self.load(credential_id)
+        if state is None:
+            return False
+        self._apply(driver, credential_id, state)
+        return True
+
+    def _apply(self, driver: BaseWebDriver, credential_id: str, state: SessionState) -> None:
+        selenium_driver = driver.driver
+        if hasattr(selenium_driver, 'execute_cdp_cmd'):
+            selenium_driver.execute_cdp_cmd(
+                'Network.setCookies', {'cookies': [_cdp_cookie(cookie) for cookie in state.cookies]}
+            )
+            source = f"({RESTORE_STORAGE_JS})({json.dumps(state.origin)}, " \
+                     f"{json.dumps(state.local_storage)}, {json.dumps(state.session_storage)});"
+            result = selenium_driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': source})
+            self._pending_scripts[id(driver)] = result.get('identifier')
+        else:
+            driver.get(state.origin.rstrip('/') + self.restore_path)
+            for cookie in state.cookies:
+                selenium_driver.add_cookie(cookie)
+            driver.execute_script(
+                f"({RESTORE_STORAGE_JS})(arguments[0], arguments[1], arguments[2]);",
+                state.origin, state.local_storage, state.session_storage,
+            )
+
+        self.logger.info(f"Estado de sessão restaurado para '{credential_id}' ({int(state.age())}s)")
+
+    def finish_restore(self, driver: BaseWebDriver) -> None:
+        """Remove o script de restauração após a primeira página carregada"""
+        identifier = self._pending_scripts.pop(id(driver), None)
+        if identifier:
+            driver.driver.execute_cdp_cmd('Page.removeScriptToEvaluateOnNewDocument', {'identifier': identifier})
+
+    @staticmethod
+    def _login_check(driver: BaseWebDriver, is_logged_in: Union[Callable[[], bool], Any]) -> Callable[[], bool]:
+        if callable(is_logged_in):
+            return is_logged_in
+        locator = is_logged_in
+        return lambda: driver.is_element_visible(locator.by, locator.value, timeout=5)
+
+    def restore_and_verify(self, driver: BaseWebDriver, credential_id: str,
+                           is_logged_in: Union[Callable[[], bool], Any], url: Optional[str] = None) -> bool:
+        """
+        Restaura o estado salvo, abre a página e confirma que a sessão continua logada
+
+        Se a sessão caiu, o estado é invalidado e o navegador volta a um estado limpo.
+
+        Args:
+            driver: Driver da sessão (recém-criada)
+            credential_id: Id da credencial no CredentialManager
+            is_logged_in: Função que confirma a sessão ou Locator de um elemento exclusivo
+                de usuário logado
+            url: Página autenticada aberta após a restauração (padrão: origem do estado)
+
+        Returns:
+            True se a sessão foi restaurada e está logada
+        """
+        is_logged_in = self._login_check(driver, is_logged_in)
+        state = self.load(credential_id)
+        if state is None:
+            return False
+
+        self._apply(driver, credential_id, state)
+        try:
+            driver.get(url or state.origin)
+        finally:
+            self.finish_restore(driver)
+        if is_logged_in():
+            return True
+        self.logger.warning(f"Sessão restaurada não está logada; estado de '{credential_id}' invalidado")
+        self.invalidate(credential_id)
+        driver.reset_state()
+        return False
+
+    def restore_or_login(self, driver: BaseWebDriver, credential_id: str, url: str,
+                         login: Callable[[], None],
+                         is_logged_in: Union[Callable[[], bool], Any]) -> bool:
+        """
+        Restaura a sessão salva ou executa o login e captura o estado
+
+        Args:
+            driver: Driver da sessão (recém-criada)
+            credential_id: Id da credencial no CredentialManager
+            url: Página autenticada aberta após a restauração
+            login: Executa o login pela interface (a partir de qualquer página)
+            is_logged_in: Função que confirma a sessão ou Locator de um elemento exclusivo
+                de usuário logado
+
+        Returns:
+            True se a sessão foi restaurada, False se o login foi executado
+        """
+        if self.restore_and_verify(driver, credential_id, is_logged_in, url):
+            return True
+
+        login()
+        self.capture(driver, credential_id)
+        return False
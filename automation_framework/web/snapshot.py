@@ -0,0 +1,203 @@
+"""
+Snapshot do DOM para consultas offline
+Captura o código-fonte da página uma vez e resolve Locators localmente (lxml),
+sem uma chamada WebDriver por leitura
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+try:
+    from lxml import etree, html as lxml_html
+    from lxml.cssselect import CSSSelector
+except ImportError:  # dependência opcional
+    etree = lxml_html = CSSSelector = None
+
+from automation_framework.core.exceptions import ElementNotFound
+from automation_framework.web.driver_manager import BaseWebDriver
+
+
+# Conteúdo que não aparece no texto renderizado
+_NON_RENDERED_TAGS = ('script', 'style', 'template', 'noscript')
+
+
+def _require_lxml() -> None:
+    if etree is None or CSSSelector is None:
+        raise ImportError("Snapshot offline requer lxml e cssselect: pip install lxml cssselect")
+
+
+@lru_cache(maxsize=512)
+def _compile(by: str, value: str) -> Any:
+    """Compila o localizador para uma consulta lxml (cacheada entre snapshots)"""
+    if by == 'xpath':
+        return etree.XPath(value)
+    if by == 'id':
+        return etree.XPath("descendant-or-self::*[@id=$value]")
+    if by == 'name':
+        return etree.XPath("descendant-or-self::*[@name=$value]")
+    if by in ('link text', 'partial link text'):
+        return etree.XPath("descendant-or-self::a")
+    if by == 'class name':
+        return CSSSelector(f".{value}", translator='html')
+    if by in ('css selector', 'tag name'):
+        return CSSSelector(value, translator='html')
+    if by == 'text':
+        return etree.XPath(
+            "descendant-or-self::*[normalize-space(.)=$value][not(*[normalize-space(.)=$value])]"
+        )
+    raise ValueError(f"Estratégia de localização não suportada no snapshot: {by}")
+
+
+def _normalize(text: str) -> str:
+    return ' '.join(text.split())
+
+
+class SnapshotElement:
+    """Elemento somente leitura de um DomSnapshot"""
+
+    def __init__(self, node: Any):
+        self.node = node
+
+    def __repr__(self) -> str:
+        return f"SnapshotElement(<{self.tag_name}>)"
+
+    @property
+    def tag_name(self) -> str:
+        return self.node.tag
+
+    @property
+    def text(self) -> str:
+        """Texto com espaços normalizados (não considera CSS: elementos ocultos também entram)"""
+        return _normalize(self.node.text_content())
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        return self.node.get(name)
+
+    @property
+    def html(self) -> str:
+        """HTML do elemento"""
+        return etree.tostring(self.node, encoding='unicode', method='html')
+
+    def find_elements(self, locator: Any) -> List['SnapshotElement']:
+        """Localiza descendentes (mesmas estratégias do Locator)"""
+        return [SnapshotElement(node) for node in _query(self.node, locator.by, locator.value)]
+
+    def find_element(self, locator: Any) -> 'SnapshotElement':
+        elements = self.find_elements(locator)
+        if not elements:
+            raise ElementNotFound(f"Elemento não encontrado no snapshot: {locator}")
+        return elements[0]
+
+
+def _query(root: Any, by: str, value: Any) -> List[Any]:
+    if by == 'any':
+        # Alternativas em ordem de preferência, sem repetir elementos
+        nodes = []
+        for alternative_by, alternative_value in value:
+            nodes.extend(node for node in _query(root, alternative_by, alternative_value) if node not in nodes)
+        return nodes
+    query = _compile(by, value)
+    if by in ('id', 'name', 'text'):
+        return query(root, value=value)
+    nodes = query(root)
+    if by == 'link text':
+        return [node for node in nodes if _normalize(node.text_content()) == value]
+    if by == 'partial link text':
+        return [node for node in nodes if value in _normalize(node.text_content())]
+    # XPath pode retornar textos/atributos; só elementos interessam
+    return [node for node in nodes if isinstance(getattr(node, 'tag', None), str)]
+
+
+class DomSnapshot:
+    """
+    DOM congelado no momento da captura
+
+    As consultas não enxergam mudanças posteriores da página; use para passos
+    somente leitura (raspagem, validação de conteúdo).
+    """
+
+    def __init__(self, source: str, url: Optional[str] = None):
+        """
+        Args:
+            source: HTML da página ou de um fragmento
+            url: URL da página (informativo)
+        """
+        _require_lxml()
+        self.url = url
+        self.root = lxml_html.fromstring(source)
+        for node in list(self.root.iter(*_NON_RENDERED_TAGS)):
+            # drop_tree preserva o texto após o nó (tail), que pertence ao pai
+            node.drop_tree()
+
+    def find_elements(self, locator: Any) -> List[SnapshotElement]:
+        """Localiza todos os elementos do localizador"""
+        return [SnapshotElement(node) for node in _query(self.root, locator.by, locator.value)]
+
+    def find_element(self, locator: Any) -> SnapshotElement:
+        """
+        Localiza o primeiro elemento
+
+        Raises:
+            ElementNotFound: Se nenhum elemento corresponder
+        """
+        elements = self.find_elements(locator)
+        if not elements:
+            raise ElementNotFound(f"Elemento não encontrado no snapshot: {locator}")
+        return elements[0]
+
+    def exists(self, locator: Any) -> bool:
+        """Verifica se o elemento existe no snapshot"""
+        return bool(_query(self.root, locator.by, locator.value))
+
+    def get_text(self, locator: Any) -> str:
+        """Obtém texto do primeiro elemento"""
+        return self.find_element(locator).text
+
+    def get_attribute(self, locator: Any, attribute: str) -> Optional[str]:
+        """Obtém atributo do primeiro elemento"""
+        return self.find_element(locator).get_attribute(attribute)
+
+    def get_texts(self, locator: Any) -> List[str]:
+        """Textos de todos os elementos do localizador"""
+        return [element.text for element in self.find_elements(locator)]
+
+    def extract(self, locator: Any, attributes: Iterable[str] = (), text: bool = True) -> List[dict]:
+        """
+        Extrai texto e atributos de todos os elementos do localizador
+
+        Returns:
+            Lista de {'text', 'attributes'} na ordem do documento
+        """
+        attributes = list(attributes)
+        return [
+            {
+                'text': element.text if text else None,
+                'attributes': {name: element.get_attribute(name) for name in attributes},
+            }
+            for element in self.find_elements(locator)
+        ]
+
+    def read_elements(self,
+                      locators: Union[Sequence[Any], Mapping[Any, Any]],
+                      attributes: Optional[Iterable[str]] = None,
+                      text: bool = True) -> Dict[Any, dict]:
+        """
+        Lê o primeiro elemento de cada localizador (mesmo formato de BasePage.read_elements)
+
+        Propriedades DOM não existem no HTML serializado; `properties` vem sempre vazio.
+        """
+        items = BaseWebDriver._locator_items(locators)
+        attributes = list(attributes or [])
+        raw = []
+        for _, locator in items:
+            nodes = _query(self.root, locator.by, locator.value)
+            if not nodes:
+                raw.append(None)
+                continue
+            element = SnapshotElement(nodes[0])
+            raw.append({
+                'text': element.text if text else None,
+                'attributes': {name: element.get_attribute(name) for name in attributes},
+                'properties': {},
+            })
+        return BaseWebDriver._read_results(items, raw, attributes, [], include_elements=False)
@@ -0,0 +1,130 @@
+"""
+Linha do tempo de inicialização de navegadores
+Mede cada fase do início de sessão (resolução do driver, processo do driver,
+abertura do navegador, ajustes iniciais) e agrega percentis entre sessões
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, List, Optional
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Percentil pelo método nearest-rank (valores em qualquer ordem)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class StartupTimeline:
+    """Fases de inicialização de uma sessão, com início relativo e duração"""
+
+    def __init__(self, browser: Optional[str] = None, session: Optional[str] = None):
+        self.browser = browser
+        self.session = session
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+        self.ok: Optional[bool] = None
+        self.phases: List[dict] = []
+
+    def record(self, name: str, started: float, duration: float) -> None:
+        """Registra fase já medida (`started` em perf_counter)"""
+        self.phases.append({'name': name, 'start': started - self.started, 'duration': max(duration, 0.0)})
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Mede o bloco como uma fase (registrada mesmo se falhar)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, started, time.perf_counter() - started)
+
+    def duration(self, name: str) -> float:
+        """Soma das durações das fases com o nome"""
+        return sum(phase['duration'] for phase in self.phases if phase['name'] == name)
+
+    def finish(self, ok: bool = True) -> None:
+        """Encerra a linha do tempo"""
+        self.finished = time.perf_counter()
+        self.ok = ok
+
+    @property
+    def total(self) -> float:
+        """Duração total em segundos"""
+        end = self.finished if self.finished is not None else time.perf_counter()
+        return end - self.started
+
+    def to_dict(self) -> dict:
+        """Registro estruturado (tempos em ms)"""
+        return {
+            'session': self.session,
+            'browser': self.browser,
+            'ok': self.ok,
+            'total_ms': round(self.total * 1000, 1),
+            'phases': [
+                {
+                    'name': phase['name'],
+                    'start_ms': round(phase['start'] * 1000, 1),
+                    'duration_ms': round(phase['duration'] * 1000, 1),
+                }
+                for phase in self.phases
+            ],
+        }
+
+
+class TimelineRecorder:
+    """Linhas do tempo concluídas na execução (thread-safe, limitado às mais recentes)"""
+
+    def __init__(self, max_timelines: int = 1000):
+        self._timelines: Deque[StartupTimeline] = deque(maxlen=max_timelines)
+        self._lock = threading.Lock()
+
+    def add(self, timeline: StartupTimeline) -> None:
+        with self._lock:
+            self._timelines.append(timeline)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._timelines.clear()
+
+    def timelines(self, session: Optional[str] = None) -> List[StartupTimeline]:
+        """Linhas do tempo registradas (opcionalmente de uma sessão)"""
+        with self._lock:
+            timelines = list(self._timelines)
+        return [timeline for timeline in timelines if session is None or timeline.session == session]
+
+    def stats(self) -> Dict[str, dict]:
+        """
+        Percentis por fase e do total entre as sessões
+
+        Returns:
+            {fase: {'count', 'p50_ms', 'p95_ms', 'max_ms'}} incluindo 'total'
+        """
+        samples: Dict[str, List[float]] = {}
+        for timeline in self.timelines():
+            samples.setdefault('total', []).append(timeline.total)
+            per_phase: Dict[str, float] = {}
+            for phase in timeline.phases:
+                per_phase[phase['name']] = per_phase.get(phase['name'], 0.0) + phase['duration']
+            for name, duration in per_phase.items():
+                samples.setdefault(name, []).append(duration)
+
+        return {
+            name: {
+                'count': len(values),
+                'p50_ms': round(percentile(values, 50) * 1000, 1),
+                'p95_ms': round(percentile(values, 95) * 1000, 1),
+                'max_ms': round(max(values) * 1000, 1),
+            }
+            for name, values in samples.items()
+        }
+
+
+# Registro global da execução (consultado pelo DriverManager)
+startup_recorder = TimelineRecorder()
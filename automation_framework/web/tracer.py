@@ -0,0 +1,258 @@
+"""
+Rastreamento de comandos WebDriver
+Registra cada round trip ao driver (comando, localizador, duração e método do
+page object que o originou) para identificar páginas e componentes "falantes"
+"""
+
+import json
+import os
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from automation_framework.core.exceptions import BrowserException
+from automation_framework.core.logger import Logger
+from automation_framework.web.driver_manager import BaseWebDriver
+from automation_framework.web.page_object import BaseComponent, BasePage
+
+
+# Comandos sem page object na pilha (chamadas diretas ao driver)
+DIRECT_CALLER = '<direto>'
+
+# Profundidade máxima da pilha inspecionada para atribuir o chamador
+MAX_STACK_DEPTH = 40
+
+_PAGE_OBJECT_TYPES = (BasePage, BaseComponent)
+
+# Métodos genéricos das classes base: o chamador atribuído é o método do page object concreto
+_BASE_CODES = frozenset(
+    member.__code__
+    for cls in _PAGE_OBJECT_TYPES
+    for member in vars(cls).values()
+    if hasattr(member, '__code__')
+)
+
+_ELEMENT_ID = re.compile(r'/(element|shadow)/[^/]+')
+
+
+@dataclass
+class TraceEvent:
+    """Um round trip ao WebDriver"""
+    command: str
+    locator: Optional[str]
+    caller: str
+    start: float
+    duration: float
+    transport: str
+    thread_id: int
+    error: Optional[str] = None
+
+
+def find_caller() -> str:
+    """
+    Método de page object mais interno na pilha atual
+
+    Métodos das classes base (click, type_text, ...) são ignorados quando há um
+    método do page object concreto acima deles (ex: LoginPage.login).
+    """
+    frame = sys._getframe(2)
+    fallback = None
+    for _ in range(MAX_STACK_DEPTH):
+        if frame is None:
+            break
+        instance = frame.f_locals.get('self')
+        if isinstance(instance, _PAGE_OBJECT_TYPES):
+            name = f"{type(instance).__name__}.{frame.f_code.co_name}"
+            if frame.f_code not in _BASE_CODES:
+                return name
+            fallback = fallback or name
+        frame = frame.f_back
+    return fallback or DIRECT_CALLER
+
+
+def _w3c_command_name(method: str, command: str, payload: Any = None) -> str:
+    """Nome do comando W3C sem ids de elemento (ex: 'POST /element/{id}/click')"""
+    return f"{method} {_ELEMENT_ID.sub(lambda match: f'/{match.group(1)}/{{id}}', command)}"
+
+
+def _locator_of(params: Any) -> Optional[str]:
+    if isinstance(params, dict) and 'using' in params and 'value' in params:
+        return f"{params['using']}={params['value']}"
+    return None
+
+
+class CommandTracer:
+    """
+    Rastreador opt-in dos comandos de um BaseWebDriver
+
+    Instala wrappers na instância do WebDriver do Selenium (cobre os métodos do
+    BaseWebDriver, WebElements e acessos diretos a `driver.driver`) e no cliente
+    W3C, quando ativo. Sem `start()` nada é interceptado: o custo desligado é zero.
+
+    Exemplo:
+        with CommandTracer(driver) as tracer:
+            LoginPage(driver).login(usuario, senha)
+        print(tracer.summary_table())
+        tracer.export_chrome_trace("trace.json")
+    """
+
+    def __init__(self, driver: BaseWebDriver, capture_caller: bool = True):
+        """
+        Args:
+            driver: Driver rastreado
+            capture_caller: Atribui cada comando ao método do page object (inspeção da pilha)
+        """
+        self.driver = driver
+        self.capture_caller = capture_caller
+        self.events: List[TraceEvent] = []
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._patched: List[tuple] = []
+
+    @property
+    def active(self) -> bool:
+        return bool(self._patched)
+
+    def _record(self, command: str, params: Any, transport: str, started: float,
+                caller: str, error: Optional[BaseException]) -> None:
+        event = TraceEvent(
+            command=command,
+            locator=_locator_of(params),
+            caller=caller,
+            start=started - self._origin,
+            duration=time.perf_counter() - started,
+            transport=transport,
+            thread_id=threading.get_ident(),
+            error=type(error).__name__ if error is not None else None,
+        )
+        with self._lock:
+            self.events.append(event)
+
+    def _wrap(self, target: Any, transport: str, name_of: Callable[..., str],
+              params_of: Callable[..., Any]) -> None:
+        previous = target.__dict__.get('execute')
+        original = target.execute
+        tracer = self
+
+        def execute(*args, **kwargs):
+            caller = find_caller() if tracer.capture_caller else DIRECT_CALLER
+            started = time.perf_counter()
+            error = None
+            try:
+                return original(*args, **kwargs)
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                tracer._record(name_of(*args, **kwargs), params_of(*args, **kwargs),
+                               transport, started, caller, error)
+
+        target.execute = execute
+        self._patched.append((target, previous))
+
+    def start(self) -> 'CommandTracer':
+        """Começa a interceptar os comandos"""
+        if self.active:
+            return self
+        if self.driver.driver is None:
+            raise BrowserException("Driver não inicializado")
+        self._origin = time.perf_counter()
+        self._wrap(
+            self.driver.driver, 'selenium',
+            lambda driver_command, params=None: driver_command,
+            lambda driver_command, params=None: params,
+        )
+        if self.driver.w3c is not None:
+            self._wrap(
+                self.driver.w3c, 'w3c',
+                _w3c_command_name,
+                lambda method, command, payload=None: payload,
+            )
+        self.logger.debug("Rastreamento de comandos WebDriver ativado")
+        return self
+
+    def stop(self) -> None:
+        """Remove os wrappers (os eventos coletados são mantidos)"""
+        for target, previous in reversed(self._patched):
+            if previous is None:
+                target.__dict__.pop('execute', None)
+            else:
+                target.execute = previous
+        self._patched = []
+        self.logger.debug(f"Rastreamento encerrado: {len(self.events)} comandos")
+
+    def clear(self) -> None:
+        with self._lock:
+            self.events = []
+
+    def __enter__(self) -> 'CommandTracer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        Round trips e tempo por método de page object (mais lentos primeiro)
+
+        Returns:
+            [{'caller', 'round_trips', 'total_ms', 'mean_ms', 'commands': {comando: quantidade}}]
+        """
+        grouped: Dict[str, Dict[str, Any]] = {}
+        for event in list(self.events):
+            row = grouped.setdefault(event.caller, {'caller': event.caller, 'round_trips': 0,
+                                                    'total_ms': 0.0, 'commands': {}})
+            row['round_trips'] += 1
+            row['total_ms'] += event.duration * 1000
+            row['commands'][event.command] = row['commands'].get(event.command, 0) + 1
+
+        rows = sorted(grouped.values(), key=lambda row: row['total_ms'], reverse=True)
+        for row in rows:
+            row['mean_ms'] = round(row['total_ms'] / row['round_trips'], 2)
+            row['total_ms'] = round(row['total_ms'], 2)
+        return rows
+
+    def summary_table(self) -> str:
+        """Resumo em texto (uma linha por método)"""
+        rows = self.summary()
+        width = max([len('Método')] + [len(row['caller']) for row in rows])
+        lines = [f"{'Método':<{width}}  {'Round trips':>11}  {'Total (ms)':>10}  {'Média (ms)':>10}"]
+        lines.append('-' * len(lines[0]))
+        for row in rows:
+            lines.append(
+                f"{row['caller']:<{width}}  {row['round_trips']:>11}  "
+                f"{row['total_ms']:>10.2f}  {row['mean_ms']:>10.2f}"
+            )
+        return '\n'.join(lines)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Eventos no formato Trace Event do Chrome (chrome://tracing, Perfetto)"""
+        pid = os.getpid()
+        trace_events = []
+        for event in list(self.events):
+            args = {'caller': event.caller, 'transport': event.transport}
+            if event.locator:
+                args['locator'] = event.locator
+            if event.error:
+                args['error'] = event.error
+            trace_events.append({
+                'name': event.command,
+                'cat': event.caller,
+                'ph': 'X',
+                'ts': round(event.start * 1_000_000, 1),
+                'dur': round(event.duration * 1_000_000, 1),
+                'pid': pid,
+                'tid': event.thread_id,
+                'args': args,
+            })
+        return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+    def export_chrome_trace(self, file_path: str) -> None:
+        """Grava o trace em JSON"""
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f)
+        self.logger.info(f"Trace de comandos WebDriver salvo: {file_path} ({len(self.events)} comandos)")
@@ -0,0 +1,244 @@
+"""
+Helpers do protocolo W3C WebDriver
+Compartilhados pelos clientes HTTP próprios do framework (síncrono e assíncrono),
+que falam diretamente com o chromedriver/geckodriver sem a pilha do Selenium
+"""
+
+import http.client
+import json
+import socket
+import threading
+from typing import Any, Callable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from automation_framework.core.exceptions import (
+    ElementNotFound,
+    TimeoutException,
+    WebDriverProtocolException,
+)
+
+
+# Chave que identifica referências a elementos no protocolo W3C
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+# Erros W3C mapeados para exceções do framework
+_ERRORS = {
+    'no such element': ElementNotFound,
+    'timeout': TimeoutException,
+    'script timeout': TimeoutException,
+}
+
+
+def to_w3c_locator(by: str, value: str) -> Tuple[str, str]:
+    """
+    Converte estratégias do Selenium para as suportadas pelo W3C
+
+    O protocolo só aceita css selector, link text, partial link text, tag name e xpath;
+    id, name e class name viram seletores CSS (mesma conversão feita pelo Selenium).
+    """
+    if by == 'id':
+        return 'css selector', f'[id="{value}"]'
+    if by == 'name':
+        return 'css selector', f'[name="{value}"]'
+    if by == 'class name':
+        return 'css selector', f'.{value}'
+    if by == 'tag name':
+        return 'css selector', value
+    return by, value
+
+
+def remote_endpoint(selenium_driver: Any) -> Tuple[str, str]:
+    """
+    Obtém URL do driver e id da sessão de um WebDriver do Selenium já iniciado
+
+    Returns:
+        Tupla (url base do driver, session id)
+    """
+    executor = selenium_driver.command_executor
+    client_config = getattr(executor, 'client_config', None)
+    url = client_config.remote_server_addr if client_config else executor._url
+    return url.rstrip('/'), selenium_driver.session_id
+
+
+def split_url(url: str) -> Tuple[str, int, str]:
+    """Separa host, porta e prefixo de caminho da URL do driver"""
+    parsed = urlparse(url)
+    if parsed.scheme not in ('http', ''):
+        raise ValueError(f"Esquema não suportado pelo cliente W3C: {parsed.scheme}")
+    return parsed.hostname or 'localhost', parsed.port or 80, parsed.path.rstrip('/')
+
+
+def encode_value(value: Any, element_id: Callable[[Any], Optional[str]]) -> Any:
+    """
+    Converte argumentos de script para JSON, trocando elementos por referências W3C
+
+    Args:
+        element_id: Função que retorna o id W3C de um objeto elemento (ou None se não for elemento)
+    """
+    if isinstance(value, (list, tuple)):
+        return [encode_value(item, element_id) for item in value]
+    if isinstance(value, dict):
+        return {key: encode_value(item, element_id) for key, item in value.items()}
+    ref = element_id(value)
+    if ref is not None:
+        return {ELEMENT_KEY: ref}
+    return value
+
+
+def decode_value(value: Any, make_element: Callable[[str], Any]) -> Any:
+    """Converte respostas JSON, trocando referências W3C por objetos elemento"""
+    if isinstance(value, list):
+        return [decode_value(item, make_element) for item in value]
+    if isinstance(value, dict):
+        if ELEMENT_KEY in value and len(value) == 1:
+            return make_element(value[ELEMENT_KEY])
+        return {key: decode_value(item, make_element) for key, item in value.items()}
+    return value
+
+
+def parse_response(status: int, body: bytes) -> Any:
+    """
+    Interpreta resposta do driver, lançando exceção em caso de erro W3C
+
+    Returns:
+        Conteúdo do campo 'value'
+    """
+    payload = json.loads(body.decode('utf-8')) if body else {}
+    value = payload.get('value') if isinstance(payload, dict) else None
+
+    if status >= 400:
+        error = value.get('error', f"http {status}") if isinstance(value, dict) else f"http {status}"
+        message = value.get('message', '') if isinstance(value, dict) else ''
+        exception_class = _ERRORS.get(error)
+        if exception_class:
+            raise exception_class(f"{error}: {message}")
+        raise WebDriverProtocolException(error, message)
+
+    return value
+
+
+class W3CClient:
+    """
+    Cliente W3C WebDriver síncrono com conexões HTTP/1.1 persistentes
+
+    Cada thread mantém sua própria conexão keep-alive com o driver (o http.client
+    não é thread-safe); cabeçalhos são montados uma única vez. Se uma conexão ociosa
+    tiver sido fechada pelo driver, o comando é repetido uma vez em uma nova conexão.
+    """
+
+    def __init__(self, url: str, session_id: str,
+                 make_element: Optional[Callable[[str], Any]] = None,
+                 element_id: Optional[Callable[[Any], Optional[str]]] = None,
+                 timeout: float = 300):
+        """
+        Args:
+            url: URL base do driver (ex: http://127.0.0.1:9515)
+            session_id: Id da sessão W3C
+            make_element: Converte id W3C em objeto elemento (padrão: mantém o id)
+            element_id: Retorna o id W3C de um objeto elemento (ou None)
+            timeout: Timeout de socket em segundos
+        """
+        self.host, self.port, prefix = split_url(url)
+        self.session_id = session_id
+        self.timeout = timeout
+        self.connections = 0
+        self.commands = 0
+        self._base_path = f"{prefix}/session/{session_id}"
+        self._make_element = make_element or (lambda ref: ref)
+        self._element_id = element_id or (lambda value: None)
+        self._headers = {
+            'Connection': 'keep-alive',
+            'Accept': 'application/json',
+            'Content-Type': 'application/json;charset=UTF-8',
+        }
+        self._local = threading.local()
+        self._all: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            self._local.connection = connection
+            with self._lock:
+                self._all.append(connection)
+        return connection
+
+    def close(self) -> None:
+        """Fecha as conexões de todas as threads"""
+        with self._lock:
+            connections, self._all = self._all, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+    def execute(self, method: str, command: str, payload: Any = None) -> Any:
+        """
+        Envia comando W3C da sessão
+
+        Args:
+            method: Método HTTP
+            command: Caminho relativo à sessão (ex: '/url')
+            payload: Corpo JSON
+
+        Returns:
+            Conteúdo do campo 'value' com referências a elementos convertidas
+        """
+        path = f"{self._base_path}{command}"
+        body = json.dumps(payload, separators=(',', ':')).encode('utf-8') if payload is not None else None
+        connection = self._connection()
+        with self._lock:
+            self.commands += 1
+
+        for attempt in range(2):
+            reused = connection.sock is not None
+            if not reused:
+                with self._lock:
+                    self.connections += 1
+            try:
+                connection.request(method, path, body, self._headers)
+                response = connection.getresponse()
+                data = response.read()
+            except socket.timeout:
+                # A resposta pendente inutiliza a conexão: a próxima chamada abre outra
+                connection.close()
+                raise TimeoutException(f"Driver não respondeu em {self.timeout}s: {method} {path}")
+            except (ConnectionError, http.client.HTTPException):
+                connection.close()
+                # Só repete se a falha veio de uma conexão ociosa fechada pelo driver
+                if reused and attempt == 0:
+                    continue
+                raise
+            if response.will_close:
+                connection.close()
+            return decode_value(parse_response(response.status, data), self._make_element)
+
+    def _encode(self, value: Any) -> Any:
+        return encode_value(value, self._element_id)
+
+    def find_elements(self, by: str, value: str, root: Optional[str] = None) -> List[Any]:
+        """Localiza elementos (root: id do elemento raiz)"""
+        using, selector = to_w3c_locator(by, value)
+        command = f"/element/{root}/elements" if root else "/elements"
+        return self.execute('POST', command, {'using': using, 'value': selector})
+
+    def element_click(self, element_id: str) -> None:
+        self.execute('POST', f"/element/{element_id}/click", {})
+
+    def element_clear(self, element_id: str) -> None:
+        self.execute('POST', f"/element/{element_id}/clear", {})
+
+    def element_send_keys(self, element_id: str, text: str) -> None:
+        self.execute('POST', f"/element/{element_id}/value", {'text': text, 'value': list(text)})
+
+    def element_text(self, element_id: str) -> str:
+        return self.execute('GET', f"/element/{element_id}/text")
+
+    def execute_script(self, script: str, *args) -> Any:
+        return self.execute('POST', '/execute/sync', {'script': script, 'args': self._encode(list(args))})
+
+    def execute_async_script(self, script: str, *args) -> Any:
+        return self.execute('POST', '/execute/async', {'script': script, 'args': self._encode(list(args))})
+
+    def set_script_timeout(self, timeout: float) -> None:
+        self.execute('POST', '/timeouts', {'script': int(timeout * 1000)})